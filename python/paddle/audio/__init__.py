@@ -13,7 +13,7 @@
 # limitations under the License.
 
 from . import backends, datasets, features, functional
-from .backends.backend import info, load, save
+from .backends.backend import info, load, save, stream
 
 __all__ = [
     "functional",
@@ -23,4 +23,5 @@ __all__ = [
     "load",
     "info",
     "save",
+    "stream",
 ]
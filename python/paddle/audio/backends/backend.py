@@ -17,6 +17,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, BinaryIO
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
     from paddle import Tensor
@@ -121,6 +122,56 @@ def load(
     raise NotImplementedError("please set audio backend")
 
 
+def stream(
+    filepath: str | Path | BinaryIO,
+    frames_per_chunk: int,
+    frame_offset: int = 0,
+    num_frames: int = -1,
+    normalize: bool = True,
+    channels_first: bool = True,
+) -> Iterator[tuple[int, Tensor]]:
+    """Read audio data from file chunk by chunk. PCM data of the audio file is
+    memory-mapped, and only one chunk is converted to tensor at a time, so long
+    recordings can be processed without loading the whole file.
+
+    Args:
+        filepath: audio path or file object.
+        frames_per_chunk: the number of frames of each chunk, the last chunk may
+            be shorter.
+        frame_offset: the frame to start reading from.
+        num_frames: the number of frames to read, -1 means reading to the end.
+        normalize:
+            if True: return audio which norm to (-1, 1), dtype=float32
+            if False: return audio with raw data, dtype=int16
+        channels_first:
+            if True: return chunks with shape (channels, time)
+
+    Return:
+        Iterator[Tuple[int, paddle.Tensor]]: (offset, chunk), offset is the index of
+        the first frame of the chunk in the audio file.
+
+    Examples:
+        .. code-block:: python
+
+            >>> import os
+            >>> import paddle
+
+            >>> sample_rate = 16000
+            >>> wav_data = paddle.linspace(-1.0, 1.0, sample_rate) * 0.1
+            >>> filepath = os.path.join(os.getcwd(), "test.wav")
+            >>> paddle.audio.save(filepath, wav_data.unsqueeze(0), sample_rate)
+
+            >>> for offset, chunk in paddle.audio.stream(filepath, 4000):
+            ...     print(offset, chunk.shape)
+            0 [1, 4000]
+            4000 [1, 4000]
+            8000 [1, 4000]
+            12000 [1, 4000]
+    """
+    # for API doc
+    raise NotImplementedError("please set audio backend")
+
+
 def save(
     filepath: str,
     src: Tensor,
@@ -187,9 +187,14 @@ def set_backend(backend_name: str) -> None:
     for func in ["save", "load", "info"]:
         setattr(backend, func, getattr(module, func))
         setattr(paddle.audio, func, getattr(module, func))
+    # NOTE: backends without streaming still stream PCM16 WAV files by
+    # wave_backend
+    stream = getattr(module, "stream", wave_backend.stream)
+    backend.stream = stream
+    paddle.audio.stream = stream
 
 
 def _init_set_audio_backend() -> None:
     # init the default wave_backend.
-    for func in ["save", "load", "info"]:
+    for func in ["save", "load", "info", "stream"]:
         setattr(backend, func, getattr(wave_backend, func))
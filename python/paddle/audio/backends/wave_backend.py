@@ -14,6 +14,8 @@
 
 from __future__ import annotations
 
+import functools
+import os
 import wave
 from typing import TYPE_CHECKING, BinaryIO
 
@@ -24,6 +26,7 @@ import paddle
 from .backend import AudioInfo
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
     from paddle import Tensor
@@ -40,6 +43,101 @@ def _error_message():
     return warn_msg
 
 
+def _open_wave(file_obj):
+    try:
+        return wave.open(file_obj)
+    except wave.Error:
+        file_obj.seek(0)
+        file_obj.close()
+        err_msg = _error_message()
+        raise NotImplementedError(err_msg)
+
+
+def _read_header(file_obj):
+    # return (channels, sample_rate, sample_width, frames, data_offset),
+    # wave.open stops at the start of the data chunk
+    file_ = _open_wave(file_obj)
+    data_offset = file_obj.tell()
+    return (
+        file_.getnchannels(),
+        file_.getframerate(),
+        file_.getsampwidth(),
+        file_.getnframes(),
+        data_offset,
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _read_header_cached(filepath, mtime_ns, size):
+    with open(filepath, 'rb') as file_obj:
+        channels, sample_rate, sample_width, frames, data_offset = _read_header(
+            file_obj
+        )
+    # NOTE: the data chunk size of files being written may be larger
+    # than the written data
+    frames = min(frames, (size - data_offset) // (channels * sample_width))
+    return channels, sample_rate, sample_width, frames, data_offset
+
+
+def _get_header(filepath):
+    # headers of files are cached and reused until files are modified
+    filepath = os.fspath(filepath)
+    stat = os.stat(filepath)
+    return _read_header_cached(filepath, stat.st_mtime_ns, stat.st_size)
+
+
+def _pcm_reader(filepath):
+    """
+    Return (sample_rate, frames, read), read(start, count) gets PCM16 data
+    with shape (count, channels). Data of files on disk is memory-mapped,
+    so only the read frames are loaded.
+    """
+    if hasattr(filepath, 'read'):
+        file_ = _open_wave(filepath)
+        channels = file_.getnchannels()
+        frames = file_.getnframes()
+
+        def read(start, count):
+            file_.setpos(start)
+            data = np.frombuffer(file_.readframes(count), dtype='<i2')
+            return data.reshape(-1, channels)
+
+        return file_.getframerate(), frames, read
+
+    channels, sample_rate, sample_width, frames, data_offset = _get_header(
+        filepath
+    )
+    if sample_width != 2:
+        raise NotImplementedError(_error_message())
+    if frames == 0:
+        data = np.empty((0, channels), dtype='<i2')
+    else:
+        data = np.memmap(
+            filepath,
+            dtype='<i2',
+            mode='r',
+            offset=data_offset,
+            shape=(frames, channels),
+        )
+
+    def read(start, count):
+        return data[start : start + count]
+
+    return sample_rate, frames, read
+
+
+def _to_waveform(pcm, normalize, channels_first):
+    # default_subtype = "PCM_16", only support PCM16 WAV
+    waveform = pcm.astype(np.float32)
+    if normalize:
+        # dtype = "float32"
+        waveform /= 2**15
+    waveform = paddle.to_tensor(waveform)
+    if channels_first:
+        waveform = paddle.transpose(waveform, perm=[1, 0])
+    return waveform
+
+
 def info(filepath: str | BinaryIO) -> AudioInfo:
     """Get signal information of input audio file.
 
@@ -70,23 +168,17 @@ def info(filepath: str | BinaryIO) -> AudioInfo:
 
     if hasattr(filepath, 'read'):
         file_obj = filepath
-    else:
-        file_obj = open(filepath, 'rb')
-
-    try:
-        file_ = wave.open(file_obj)
-    except wave.Error:
-        file_obj.seek(0)
+        channels, sample_rate, sample_width, sample_frames, _ = _read_header(
+            file_obj
+        )
         file_obj.close()
-        err_msg = _error_message()
-        raise NotImplementedError(err_msg)
+    else:
+        channels, sample_rate, sample_width, sample_frames, _ = _get_header(
+            filepath
+        )
 
-    channels = file_.getnchannels()
-    sample_rate = file_.getframerate()
-    sample_frames = file_.getnframes()  # audio frame
-    bits_per_sample = file_.getsampwidth() * 8
+    bits_per_sample = sample_width * 8
     encoding = "PCM_S"  # default WAV encoding, only support
-    file_obj.close()
     return AudioInfo(
         sample_rate, sample_frames, channels, bits_per_sample, encoding
     )
@@ -132,43 +224,70 @@ def load(
             >>> paddle.audio.save(filepath, waveform, sample_rate)
             >>> wav_data_read, sr = paddle.audio.load(filepath)
     """
+    sample_rate, frames, read = _pcm_reader(filepath)
+    if num_frames == -1:
+        num_frames = frames
+    # only the requested frames are read
+    pcm = read(frame_offset, max(min(num_frames, frames - frame_offset), 0))
     if hasattr(filepath, 'read'):
-        file_obj = filepath
-    else:
-        file_obj = open(filepath, 'rb')
+        filepath.close()
+    return _to_waveform(pcm, normalize, channels_first), sample_rate
 
-    try:
-        file_ = wave.open(file_obj)
-    except wave.Error:
-        file_obj.seek(0)
-        file_obj.close()
-        err_msg = _error_message()
-        raise NotImplementedError(err_msg)
 
-    channels = file_.getnchannels()
-    sample_rate = file_.getframerate()
-    frames = file_.getnframes()  # audio frame
+def stream(
+    filepath: str | Path | BinaryIO,
+    frames_per_chunk: int,
+    frame_offset: int = 0,
+    num_frames: int = -1,
+    normalize: bool = True,
+    channels_first: bool = True,
+) -> Iterator[tuple[int, Tensor]]:
+    """Read audio data from file chunk by chunk. PCM data of the audio file is
+    memory-mapped, and only one chunk is converted to tensor at a time, so long
+    recordings can be processed without loading the whole file.
+
+    Args:
+        filepath: audio path or file object.
+        frames_per_chunk: the number of frames of each chunk, the last chunk may
+            be shorter.
+        frame_offset: the frame to start reading from.
+        num_frames: the number of frames to read, -1 means reading to the end.
+        normalize:
+            if True: return audio which norm to (-1, 1), dtype=float32
+            if False: return audio with raw data, dtype=int16
+        channels_first:
+            if True: return chunks with shape (channels, time)
+
+    Return:
+        Iterator[Tuple[int, paddle.Tensor]]: (offset, chunk), offset is the index of
+        the first frame of the chunk in the audio file.
 
-    audio_content = file_.readframes(frames)
-    file_obj.close()
+    Examples:
+        .. code-block:: python
 
-    # default_subtype = "PCM_16", only support PCM16 WAV
-    audio_as_np16 = np.frombuffer(audio_content, dtype=np.int16)
-    audio_as_np32 = audio_as_np16.astype(np.float32)
-    if normalize:
-        # dtype = "float32"
-        audio_norm = audio_as_np32 / (2**15)
-    else:
-        # dtype = "int16"
-        audio_norm = audio_as_np32
+            >>> import os
+            >>> import paddle
 
-    waveform = np.reshape(audio_norm, (frames, channels))
-    if num_frames != -1:
-        waveform = waveform[frame_offset : frame_offset + num_frames, :]
-    waveform = paddle.to_tensor(waveform)
-    if channels_first:
-        waveform = paddle.transpose(waveform, perm=[1, 0])
-    return waveform, sample_rate
+            >>> sample_rate = 16000
+            >>> wav_data = paddle.linspace(-1.0, 1.0, sample_rate) * 0.1
+            >>> filepath = os.path.join(os.getcwd(), "test.wav")
+            >>> paddle.audio.save(filepath, wav_data.unsqueeze(0), sample_rate)
+
+            >>> for offset, chunk in paddle.audio.stream(filepath, 4000):
+            ...     print(offset, chunk.shape)
+            0 [1, 4000]
+            4000 [1, 4000]
+            8000 [1, 4000]
+            12000 [1, 4000]
+    """
+    assert frames_per_chunk > 0, "frames_per_chunk should be a positive value"
+    _, frames, read = _pcm_reader(filepath)
+    end = frames if num_frames == -1 else min(frame_offset + num_frames, frames)
+    for offset in range(frame_offset, end, frames_per_chunk):
+        count = min(frames_per_chunk, end - offset)
+        yield offset, _to_waveform(
+            read(offset, count), normalize, channels_first
+        )
 
 
 def save(
@@ -13,6 +13,12 @@
 # limitations under the License.
 from __future__ import annotations
 
+import hashlib
+import os
+import tempfile
+
+import numpy as np
+
 import paddle
 
 from ..features import MFCC, LogMelSpectrogram, MelSpectrogram, Spectrogram
@@ -25,6 +31,10 @@ feat_funcs = {
     'spectrogram': Spectrogram,
 }
 
+# NOTE: bump it if extracted features of the same config change, so that
+# stale features in caches are not used
+FEAT_CACHE_VERSION = 1
+
 
 class AudioClassificationDataset(paddle.io.Dataset):
     """
@@ -37,6 +47,7 @@ class AudioClassificationDataset(paddle.io.Dataset):
         labels: list[int],
         feat_type: str = 'raw',
         sample_rate: int | None = None,
+        feat_cache_dir: str | None = None,
         **kwargs,
     ):
         """
@@ -45,6 +56,11 @@ class AudioClassificationDataset(paddle.io.Dataset):
             labels (:obj:`List[int]`): Labels of audio files.
             feat_type (:obj:`str`, `optional`, defaults to `raw`):
                 It identifies the feature type that user wants to extract an audio file.
+            feat_cache_dir (:obj:`str`, `optional`, defaults to `None`):
+                The directory to cache extracted features. Features are saved
+                as numpy files keyed by the audio file and the feature config,
+                and loaded instead of extracted again, e.g. in later epochs or
+                runs. If None, features are not cached.
         """
         super().__init__()
 
@@ -58,36 +74,130 @@ class AudioClassificationDataset(paddle.io.Dataset):
 
         self.feat_type = feat_type
         self.sample_rate = sample_rate
+        self.feat_cache_dir = feat_cache_dir
         self.feat_config = (
             kwargs  # Pass keyword arguments to customize feature config
         )
+        # feature extractors are built once for each sample rate
+        self._feature_extractors = {}
 
     def _get_data(self, input_file: str):
         raise NotImplementedError
 
-    def _convert_to_record(self, idx):
-        file, label = self.files[idx], self.labels[idx]
-        waveform, sample_rate = paddle.audio.load(file)
-        self.sample_rate = sample_rate
-
-        feat_func = feat_funcs[self.feat_type]
-
-        record = {}
-        if len(waveform.shape) == 2:
-            waveform = waveform.squeeze(0)  # 1D input
-        waveform = paddle.to_tensor(waveform, dtype=paddle.float32)
-        if feat_func is not None:
-            waveform = waveform.unsqueeze(0)  # (batch_size, T)
+    def _get_feature_extractor(self, sample_rate):
+        if sample_rate not in self._feature_extractors:
+            feat_func = feat_funcs[self.feat_type]
             if self.feat_type != 'spectrogram':
                 feature_extractor = feat_func(
-                    sr=self.sample_rate, **self.feat_config
+                    sr=sample_rate, **self.feat_config
                 )
             else:
                 feature_extractor = feat_func(**self.feat_config)
-            record['feat'] = feature_extractor(waveform).squeeze(0)
-        else:
-            record['feat'] = waveform
-        record['label'] = label
+            self._feature_extractors[sample_rate] = feature_extractor
+        return self._feature_extractors[sample_rate]
+
+    def _load_waveform(self, idx):
+        waveform, sample_rate = paddle.audio.load(self.files[idx])
+        self.sample_rate = sample_rate
+        if len(waveform.shape) == 2:
+            waveform = waveform.squeeze(0)  # 1D input
+        waveform = paddle.to_tensor(waveform, dtype=paddle.float32)
+        return waveform, sample_rate
+
+    def _feat_cache_path(self, idx):
+        file = os.path.abspath(self.files[idx])
+        stat = os.stat(file)
+        key = repr(
+            (
+                FEAT_CACHE_VERSION,
+                file,
+                stat.st_size,
+                stat.st_mtime_ns,
+                self.feat_type,
+                sorted(self.feat_config.items()),
+            )
+        )
+        digest = hashlib.sha1(key.encode()).hexdigest()
+        return os.path.join(
+            self.feat_cache_dir, f'v{FEAT_CACHE_VERSION}', digest + '.npy'
+        )
+
+    def _save_feat_cache(self, path, feat):
+        cache_dir = os.path.dirname(path)
+        os.makedirs(cache_dir, exist_ok=True)
+        # write to a temporary file and rename it, so that concurrent
+        # readers, e.g. DataLoader workers, never see partial files
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.save(f, feat)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def extract_features(
+        self, indices: list[int], batch_size: int = 16
+    ) -> list[paddle.Tensor]:
+        """
+        Get features of audio files of the given indices. Waveforms of the
+        same length and sample rate are stacked to extract features in
+        batches. If :attr:`feat_cache_dir` is set, cached features are
+        loaded, and newly extracted features are saved to the cache.
+
+        Args:
+            indices (list[int]): Indices of audio files.
+            batch_size (int, optional): The max number of waveforms
+                extracted in a batch. Defaults to 16.
+
+        Returns:
+            list[Tensor]: Features of the audio files, in the same order of
+            :attr:`indices`. Waveforms are returned if :attr:`feat_type` is
+            `raw`.
+        """
+        assert batch_size > 0, "batch_size should be a positive value"
+        feats = [None] * len(indices)
+        use_cache = self.feat_cache_dir is not None and self.feat_type != 'raw'
+        # waveforms to extract, grouped by (length, sample rate)
+        pending = {}
+        for i, idx in enumerate(indices):
+            if use_cache:
+                path = self._feat_cache_path(idx)
+                if os.path.exists(path):
+                    feats[i] = paddle.to_tensor(np.load(path))
+                    continue
+            waveform, sample_rate = self._load_waveform(idx)
+            if self.feat_type == 'raw':
+                feats[i] = waveform
+                continue
+            group = pending.setdefault((waveform.shape[0], sample_rate), [])
+            group.append((i, idx, waveform))
+
+        if self.feat_config.get('top_db') is not None:
+            # NOTE: top_db thresholds by the peak of the whole batch, so
+            # waveforms are extracted one by one
+            batch_size = 1
+        with paddle.no_grad():
+            for (_, sample_rate), group in pending.items():
+                feature_extractor = self._get_feature_extractor(sample_rate)
+                for start in range(0, len(group), batch_size):
+                    batch = group[start : start + batch_size]
+                    waveforms = paddle.stack([w for _, _, w in batch])
+                    outputs = feature_extractor(waveforms)
+                    for j, (i, idx, _) in enumerate(batch):
+                        feat = outputs[j]
+                        feats[i] = feat
+                        if use_cache:
+                            self._save_feat_cache(
+                                self._feat_cache_path(idx), feat.numpy()
+                            )
+        return feats
+
+    def _convert_to_record(self, idx):
+        record = {}
+        record['feat'] = self.extract_features([idx])[0]
+        record['label'] = self.labels[idx]
         return record
 
     def __getitem__(self, idx):
@@ -116,6 +116,14 @@ class Spectrogram(nn.Layer):
         )
         self.register_buffer('fft_window', self.fft_window)
 
+        self.n_fft = n_fft
+        self.hop_length = hop_length if hop_length is not None else n_fft // 4
+        self.center = center
+        self.pad_mode = pad_mode
+        # frames are padded by forward_stream explicitly
+        self._stream_stft = partial(self._stft, center=False)
+        self.reset_stream()
+
     def forward(self, x: Tensor) -> Tensor:
         """
         Args:
@@ -128,6 +136,110 @@ class Spectrogram(nn.Layer):
         spectrogram = paddle.pow(paddle.abs(stft), self.power)
         return spectrogram
 
+    def reset_stream(self) -> None:
+        """
+        Clear the states of :code:`forward_stream`, to start a new stream.
+        """
+        # NOTE: states are kept in a dict, tensor attributes of layers are
+        # registered as buffers. 'buffer' holds samples not consumed by the
+        # output frames yet, 'tail' holds the last samples of the stream for
+        # reflect padding at the end, 'skip' is the number of coming samples
+        # not covered by any frame
+        self._stream_states = {'buffer': None, 'tail': None, 'skip': 0}
+
+    def _pad_stream(self, x, at_end):
+        pad = self.n_fft // 2
+        if self.pad_mode == 'constant':
+            return paddle.zeros([x.shape[0], pad], dtype=x.dtype)
+        assert (
+            x.shape[-1] > pad
+        ), f'Streaming with reflect padding needs more than {pad} samples, but got {x.shape[-1]}.'
+        if at_end:
+            return paddle.flip(x[:, -pad - 1 : -1], axis=[1])
+        return paddle.flip(x[:, 1 : pad + 1], axis=[1])
+
+    def forward_stream(self, x: Tensor, last: bool = False) -> Tensor:
+        """
+        Compute spectrogram of a stream of signals chunk by chunk. Samples
+        overlapped by the next frame are kept and joined with the next
+        chunk, so that concatenating outputs of all chunks along the last
+        axis gives the same result as :code:`forward` on the whole signals.
+
+        Args:
+            x (Tensor): Tensor of a chunk of waveforms with shape `(N, T)`.
+            last (bool, optional): Whether `x` is the last chunk, the
+                remaining frames are returned and the states are cleared.
+                Defaults to False.
+
+        Returns:
+            Tensor: Spectrograms of the frames completed by `x`, with shape
+            `(N, n_fft//2 + 1, num_frames)`, `num_frames` may be 0.
+
+        Examples:
+            .. code-block:: python
+
+                >>> import paddle
+                >>> from paddle.audio.features import Spectrogram
+
+                >>> x = paddle.rand((1, 8000))
+                >>> feature_extractor = Spectrogram(n_fft=512, hop_length=160)
+                >>> feats = [
+                ...     feature_extractor.forward_stream(chunk, last=i == 3)
+                ...     for i, chunk in enumerate(paddle.split(x, 4, axis=-1))
+                ... ]
+                >>> feats = paddle.concat(feats, axis=-1)
+                >>> print(feats.shape)
+                [1, 257, 51]
+        """
+        states = self._stream_states
+        parts = [] if states['buffer'] is None else [states['buffer']]
+        if self.center:
+            tail = (
+                x
+                if states['tail'] is None
+                else paddle.concat([states['tail'], x], axis=-1)
+            )
+            if states['tail'] is None:
+                parts.append(self._pad_stream(x, at_end=False))
+            parts.append(x)
+            if last:
+                parts.append(self._pad_stream(tail, at_end=True))
+            states['tail'] = tail[:, -(self.n_fft // 2 + 1) :]
+        else:
+            parts.append(x)
+        buffer = parts[0] if len(parts) == 1 else paddle.concat(parts, axis=-1)
+
+        # samples between frames are skipped if hop_length > n_fft
+        skip = min(states['skip'], buffer.shape[-1])
+        if skip > 0:
+            buffer = buffer[:, skip:]
+            states['skip'] -= skip
+
+        length = buffer.shape[-1]
+        num_frames = (
+            (length - self.n_fft) // self.hop_length + 1
+            if length >= self.n_fft
+            else 0
+        )
+        if num_frames > 0:
+            end = (num_frames - 1) * self.hop_length + self.n_fft
+            stft = self._stream_stft(buffer[:, :end])
+            spectrogram = paddle.pow(paddle.abs(stft), self.power)
+        else:
+            spectrogram = paddle.zeros(
+                [x.shape[0], self.n_fft // 2 + 1, 0], dtype=x.dtype
+            )
+
+        consumed = num_frames * self.hop_length
+        if last:
+            self.reset_stream()
+        elif consumed >= length:
+            states['buffer'] = None
+            states['skip'] += consumed - length
+        else:
+            states['buffer'] = buffer[:, consumed:]
+        return spectrogram
+
 
 class MelSpectrogram(nn.Layer):
     """Compute the melspectrogram of given signals, typically audio waveforms. It is computed by multiplying spectrogram with Mel filter bank matrix.
@@ -235,6 +347,48 @@ class MelSpectrogram(nn.Layer):
         mel_feature = paddle.matmul(self.fbank_matrix, spect_feature)
         return mel_feature
 
+    def reset_stream(self) -> None:
+        """
+        Clear the states of :code:`forward_stream`, to start a new stream.
+        """
+        self._spectrogram.reset_stream()
+
+    def forward_stream(self, x: Tensor, last: bool = False) -> Tensor:
+        """
+        Compute mel spectrogram of a stream of signals chunk by chunk, see
+        :code:`Spectrogram.forward_stream`.
+
+        Args:
+            x (Tensor): Tensor of a chunk of waveforms with shape `(N, T)`.
+            last (bool, optional): Whether `x` is the last chunk. Defaults
+                to False.
+
+        Returns:
+            Tensor: Mel spectrograms of the frames completed by `x`, with
+            shape `(N, n_mels, num_frames)`.
+
+        Examples:
+            .. code-block:: python
+
+                >>> import os
+                >>> import paddle
+                >>> from paddle.audio.features import MelSpectrogram
+
+                >>> sample_rate = 16000
+                >>> wav_data = paddle.linspace(-1.0, 1.0, sample_rate) * 0.1
+                >>> filepath = os.path.join(os.getcwd(), "test.wav")
+                >>> paddle.audio.save(filepath, wav_data.unsqueeze(0), sample_rate)
+
+                >>> num_samples = paddle.audio.info(filepath).num_samples
+                >>> feature_extractor = MelSpectrogram(sr=sample_rate, n_fft=512)
+                >>> for offset, chunk in paddle.audio.stream(filepath, 4000):
+                ...     last = offset + chunk.shape[-1] == num_samples
+                ...     feat = feature_extractor.forward_stream(chunk, last=last)
+        """
+        spect_feature = self._spectrogram.forward_stream(x, last=last)
+        mel_feature = paddle.matmul(self.fbank_matrix, spect_feature)
+        return mel_feature
+
 
 class LogMelSpectrogram(nn.Layer):
     """Compute log-mel-spectrogram feature of given signals, typically audio waveforms.
@@ -16,9 +16,12 @@ from __future__ import annotations
 
 import copy
 import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 import paddle
 from paddle.base.framework import (
     _current_expected_place,
@@ -382,6 +385,84 @@ def not_overlap(
     return False
 
 
+def compute_overlaps(
+    cur_chunk_metadata: LocalTensorMetadata,
+    storage_local_tensor_metadata_list: list[LocalTensorMetadata],
+):
+    """
+    Compute the overlaps of the current chunk with all storage chunks of
+    the same tensor at once, which is equal to calling `not_overlap` and
+    `compute_overlap` on each storage chunk.
+
+    Returns:
+        list: (index of storage chunk, cur_offsets, storage_offsets, lengths)
+        of each overlapped storage chunk.
+    """
+    num_chunks = len(storage_local_tensor_metadata_list)
+    ndim = len(cur_chunk_metadata.local_shape)
+    if num_chunks == 0:
+        return []
+    cur_offset = np.asarray(cur_chunk_metadata.global_offset, dtype=np.int64)
+    cur_end = cur_offset + np.asarray(
+        cur_chunk_metadata.local_shape, dtype=np.int64
+    )
+    storage_offset = np.array(
+        [m.global_offset for m in storage_local_tensor_metadata_list],
+        dtype=np.int64,
+    ).reshape([num_chunks, ndim])
+    storage_end = storage_offset + np.array(
+        [m.local_shape for m in storage_local_tensor_metadata_list],
+        dtype=np.int64,
+    ).reshape([num_chunks, ndim])
+
+    begin = np.maximum(cur_offset, storage_offset)
+    end = np.minimum(cur_end, storage_end)
+    # scalars with no dimension always overlap
+    overlapped = np.all(
+        (cur_offset < storage_end) & (cur_end > storage_offset), axis=1
+    )
+
+    overlaps = []
+    for idx in np.nonzero(overlapped)[0]:
+        overlaps.append(
+            (
+                int(idx),
+                (begin[idx] - cur_offset).tolist(),
+                (begin[idx] - storage_offset[idx]).tolist(),
+                (end[idx] - begin[idx]).tolist(),
+            )
+        )
+    return overlaps
+
+
+def load_files(path, files, num_io_threads):
+    """
+    Read the checkpoint files as numpy arrays in num_io_threads threads, and
+    yield (file, state_dict) in the order of completion. A new file is read
+    only when a previous read is completed, so at most num_io_threads files
+    are being read and at most num_io_threads read files are not yet
+    yielded, which bounds the host memory.
+    """
+
+    def load_file(file):
+        return file, paddle.load(os.path.join(path, file), return_numpy=True)
+
+    files = iter(files)
+    with ThreadPoolExecutor(max_workers=num_io_threads) as executor:
+        pending = set()
+        for file in files:
+            pending.add(executor.submit(load_file, file))
+            if len(pending) >= num_io_threads:
+                break
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                file = next(files, None)
+                if file is not None:
+                    pending.add(executor.submit(load_file, file))
+                yield future.result()
+
+
 def get_read_items(metadata_list, state_dict, process_group, use_dist):
     storage_state_dict_metadata = {}
     for metadata in metadata_list:
@@ -424,15 +505,19 @@ def get_read_items(metadata_list, state_dict, process_group, use_dist):
             assert (
                 tensor_key in storage_state_dict_metadata
             ), f"tensor_key:{tensor_key} not found in storage_state_dict_metadata:{storage_state_dict_metadata}."
-            for storage_local_tensor_metadata in storage_state_dict_metadata[
+            storage_local_tensor_metadata_list = storage_state_dict_metadata[
                 tensor_key
-            ]:
-                if not_overlap(
-                    cur_chunk_metadata, storage_local_tensor_metadata
-                ):
-                    continue
-                cur_offsets, storage_offsets, lengths = compute_overlap(
-                    cur_chunk_metadata, storage_local_tensor_metadata
+            ]
+            for (
+                idx,
+                cur_offsets,
+                storage_offsets,
+                lengths,
+            ) in compute_overlaps(
+                cur_chunk_metadata, storage_local_tensor_metadata_list
+            ):
+                storage_local_tensor_metadata = (
+                    storage_local_tensor_metadata_list[idx]
                 )
                 storage_local_tensor_index = LocalTensorIndex(
                     tensor_key,
@@ -470,6 +555,7 @@ def load_state_dict(
     process_group: Group | None = None,
     coordinator_rank: int = 0,
     offload=False,
+    num_io_threads: int = 1,
 ) -> None:
     """
     Load the state_dict inplace from a checkpoint path.
@@ -480,6 +566,7 @@ def load_state_dict(
         process_group(paddle.distributed.collective.Group): ProcessGroup to be used for cross-rank synchronization. Use the default process group which contains all cards.
         coordinator_rank(int): The rank used to coordinate the checkpoint. Rank0 is used by default.
         offload(bool): Whether to offload the checkpoint data from GPU to CPU.
+        num_io_threads(int): The number of threads to read the checkpoint files of current rank concurrently. Default is 1.
     Example:
         .. code-block:: python
 
@@ -565,18 +652,34 @@ def load_state_dict(
             rank_to_files, rank_to_local_data_files
         )
 
+        assert num_io_threads >= 1, "num_io_threads should be at least 1."
         source_state_dict = {}
-        for file in local_load_files:
-            if offload:
-                state_dict_numpy = paddle.load(
-                    os.path.join(path, file), return_numpy=True
-                )
+        if num_io_threads == 1:
+            for file in local_load_files:
+                if offload:
+                    state_dict_numpy = paddle.load(
+                        os.path.join(path, file), return_numpy=True
+                    )
+                    source_state_dict[file] = {
+                        key: paddle.to_tensor(value, place=paddle.CPUPlace())
+                        for key, value in state_dict_numpy.items()
+                    }
+                else:
+                    source_state_dict[file] = paddle.load(
+                        os.path.join(path, file)
+                    )
+        else:
+            # NOTE: files are read as numpy in io threads, and converted to
+            # tensors in the main thread as soon as each one is read, since
+            # dygraph mode is thread local
+            place = paddle.CPUPlace() if offload else None
+            for file, state_dict_numpy in load_files(
+                path, local_load_files, num_io_threads
+            ):
                 source_state_dict[file] = {
-                    key: paddle.to_tensor(value, place=paddle.CPUPlace())
+                    key: paddle.to_tensor(value, place=place)
                     for key, value in state_dict_numpy.items()
                 }
-            else:
-                source_state_dict[file] = paddle.load(os.path.join(path, file))
 
         _load_state_dict(
             flat_state_dict,
@@ -16,6 +16,7 @@ from __future__ import annotations
 import multiprocessing
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 import paddle
@@ -76,6 +77,53 @@ def copy_dict_to_cpu(nested_dict):
     return new_dict
 
 
+def split_state_dict_by_size(state_dict, num_parts):
+    """
+    Split the keys of state_dict into num_parts groups of balanced total
+    tensor size, return the part index of each key.
+    """
+    sizes = {
+        key: val._numel() * val.element_size()
+        for key, val in state_dict.items()
+    }
+    part_sizes = [0] * num_parts
+    key_to_part = {}
+    # assign from the largest tensor to the least loaded part
+    for key in sorted(sizes, key=lambda k: (-sizes[k], k)):
+        part = part_sizes.index(min(part_sizes))
+        key_to_part[key] = part
+        part_sizes[part] += sizes[key]
+    return key_to_part
+
+
+def get_part_file_name(file_name, part, num_parts):
+    if num_parts == 1:
+        return file_name
+    prefix = file_name.split(".")[0]
+    return f"{prefix}_{part}.distcp"
+
+
+def save_state_dict_files(file_to_state_dict, num_io_threads):
+    """
+    Save the state_dict of each file. If num_io_threads is larger than 1,
+    files are written concurrently in the mmap format of paddle.save, in
+    which each tensor is copied to host right before it is written, so
+    device to host copies of a file overlap with disk writes of others.
+    """
+    if num_io_threads <= 1:
+        for file_path, state_dict in file_to_state_dict.items():
+            paddle.save(state_dict, file_path)
+        return
+
+    def save_file(item):
+        file_path, state_dict = item
+        paddle.save(state_dict, file_path, use_mmap_format=True)
+
+    with ThreadPoolExecutor(max_workers=num_io_threads) as executor:
+        # consume results to raise exceptions in threads
+        list(executor.map(save_file, file_to_state_dict.items()))
+
+
 def check_file_name(file_name, process_group):
     all_unique_id = []
     unique_id = int(file_name.split(".")[0].split("_")[1])
@@ -148,6 +196,7 @@ def save_state_dict(
     process_group: Group | None = None,
     coordinator_rank: int = 0,
     async_save: bool = False,
+    num_io_threads: int = 1,
 ) -> None:
     """
     Save the state_dict of model to path.
@@ -158,6 +207,10 @@ def save_state_dict(
         process_group(paddle.distributed.collective.Group): ProcessGroup to be used for cross-rank synchronization. Use the default process group which contains all cards.
         coordinator_rank(int): The rank used to save non distributed values. Rank0 is used by default.
         async_save(bool): Async save the state_dict, default is False.
+        num_io_threads(int): The number of threads to write the state_dict of current rank. If larger than 1, the local
+            state_dict is split into `num_io_threads` files of balanced size, named as `{rank}_{id}_{part}.distcp`,
+            which are written concurrently, and tensors on device are copied to host right before written, which
+            overlaps device to host copies with disk writes. Default is 1.
 
     Examples:
         .. code-block:: python
@@ -193,11 +246,17 @@ def save_state_dict(
             # Init the default global process group
             paddle.distributed.init_parallel_env()
 
+        assert num_io_threads >= 1, "num_io_threads should be at least 1."
         unique_id = 0
         file_name = ""
         while True:
             file_name = f"{paddle.distributed.get_rank()}_{unique_id}.distcp"
-            if not os.path.exists(os.path.join(path, file_name)):
+            # the files may be split into parts in last saving
+            if not os.path.exists(
+                os.path.join(path, file_name)
+            ) and not os.path.exists(
+                os.path.join(path, get_part_file_name(file_name, 0, 2))
+            ):
                 break
             unique_id += 1
         logger.debug(f"file_name:{file_name}")
@@ -207,6 +266,7 @@ def save_state_dict(
         local_state_dict = {}
         local_state_dict_metadata = {}
         local_storage_metadata = {}
+        local_tensor_keys = []
         for key, val in flat_state_dict.items():
             if isinstance(val, paddle.Tensor):
                 # Case1: not initialized means this tensor is placed in another mesh which do not contain this rank
@@ -244,9 +304,15 @@ def save_state_dict(
                 local_state_dict_metadata[key] = LocalTensorMetadata(
                     global_offset, local_shape, local_tenosr_dtype
                 )
-                local_storage_metadata[
-                    LocalTensorIndex(key, tuple(global_offset))
-                ] = file_name
+                local_tensor_keys.append(
+                    (key, LocalTensorIndex(key, tuple(global_offset)))
+                )
+
+        key_to_part = split_state_dict_by_size(local_state_dict, num_io_threads)
+        for key, tensor_index in local_tensor_keys:
+            local_storage_metadata[tensor_index] = get_part_file_name(
+                file_name, key_to_part[key], num_io_threads
+            )
 
         global_state_dict_metadata = []
         global_storage_metadata = []
@@ -280,9 +346,23 @@ def save_state_dict(
         dedup_tensor(
             local_state_dict, local_storage_metadata, metadata.storage_metadata
         )
+        file_to_state_dict = {
+            os.path.join(
+                path, get_part_file_name(file_name, part, num_io_threads)
+            ): {}
+            for part in range(num_io_threads)
+        }
+        for key, val in local_state_dict.items():
+            part_file = get_part_file_name(
+                file_name, key_to_part[key], num_io_threads
+            )
+            file_to_state_dict[os.path.join(path, part_file)][key] = val
 
         if async_save:
-            cpu_state_dict = copy_dict_to_cpu(local_state_dict)
+            cpu_file_to_state_dict = {
+                file_path: copy_dict_to_cpu(part_state_dict)
+                for file_path, part_state_dict in file_to_state_dict.items()
+            }
             clear_async_save_task_queue()
 
             attempt = 0
@@ -292,8 +372,8 @@ def save_state_dict(
                 nonlocal attempt
                 try:
                     p = ctx.Process(
-                        target=paddle.save,
-                        args=(cpu_state_dict, os.path.join(path, file_name)),
+                        target=save_state_dict_files,
+                        args=(cpu_file_to_state_dict, num_io_threads),
                     )
                     p.start()
                     return p
@@ -308,4 +388,4 @@ def save_state_dict(
             p = start_process()
             async_save_queue.append(p)
         else:
-            paddle.save(local_state_dict, os.path.join(path, file_name))
+            save_state_dict_files(file_to_state_dict, num_io_threads)
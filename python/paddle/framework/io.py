@@ -44,6 +44,7 @@ from paddle.base.framework import (
 )
 
 from .io_utils import (
+    _ChunkedWriter,
     _is_file_path,
     _is_memory_buffer,
     _legacy_static_save,
@@ -52,6 +53,7 @@ from .io_utils import (
     _pickle_loads_mac,
     _unpack_saved_dict,
 )
+from .mmap_io import _is_mmap_format, _load_mmap_format, _save_mmap_format
 
 if TYPE_CHECKING:
     from io import BytesIO
@@ -71,10 +73,12 @@ if TYPE_CHECKING:
         params_filename: NotRequired[str]
         keep_name_table: NotRequired[bool]
         return_numpy: NotRequired[bool]
+        mmap: NotRequired[bool]
 
     class _SaveOptions(TypedDict):
         use_binary_format: NotRequired[bool]
-        pickle_protocol: NotRequired[Literal[2, 3, 4]]
+        use_mmap_format: NotRequired[bool]
+        pickle_protocol: NotRequired[Literal[2, 3, 4, 5]]
 
 
 __all__ = []
@@ -94,7 +98,7 @@ def clear_async_save_task_queue() -> None:
 def async_save(
     obj: object,
     path: str | BytesIO,
-    protocol: Literal[2, 3, 4] = 4,
+    protocol: Literal[2, 3, 4, 5] = 4,
     sync_other_task: bool = False,
     **configs: Unpack[_EmptyDict],
 ) -> None:
@@ -108,7 +112,7 @@ def async_save(
         obj(Object) : The object to be saved.
         path(str|BytesIO) : The path/buffer of the object to be saved.
           If saved in the current directory, the input path string will be used as the file name.
-        protocol(int, optional): The protocol version of pickle module must be greater than 1 and less than 5.
+        protocol(int, optional): The protocol version of pickle module must be greater than 1 and less than 6.
                                  Default: 4
         sync_other_task(bool) : Determine whether to wait other async save task to be finished before this one be put in queue.
         **configs(dict, optional): compatible argument to paddle.save, but will be overridden by default setting.
@@ -172,9 +176,7 @@ def _build_saved_state_dict(state_dict):
                     raise ValueError(
                         "The saved tensor is not initialized. If you used group sharded, please use save_group_sharded_model."
                     )
-                if value.is_dense() and value.place.is_custom_place():
-                    value = paddle._C_ops.npu_identity(value, -1)
-                save_dict[key] = np.array(value.cpu())
+                save_dict[key] = _varbase_to_ndarray(value)
             name_table[key] = value.name
         else:
             save_dict[key] = value
@@ -365,6 +367,7 @@ def _parse_load_config(configs):
         'params_filename',
         'keep_name_table',
         'return_numpy',
+        'mmap',
     ]
 
     # input check
@@ -384,12 +387,17 @@ def _parse_load_config(configs):
     inner_config.params_filename = configs.get('params_filename', None)
     inner_config.keep_name_table = configs.get('keep_name_table', None)
     inner_config.return_numpy = configs.get('return_numpy', False)
+    inner_config.mmap = configs.get('mmap', False)
 
     return inner_config
 
 
 def _parse_save_config(configs):
-    supported_configs = ['use_binary_format', 'pickle_protocol']
+    supported_configs = [
+        'use_binary_format',
+        'pickle_protocol',
+        'use_mmap_format',
+    ]
 
     # input check
     for key in configs:
@@ -406,38 +414,59 @@ def _parse_save_config(configs):
     inner_config = _SaveLoadConfig()
     inner_config.use_binary_format = configs.get('use_binary_format', False)
     inner_config.pickle_protocol = configs.get('pickle_protocol', None)
+    inner_config.use_mmap_format = configs.get('use_mmap_format', False)
 
     return inner_config
 
 
-def _pickle_save(obj, f, protocol):
-    # TODO(weixin):add support for BytesIO.
+# NOTE: tensors to save are converted to numpy arrays viewing the CPU
+# tensor memory without copying, tensors on other places are copied to
+# host once. The arrays are only used while saving, and pickle protocol 5
+# writes contiguous arrays to the file from their buffers directly, so
+# saving does not hold a host copy of the whole object.
+def _varbase_to_ndarray(tensor):
+    if tensor.is_dense() and tensor.place.is_custom_place():
+        tensor = paddle._C_ops.npu_identity(tensor, -1)
+    tensor = tensor.cpu()
+    if not tensor.is_dense():
+        return np.array(tensor)
+    return tensor.value().get_tensor().__array__(copy=False)
+
+
+def _dense_tensor_to_ndarray(tensor):
+    p = core.Place()
+    p.set_place(paddle.CPUPlace())
+    if tensor._place().is_custom_place():
+        tensor = paddle._C_ops.npu_identity(tensor, -1)._copy(p)
+    elif not tensor._place().is_cpu_place():
+        tensor = tensor._copy(p)
+    return tensor.__array__(copy=False)
+
+
+def _check_pickle_protocol(protocol):
     if not isinstance(protocol, int):
         raise ValueError(
             f"The 'protocol' MUST be `int`, but received {type(protocol)}"
         )
 
-    if protocol < 2 or protocol > 4:
+    if protocol < 2 or protocol > 5:
         raise ValueError(
-            f"Expected 1<'protocol'<5, but received protocol={protocol}"
+            f"Expected 1<'protocol'<6, but received protocol={protocol}"
         )
 
+
+def _pickle_save(obj, f, protocol):
+    # TODO(weixin):add support for BytesIO.
+    _check_pickle_protocol(protocol)
+
     def reduce_varbase(self):
-        if self.is_dense() and self.place.is_custom_place():
-            data = np.array(paddle._C_ops.npu_identity(self, -1).cpu())
-        else:
-            data = np.array(self.cpu())
+        data = _varbase_to_ndarray(self)
         name = self.name
 
         return (tuple, ((name, data),))
 
     def reduce_DenseTensor(self):
-        p = core.Place()
-        p.set_place(paddle.CPUPlace())
-        if self._place().is_custom_place():
-            data = np.array(paddle._C_ops.npu_identity(self, -1)._copy(p))
-        else:
-            data = np.array(self._copy(p))
+        data = _dense_tensor_to_ndarray(self)
 
         return (eval, ('data', {'data': data}))
 
@@ -458,38 +487,64 @@ def _pickle_save(obj, f, protocol):
         create_layer_dispatch_table,
     )
 
-    def add_dispatch_table():
-        # This is not a good method, because the pickle module has been modified.
-        pickle.dispatch_table[core.eager.Tensor] = reduce_varbase
-        pickle.dispatch_table[EagerParamBase] = reduce_varbase
-        pickle.dispatch_table[core.DenseTensor] = reduce_DenseTensor
-        pickle.dispatch_table.update(dispatch_table_layer)
-
-    def pop_dispatch_table():
-        pickle.dispatch_table.pop(core.DenseTensor)
-        pickle.dispatch_table.pop(core.eager.Tensor)
-        pickle.dispatch_table.pop(EagerParamBase)
-        for k in dispatch_table_layer:
-            pickle.dispatch_table.pop(k)
-
-    # When value of dict is lager than 4GB ,there is a Bug on 'MAC python3'
+    # When value of dict is lager than 4GB ,there is a Bug on 'MAC python3',
+    # write in chunks instead of pickling the whole object in memory
     if sys.platform == 'darwin' and sys.version_info.major == 3:
-        add_dispatch_table()
-        pickle_bytes = pickle.dumps(obj)
-        pop_dispatch_table()
+        f = _ChunkedWriter(f)
+
+    pickler = pickle.Pickler(f, protocol)
+    pickler.dispatch_table = copyreg.dispatch_table.copy()
+
+    pickler.dispatch_table[core.DenseTensor] = reduce_DenseTensor
+    pickler.dispatch_table[core.eager.Tensor] = reduce_varbase
+    pickler.dispatch_table[EagerParamBase] = reduce_varbase
+    pickler.dispatch_table.update(dispatch_table_layer)
+    pickler.dump(obj)
+
+
+def _to_mmap_ndarray(obj):
+    # tensors and numpy arrays are saved as raw regions in the mmap format,
+    # return (name, ndarray) for them, or None for other objects
+    if isinstance(obj, (core.eager.Tensor, EagerParamBase)):
+        return obj.name, _varbase_to_ndarray(obj)
+    elif isinstance(obj, core.DenseTensor):
+        return None, _dense_tensor_to_ndarray(obj)
+    elif isinstance(obj, np.ndarray) and not obj.dtype.hasobject:
+        return None, obj
+    elif isinstance(obj, paddle.nn.Layer):
+        raise ValueError(
+            "paddle do not support saving `paddle.nn.Layer` object."
+        )
+    return None
 
-        max_bytes = 2**30
-        for i in range(0, len(pickle_bytes), max_bytes):
-            f.write(pickle_bytes[i : i + max_bytes])
-    else:
-        pickler = pickle.Pickler(f, protocol)
-        pickler.dispatch_table = copyreg.dispatch_table.copy()
 
-        pickler.dispatch_table[core.DenseTensor] = reduce_DenseTensor
-        pickler.dispatch_table[core.eager.Tensor] = reduce_varbase
-        pickler.dispatch_table[EagerParamBase] = reduce_varbase
-        pickler.dispatch_table.update(dispatch_table_layer)
-        pickler.dump(obj)
+def _mmap_save(obj, path, protocol):
+    if isinstance(obj, paddle.static.Program):
+        raise ValueError(
+            "`use_mmap_format` does not support saving Program, please "
+            "save it without `use_mmap_format`."
+        )
+    _check_pickle_protocol(protocol)
+    with _open_file_buffer(path, 'wb') as f:
+        _save_mmap_format(obj, f, protocol, _to_mmap_ndarray)
+
+
+def _mmap_load(path, config):
+    def materialize(lazy_tensor):
+        if config.return_numpy:
+            return lazy_tensor.array
+        if in_dygraph_mode():
+            t = paddle.to_tensor(lazy_tensor.array)
+            # keep the name of saved tensor as loading from pickle format
+            if lazy_tensor.name:
+                t.name = lazy_tensor.name
+            return t
+        return _to_LodTensor(lazy_tensor.array)
+
+    with _open_file_buffer(path, 'rb') as f:
+        return _load_mmap_format(
+            f, path if config.mmap else None, config.mmap, materialize
+        )
 
 
 def _contain_x(obj, condition_func):
@@ -773,7 +828,7 @@ def _save_binary_var(obj, path):
 def save(
     obj: _StateDict | NestedStructure[Tensor] | Program,
     path: str | BytesIO,
-    protocol: Literal[2, 3, 4] = 4,
+    protocol: Literal[2, 3, 4, 5] = 4,
     **configs: Unpack[_SaveOptions],
 ) -> None:
     '''
@@ -795,12 +850,19 @@ def save(
         obj(Object) : The object to be saved.
         path(str|BytesIO) : The path/buffer of the object to be saved.
           If saved in the current directory, the input path string will be used as the file name.
-        protocol(int, optional): The protocol version of pickle module must be greater than 1 and less than 5.
+        protocol(int, optional): The protocol version of pickle module must be greater than 1 and less than 6.
+                                 With protocol 5, tensor data is written to the file from the tensor memory directly
+                                 without intermediate copies, which reduces peak host memory when saving large
+                                 objects.
                                  Default: 4
         **configs(dict, optional): optional keyword arguments. The following options are currently supported:
           use_binary_format(bool): When the saved object is static graph variable, you can specify ``use_binary_for_var``.
           If True, save the file in the c++ binary format when saving a single static graph variable; otherwise, save it in pickle format.
           Default: False
+          use_mmap_format(bool): If True, save tensors and numpy arrays in ``obj`` as aligned raw data regions
+          indexed by a pickled header instead of pickling them, so that the file can be loaded by ``paddle.load``
+          with ``mmap=True``, which maps the file and materializes tensors lazily. Program is not supported.
+          Default: False
 
     Returns:
         None
@@ -932,8 +994,15 @@ def save(
             f"Type of `use_binary_format` should be bool, but received {type(config.use_binary_format)}."
         )
 
+    if not isinstance(config.use_mmap_format, bool):
+        raise TypeError(
+            f"Type of `use_mmap_format` should be bool, but received {type(config.use_mmap_format)}."
+        )
+
     if config.use_binary_format:
         _save_binary_var(obj, path)
+    elif config.use_mmap_format:
+        _mmap_save(obj, path, protocol)
     else:
         # `protocol` need to be used, `pickle_protocol` is a deprecated arg.
         if config.pickle_protocol is not None:
@@ -973,15 +1042,7 @@ def _legacy_save(obj, path, protocol=2):
     if len(obj) == 0:
         warnings.warn("The input state dict is empty, no need to save.")
 
-    if not isinstance(protocol, int):
-        raise ValueError(
-            f"The 'protocol' MUST be `int`, but received {type(protocol)}"
-        )
-
-    if protocol < 2 or protocol > 4:
-        raise ValueError(
-            f"Expected 1<'protocol'<5, but received protocol={protocol}"
-        )
+    _check_pickle_protocol(protocol)
 
     if _is_file_path(path):
         filename = os.path.basename(path)
@@ -1001,20 +1062,11 @@ def _legacy_save(obj, path, protocol=2):
 
     saved_obj = _unpack_saved_dict(saved_obj, protocol)
 
-    # When value of dict is lager than 4GB ,there is a Bug on 'MAC python3'
-    if (
-        _is_file_path(path)
-        and sys.platform == 'darwin'
-        and sys.version_info.major == 3
-    ):
-        pickle_bytes = pickle.dumps(saved_obj, protocol=protocol)
-        with open(path, 'wb') as f:
-            max_bytes = 2**30
-            for i in range(0, len(pickle_bytes), max_bytes):
-                f.write(pickle_bytes[i : i + max_bytes])
-    else:
-        with _open_file_buffer(path, 'wb') as f:
-            pickle.dump(saved_obj, f, protocol=protocol)
+    with _open_file_buffer(path, 'wb') as f:
+        # When value of dict is lager than 4GB ,there is a Bug on 'MAC python3'
+        if sys.platform == 'darwin' and sys.version_info.major == 3:
+            f = _ChunkedWriter(f)
+        pickle.dump(saved_obj, f, protocol=protocol)
 
 
 def load(path: str | BytesIO, **configs: Unpack[_LoadOptions]) -> Any:
@@ -1062,6 +1114,11 @@ def load(path: str | BytesIO, **configs: Unpack[_LoadOptions]) -> Any:
             by default.
             (3) return_numpy(bool): If specified as True, return tensor as numpy.ndarray, otherwise return tensor as paddle.Tensor.
             Default False.
+            (4) mmap(bool): Only for files saved by ``paddle.save`` with ``use_mmap_format=True``. If True, the file is
+            memory-mapped instead of read, dicts are returned as read-only ``MmapStateDict``, in which each tensor is
+            materialized when it is got for the first time, so only the used tensors are read from disk. With
+            ``return_numpy=True``, read-only numpy arrays viewing the mapped file are returned without copying.
+            Files in this format are fully read if False. Default False.
 
     Returns:
         Object(Object): a target object can be used in paddle
@@ -1180,10 +1237,33 @@ def load(path: str | BytesIO, **configs: Unpack[_LoadOptions]) -> Any:
             >>> # load state_dict
             >>> dict_load = paddle.load(byio)
 
+        .. code-block:: python
+            :name: code-example-6
+
+            >>> # example 6: load tensors lazily from a memory-mapped file
+            >>> import paddle
+            >>> emb = paddle.nn.Embedding(10, 10)
+            >>> paddle.save(emb.state_dict(), "emb.pdparams", use_mmap_format=True)
+
+            >>> # only 'weight' is read from disk
+            >>> state_dict = paddle.load("emb.pdparams", mmap=True)
+            >>> weight = state_dict['weight']
+            >>> emb.set_state_dict(state_dict)
+
     '''
 
     if _is_memory_buffer(path) or os.path.isfile(path):
         config = _parse_load_config(configs)
+        with _open_file_buffer(path, 'rb') as f:
+            is_mmap_format = _is_mmap_format(f)
+        if config.mmap and (_is_memory_buffer(path) or not is_mmap_format):
+            raise ValueError(
+                "`mmap=True` only supports loading a file saved by "
+                "`paddle.save` with `use_mmap_format=True`."
+            )
+        if is_mmap_format:
+            return _mmap_load(path, config)
+
         exception_type = pickle.UnpicklingError
         try:
             with _open_file_buffer(path, 'rb') as f:
@@ -61,6 +61,25 @@ class _buffer_writer(_open_buffer):
         self.buffer.flush()
 
 
+class _ChunkedWriter:
+    """
+    Write to the file in chunks of at most 1GB, for writing more than 2GB
+    at once fails on 'MAC python3'. Large buffers are written from their
+    memory directly, without building the whole pickled bytes in memory.
+    """
+
+    MAX_BYTES = 2**30
+
+    def __init__(self, f):
+        self._f = f
+
+    def write(self, data):
+        view = memoryview(data).cast('B')
+        for i in range(0, len(view), self.MAX_BYTES):
+            self._f.write(view[i : i + self.MAX_BYTES])
+        return len(view)
+
+
 def _is_file_path(path):
     return isinstance(path, str)
 
@@ -0,0 +1,294 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# This file implements the memory-mappable checkpoint format used by
+# `paddle.save(..., use_mmap_format=True)` and `paddle.load(..., mmap=True)`.
+#
+# File layout:
+#
+#   | magic (8B) | header offset (8B, little endian) | padding |
+#   | tensor 0 | padding | tensor 1 | padding | ... | header |
+#
+# Tensor payloads are raw C-contiguous buffers aligned to _MMAP_ALIGNMENT,
+# so they can be mapped as numpy arrays without copying. They are written
+# one by one while the object is pickled, so a tensor is converted to host
+# memory only when it is written. The header at the end is a pickled dict
+# of format version, tensor records and the pickled object, in which
+# tensors are replaced by persistent ids indexing the records. Each tensor
+# record holds (name, dtype, shape, offset, nbytes), offsets are relative
+# to the start of the file.
+
+import collections
+import io
+import mmap
+import pickle
+import struct
+from collections.abc import Mapping
+
+import numpy as np
+
+_MMAP_MAGIC = b'PDMMAP\x00\x01'
+_MMAP_VERSION = 1
+_MMAP_ALIGNMENT = 64
+_PREAMBLE = struct.Struct('<8sQ')
+# NOTE: write large tensors in chunks, see the 'MAC python3' bug in io.py
+_MAX_WRITE_BYTES = 2**30
+
+
+def _align(nbytes):
+    return (nbytes + _MMAP_ALIGNMENT - 1) // _MMAP_ALIGNMENT * _MMAP_ALIGNMENT
+
+
+class _MmapPickler(pickle.Pickler):
+    # NOTE: tensors are taken out of the pickle stream by persistent_id and
+    # written to the data file at once, to_ndarray converts a tensor to
+    # (name, ndarray), or returns None if the object is not a tensor
+    def __init__(self, file, protocol, data_file, base, to_ndarray):
+        super().__init__(file, protocol)
+        self._data_file = data_file
+        self._to_ndarray = to_ndarray
+        self._base = base
+        self.records = []
+        # tensors shared in obj are saved once
+        self._saved_ids = {}
+
+    def persistent_id(self, obj):
+        if id(obj) in self._saved_ids:
+            return self._saved_ids[id(obj)][0]
+        converted = self._to_ndarray(obj)
+        if converted is None:
+            return None
+        name, arr = converted
+        arr = np.ascontiguousarray(arr)
+        offset = self._data_file.tell() - self._base
+        _write_array(self._data_file, arr)
+        self.records.append(
+            (name, arr.dtype.str, arr.shape, offset, arr.nbytes)
+        )
+        # keep obj alive so that its id is not reused
+        self._saved_ids[id(obj)] = (len(self.records) - 1, obj)
+        return len(self.records) - 1
+
+
+def _write_array(f, arr):
+    buf = memoryview(arr.reshape(-1).view(np.uint8))
+    for i in range(0, len(buf), _MAX_WRITE_BYTES):
+        f.write(buf[i : i + _MAX_WRITE_BYTES])
+    padding = _align(arr.nbytes) - arr.nbytes
+    if padding:
+        f.write(b'\0' * padding)
+
+
+def _save_mmap_format(obj, f, protocol, to_ndarray):
+    """
+    Save obj to a writable and seekable file object in the mmap format.
+
+    Args:
+        obj(Object): the object to save.
+        f(file): the file object to write.
+        protocol(int): the pickle protocol of the header.
+        to_ndarray(callable): convert a tensor to (name, ndarray), return
+            None for objects which are not tensors.
+    """
+    base = f.tell()
+    f.write(_PREAMBLE.pack(_MMAP_MAGIC, 0))
+    f.write(b'\0' * (_align(_PREAMBLE.size) - _PREAMBLE.size))
+
+    obj_buffer = io.BytesIO()
+    pickler = _MmapPickler(obj_buffer, protocol, f, base, to_ndarray)
+    pickler.dump(obj)
+
+    header_offset = f.tell() - base
+    pickle.dump(
+        {
+            'version': _MMAP_VERSION,
+            'records': pickler.records,
+            'obj': obj_buffer.getvalue(),
+        },
+        f,
+        protocol=protocol,
+    )
+    end = f.tell()
+    f.seek(base)
+    f.write(_PREAMBLE.pack(_MMAP_MAGIC, header_offset))
+    f.seek(end)
+
+
+def _is_mmap_format(f):
+    """
+    Check whether the readable file object is in the mmap format, the file
+    position is not changed.
+    """
+    pos = f.tell()
+    try:
+        return f.read(len(_MMAP_MAGIC)) == _MMAP_MAGIC
+    finally:
+        f.seek(pos)
+
+
+class _LazyTensor:
+    # a tensor not materialized yet, which is a view on the mapped file
+    def __init__(self, name, array):
+        self.name = name
+        self.array = array
+
+
+class MmapStateDict(Mapping):
+    """
+    A read-only dict returned by :code:`paddle.load(path, mmap=True)`,
+    in which tensors are materialized from the memory-mapped file when
+    they are got for the first time. Only pages of the got tensors are
+    read from disk, so loading part of a large checkpoint is cheap.
+
+    It can be passed to :code:`Layer.set_state_dict` directly, or
+    converted to a normal dict by :code:`to_dict`.
+
+    Examples:
+
+        .. code-block:: python
+
+            >>> import paddle
+            >>> emb = paddle.nn.Embedding(10, 10)
+            >>> paddle.save(emb.state_dict(), "emb.pdparams", use_mmap_format=True)
+
+            >>> state_dict = paddle.load("emb.pdparams", mmap=True)
+            >>> weight = state_dict['weight']
+            >>> print(weight.shape)
+            [10, 10]
+    """
+
+    def __init__(self, data, materialize):
+        self._data = data
+        self._materialize = materialize
+        self._cache = {}
+
+    def __getitem__(self, key):
+        if key in self._cache:
+            return self._cache[key]
+        value = self._data[key]
+        if isinstance(value, _LazyTensor):
+            value = self._materialize(value)
+            self._cache[key] = value
+        return value
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return f"MmapStateDict(keys={list(self._data.keys())})"
+
+    def to_dict(self):
+        """
+        Materialize all tensors and return them in a normal dict, nested
+        :code:`MmapStateDict` are also converted.
+        """
+        return {
+            key: value.to_dict() if isinstance(value, MmapStateDict) else value
+            for key, value in self.items()
+        }
+
+
+def _wrap_lazy(obj, materialize):
+    # dicts become MmapStateDict to materialize tensors on access, tensors
+    # in other containers are materialized directly
+    if isinstance(obj, _LazyTensor):
+        return materialize(obj)
+    elif type(obj) in (dict, collections.OrderedDict):
+        return MmapStateDict(
+            obj.__class__(
+                (
+                    key,
+                    (
+                        value
+                        if isinstance(value, _LazyTensor)
+                        else _wrap_lazy(value, materialize)
+                    ),
+                )
+                for key, value in obj.items()
+            ),
+            materialize,
+        )
+    elif type(obj) in (list, tuple):
+        return type(obj)(_wrap_lazy(value, materialize) for value in obj)
+    return obj
+
+
+class _MmapUnpickler(pickle.Unpickler):
+    def __init__(self, file, tensors):
+        super().__init__(file, encoding='latin1')
+        self._tensors = tensors
+
+    def persistent_load(self, pid):
+        return self._tensors[pid]
+
+
+def _load_mmap_format(f, path, use_mmap, materialize):
+    """
+    Load an object saved in the mmap format.
+
+    Args:
+        f(file): the readable and seekable file object, at the start of
+            the saved object, the file position is set to the end of the
+            saved object after loading.
+        path(str|None): the file path, required if use_mmap is True.
+        use_mmap(bool): whether to map the file and materialize tensors
+            lazily. If False, all tensors are read into memory.
+        materialize(callable): convert a :code:`_LazyTensor` to the
+            returned tensor.
+
+    Returns:
+        Object: the loaded object, dicts are returned as MmapStateDict if
+        use_mmap is True.
+    """
+    base = f.tell()
+    magic, header_offset = _PREAMBLE.unpack(f.read(_PREAMBLE.size))
+    assert magic == _MMAP_MAGIC, "the file is not in the mmap format"
+    f.seek(base + header_offset)
+    header = pickle.load(f, encoding='latin1')
+    if header['version'] > _MMAP_VERSION:
+        raise ValueError(
+            f"the mmap format version {header['version']} is not supported, "
+            f"please upgrade paddle to load it"
+        )
+    end = f.tell()
+
+    tensors = []
+    if use_mmap:
+        with open(path, 'rb') as mapped_file:
+            # the mapping is kept alive by arrays viewing it
+            buf = mmap.mmap(mapped_file.fileno(), 0, access=mmap.ACCESS_READ)
+        for name, dtype, shape, offset, nbytes in header['records']:
+            dtype = np.dtype(dtype)
+            arr = np.frombuffer(
+                buf,
+                dtype=dtype,
+                count=nbytes // dtype.itemsize,
+                offset=base + offset,
+            ).reshape(shape)
+            tensors.append(_LazyTensor(name, arr))
+    else:
+        for name, dtype, shape, offset, nbytes in header['records']:
+            arr = np.empty(shape, dtype=np.dtype(dtype))
+            f.seek(base + offset)
+            f.readinto(memoryview(arr.reshape(-1).view(np.uint8)))
+            tensors.append(materialize(_LazyTensor(name, arr)))
+        f.seek(end)
+
+    obj = _MmapUnpickler(io.BytesIO(header['obj']), tensors).load()
+    if use_mmap:
+        obj = _wrap_lazy(obj, materialize)
+    return obj
@@ -13,7 +13,9 @@
 # limitations under the License.
 from __future__ import annotations
 
+import collections
 import contextlib
+import functools
 import inspect
 import os
 import pickle
@@ -98,6 +100,18 @@ def to_numpy(var):
     return np.array(t)
 
 
+def _to_input_tensor(x):
+    # tensors already on the expected place, such as batches prefetched to
+    # device, are used directly instead of copied by paddle.to_tensor
+    if (
+        isinstance(x, base.core.eager.Tensor)
+        and x.stop_gradient
+        and x.place._equals(_get_device())
+    ):
+        return x
+    return paddle.to_tensor(x)
+
+
 def flatten_list(l):
     assert isinstance(l, list), "not a list"
     outl = []
@@ -129,6 +143,139 @@ def _all_gather(x):
     return output
 
 
+def _is_syncable_metrics(metrics):
+    # metrics declaring states by Metric.add_state are reduced across ranks
+    # by Metric.sync after evaluation, instead of gathering outputs and
+    # labels of each batch
+    return all(metric.__dict__.get('_reducible_states') for metric in metrics)
+
+
+class _LazyValue:
+    # a value of logs computed when it is read, index selects an item of
+    # the computed list, compute should be cached if shared by values
+    def __init__(self, compute, index=None):
+        self._compute = compute
+        self._index = index
+
+    def get(self):
+        value = self._compute()
+        return value if self._index is None else value[self._index]
+
+
+class _LazyLogs(dict):
+    """
+    Logs of which :code:`_LazyValue` values are computed when they are read
+    by callbacks. Losses and metrics of training steps are kept on device,
+    and only synchronized to host at the logging frequency of callbacks.
+    """
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if isinstance(value, _LazyValue):
+            value = value.get()
+            super().__setitem__(key, value)
+        return value
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+    def values(self):
+        return [self[key] for key in self]
+
+    def copy(self):
+        return dict(self.items())
+
+    def materialize(self):
+        # compute all values, which should be done before metric states
+        # are reset
+        for key in self:
+            self[key]
+
+
+class _DevicePrefetcher:
+    """
+    Iterate a data loader with batches copied to the GPU :attr:`place` one
+    batch ahead. Host data is staged in pinned memory and copied on a
+    separate stream without blocking, so the copy of the next batch
+    overlaps with the computation of the current batch. Tensors already on
+    :attr:`place` are passed through.
+    """
+
+    def __init__(self, data_loader, place, buffer_size=2):
+        assert buffer_size > 0, "buffer_size should be a positive value"
+        self._data_loader = data_loader
+        self._place = place
+        self._buffer_size = buffer_size
+        self._stream = paddle.device.Stream(place)
+        # NOTE: memory of copied tensors is allocated on the copy stream,
+        # so host and device tensors of a batch are kept alive until the
+        # compute stream finishes the step using them
+        self._consumed = []
+        self._inflight = collections.deque()
+
+    def __len__(self):
+        return len(self._data_loader)
+
+    def __iter__(self):
+        staged = collections.deque()
+        try:
+            for data in self._data_loader:
+                self._release()
+                staged.append(self._stage(data))
+                if len(staged) >= self._buffer_size:
+                    yield self._consume(staged.popleft())
+            while staged:
+                self._release()
+                yield self._consume(staged.popleft())
+        finally:
+            self._release(wait=True)
+
+    def _copy(self, data, tensors):
+        if isinstance(data, (list, tuple)):
+            return type(data)(self._copy(x, tensors) for x in data)
+        if isinstance(data, dict):
+            return {k: self._copy(v, tensors) for k, v in data.items()}
+        if isinstance(data, np.ndarray):
+            data = paddle.to_tensor(data, place=core.CUDAPinnedPlace())
+        elif not isinstance(data, paddle.Tensor) or not (
+            data.place.is_cpu_place() or data.place.is_cuda_pinned_place()
+        ):
+            return data
+        pinned = data.pin_memory()
+        out = pinned._copy_to(self._place, False)
+        out.stop_gradient = data.stop_gradient
+        tensors.append((pinned, out))
+        return out
+
+    def _stage(self, data):
+        tensors = []
+        with paddle.device.stream_guard(self._stream):
+            data = self._copy(data, tensors)
+        event = self._stream.record_event() if tensors else None
+        return data, tensors, event
+
+    def _consume(self, staged):
+        data, tensors, event = staged
+        if event is not None:
+            paddle.device.current_stream(self._place).wait_event(event)
+            self._consumed.extend(tensors)
+        return data
+
+    def _release(self, wait=False):
+        # called after the step of the consumed batch is launched
+        if self._consumed:
+            event = paddle.device.current_stream(self._place).record_event()
+            self._inflight.append((event, self._consumed))
+            self._consumed = []
+        while self._inflight and (wait or self._inflight[0][0].query()):
+            event, _ = self._inflight.popleft()
+            if wait:
+                event.synchronize()
+
+
 def wait_server_ready(endpoints):
     assert not isinstance(endpoints, str)
     while True:
@@ -1205,6 +1352,9 @@ class DynamicGraphAdapter:
             'eval_batch': 0,
             'test_batch': 0,
         }
+        self._sync_metrics = False
+        # keep losses and metrics of train_batch on device
+        self._defer_readback = False
 
         self._input_info = None
         self._amp_level = "O0"
@@ -1243,36 +1393,49 @@ class DynamicGraphAdapter:
         inputs = to_list(inputs)
         self._input_info = _update_input_info(inputs)
         labels = labels or []
-        labels = [paddle.to_tensor(l) for l in to_list(labels)]
+        labels = [_to_input_tensor(l) for l in to_list(labels)]
 
         # scaler should be initialized only once
         if self._amp_level != "O0" and self.model._scaler is None:
             self.model._scaler = paddle.amp.GradScaler(**self._amp_configs)
 
-        with paddle.amp.auto_cast(
-            enable=self._amp_level != 'O0',
-            **self._amp_custom_lists,
-            level=self._amp_level,
-        ):
-            if self._nranks > 1:
-                outputs = self.ddp_model(*[paddle.to_tensor(x) for x in inputs])
-            else:
-                outputs = self.model.network(
-                    *[paddle.to_tensor(x) for x in inputs]
-                )
+        # NOTE: gradients are only accumulated locally for steps without
+        # update, and synchronized across ranks in the step with update
+        if self._nranks > 1 and not update:
+            sync_guard = self.ddp_model.no_sync()
+        else:
+            sync_guard = contextlib.nullcontext()
+
+        with sync_guard:
+            with paddle.amp.auto_cast(
+                enable=self._amp_level != 'O0',
+                **self._amp_custom_lists,
+                level=self._amp_level,
+            ):
+                if self._nranks > 1:
+                    outputs = self.ddp_model(
+                        *[_to_input_tensor(x) for x in inputs]
+                    )
+                else:
+                    outputs = self.model.network(
+                        *[_to_input_tensor(x) for x in inputs]
+                    )
 
-        losses = self.model._loss(*(to_list(outputs) + labels))
-        losses = to_list(losses)
-        final_loss = paddle.add_n(losses)
+            losses = self.model._loss(*(to_list(outputs) + labels))
+            losses = to_list(losses)
+            final_loss = paddle.add_n(losses)
+
+            if self._amp_level != "O0":
+                scaled = self.model._scaler.scale(final_loss)
+                scaled.backward()
+            else:
+                final_loss.backward()
 
         if self._amp_level != "O0":
-            scaled = self.model._scaler.scale(final_loss)
-            scaled.backward()
             if update:
                 self.model._scaler.minimize(self.model._optimizer, scaled)
                 self.model.network.clear_gradients()
         else:
-            final_loss.backward()
             if update:
                 self.model._optimizer.minimize(final_loss)
                 self.model.network.clear_gradients()
@@ -1280,14 +1443,19 @@ class DynamicGraphAdapter:
         metrics = []
         for metric in self.model._metrics:
             metric_outs = metric.compute(*(to_list(outputs) + labels))
-            m = metric.update(*[to_numpy(m) for m in to_list(metric_outs)])
+            if self._defer_readback and metric._device_update:
+                m = metric._update_on_device(
+                    *[m.detach() for m in to_list(metric_outs)]
+                )
+            else:
+                m = metric.update(*[to_numpy(m) for m in to_list(metric_outs)])
             metrics.append(m)
 
-        return (
-            ([to_numpy(l) for l in losses], metrics)
-            if len(metrics) > 0
-            else [to_numpy(l) for l in losses]
-        )
+        if self._defer_readback:
+            losses = [l.detach() for l in losses]
+        else:
+            losses = [to_numpy(l) for l in losses]
+        return (losses, metrics) if len(metrics) > 0 else losses
 
     def eval_batch(self, inputs, labels=None):
         self.model.network.eval()
@@ -1312,23 +1480,36 @@ class DynamicGraphAdapter:
             losses = to_list(losses)
 
         if self._nranks > 1:
-            outputs = [_all_gather(o) for o in to_list(outputs)]
-            labels = [_all_gather(l) for l in labels]
+            sync_metrics = _is_syncable_metrics(self.model._metrics)
+            # metric states are synced at the end of evaluation
+            self._sync_metrics = sync_metrics
+            if sync_metrics:
+                outputs = to_list(outputs)
+                # the batches of ranks are of the same size
+                samples = outputs[0].shape[0] * self._nranks
+            else:
+                outputs = [_all_gather(o) for o in to_list(outputs)]
+                labels = [_all_gather(l) for l in labels]
+                samples = outputs[0].shape[0]
 
             if self.model._test_dataloader is not None and isinstance(
                 self.model._test_dataloader, DataLoader
             ):
                 total_size = len(self.model._test_dataloader.dataset)
-                samples = outputs[0].shape[0]
                 current_count = self._merge_count.get(self.mode + '_total', 0)
 
                 if current_count + samples >= total_size:
-                    outputs = [
-                        o[: int(total_size - current_count)] for o in outputs
-                    ]
-                    labels = [
-                        l[: int(total_size - current_count)] for l in labels
-                    ]
+                    # cut off the padding samples at the end of the gathered
+                    # batch, which are at the end of the batches of last ranks
+                    end = int(total_size - current_count)
+                    if sync_metrics:
+                        local_size = outputs[0].shape[0]
+                        end = min(
+                            max(end - self._local_rank * local_size, 0),
+                            local_size,
+                        )
+                    outputs = [o[:end] for o in outputs]
+                    labels = [l[:end] for l in labels]
                     self._merge_count[self.mode + '_total'] = 0
                     self._merge_count[self.mode + '_batch'] = int(
                         total_size - current_count
@@ -1601,6 +1782,8 @@ class Model:
         self._input_info = None
         self._is_shape_inferred = False
         self._test_dataloader = None
+        self._deferred_logs = False
+        self._prefetch_to_device = False
         self.stop_training = False
 
         if not in_dynamic_mode():
@@ -2214,6 +2397,8 @@ class Model:
         callbacks: Sequence[Callback] | Callback | None = None,
         accumulate_grad_batches: int = 1,
         num_iters: int | None = None,
+        deferred_logs: bool = False,
+        prefetch_to_device: bool = False,
     ) -> None:
         """
 
@@ -2262,6 +2447,19 @@ class Model:
             num_iters (int|None, optional): The number of iterations to evaluate the model.
                 If None, evaluate on whole input dataset, otherwise, evaluate `num_iters` times.
                 Default: None.
+            deferred_logs (bool, optional): Whether to keep losses and metric states of
+                training steps on device, and only copy them to host when callbacks read
+                them from logs, e.g. every `log_freq` steps in
+                :ref:`api_paddle_callbacks_ProgBarLogger`, which avoids synchronizing
+                device and host in each step. Metrics which do not support updating on
+                device still get inputs on host. It only works in dynamic graph mode.
+                Default: False.
+            prefetch_to_device (bool, optional): Whether to copy the next batch of
+                training data to GPU while training the current batch. Host data is
+                staged in pinned memory and copied on a separate stream without
+                blocking. It only works in dynamic graph mode on GPU, and has no
+                effect for batches already on GPU, such as those of a DataLoader
+                created with `use_buffer_reader=True` and GPU `places`. Default: False.
 
         Returns:
             None
@@ -2398,6 +2596,8 @@ class Model:
         self._test_dataloader = eval_loader
 
         self._accumulate = accumulate_grad_batches
+        self._deferred_logs = deferred_logs
+        self._prefetch_to_device = prefetch_to_device
 
         steps = self._len_data_loader(train_loader)
         self.num_iters = num_iters
@@ -2445,6 +2645,8 @@ class Model:
 
         cbks.on_end('train', logs)
         self._test_dataloader = None
+        self._deferred_logs = False
+        self._prefetch_to_device = False
 
     def evaluate(
         self,
@@ -2777,6 +2979,24 @@ class Model:
         logs={},
     ):
         outputs = []
+        # NOTE: losses and metrics are computed only when callbacks read
+        # them from logs, so that training steps are not synchronized
+        defer_readback = (
+            mode == 'train'
+            and self._deferred_logs
+            and isinstance(self._adapter, DynamicGraphAdapter)
+        )
+        if defer_readback:
+            logs = _LazyLogs(logs)
+        self._adapter._defer_readback = defer_readback
+        steps = self._len_data_loader(data_loader)
+        if (
+            mode == 'train'
+            and self._prefetch_to_device
+            and isinstance(self._adapter, DynamicGraphAdapter)
+            and isinstance(self._place, base.CUDAPlace)
+        ):
+            data_loader = _DevicePrefetcher(data_loader, self._place)
         for step, data in enumerate(data_loader):
             # Data might come from different types of data_loader and have
             # different format, as following:
@@ -2805,23 +3025,25 @@ class Model:
                 _inputs = [data[: len(self._inputs)], data[len(self._inputs) :]]
                 if mode == 'train':
                     _inputs.append(
-                        (step + 1) % self._accumulate == 0
-                        or step + 1 == len(data_loader)
+                        (step + 1) % self._accumulate == 0 or step + 1 == steps
                     )
 
                 outs = getattr(self, mode + '_batch')(*_inputs)
 
-                if self._metrics and self._loss:
-                    metrics = [[float(l) for l in outs[0]]]
-                elif self._loss:
-                    metrics = [[float(l) for l in outs]]
+                if defer_readback:
+                    metrics = self._lazy_metrics(outs)
                 else:
-                    metrics = []
+                    if self._metrics and self._loss:
+                        metrics = [[float(l) for l in outs[0]]]
+                    elif self._loss:
+                        metrics = [[float(l) for l in outs]]
+                    else:
+                        metrics = []
 
-                # metrics
-                for metric in self._metrics:
-                    res = metric.accumulate()
-                    metrics.extend(to_list(res))
+                    # metrics
+                    for metric in self._metrics:
+                        res = metric.accumulate()
+                        metrics.extend(to_list(res))
 
                 assert len(self._metrics_name()) == len(metrics)
                 for k, v in zip(self._metrics_name(), metrics):
@@ -2852,6 +3074,23 @@ class Model:
                     self.stop_training = True
                     del self.num_iters
                     break
+
+        if mode == 'eval' and getattr(self._adapter, '_sync_metrics', False):
+            # reduce metric states of all ranks, update the logs to metrics
+            # of all samples
+            metrics = []
+            for metric in self._metrics:
+                metric.sync()
+                metrics.extend(to_list(metric.accumulate()))
+            metric_names = self._metrics_name()
+            for k, v in zip(
+                metric_names[len(metric_names) - len(metrics) :], metrics
+            ):
+                logs[k] = v
+            self._adapter._sync_metrics = False
+        if defer_readback:
+            logs.materialize()
+            self._adapter._defer_readback = False
         self._reset_metrics()
 
         if mode == 'predict':
@@ -2971,6 +3210,23 @@ class Model:
         for metric in self._metrics:
             metric.reset()
 
+    def _lazy_metrics(self, outs):
+        # losses and metrics of a training step as _LazyValue in the order
+        # of _metrics_name
+        metrics = []
+        if self._loss:
+            losses = outs[0] if self._metrics else outs
+            metrics.append(_LazyValue(lambda: [float(l) for l in losses]))
+        for metric in self._metrics:
+            num_names = len(to_list(metric.name()))
+            accumulate = functools.lru_cache(maxsize=None)(
+                lambda metric=metric: to_list(metric.accumulate())
+            )
+            metrics.extend(
+                _LazyValue(accumulate, index) for index in range(num_names)
+            )
+        return metrics
+
     def _metrics_name(self):
         metrics_name = ['loss'] if self._loss else []
         for m in self._metrics:
@@ -0,0 +1,165 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+
+_ADAPTIVE_PREFETCH_KEYS = (
+    'min_prefetch_factor',
+    'min_num_workers',
+    'interval',
+    'starve_ratio',
+    'idle_ratio',
+)
+
+
+def _parse_adaptive_prefetch(adaptive_prefetch):
+    """
+    Parse :attr:`adaptive_prefetch` of DataLoader, return None if adaptive
+    prefetch is disabled, or a dict of configs.
+    """
+    if adaptive_prefetch is None or adaptive_prefetch is False:
+        return None
+    if adaptive_prefetch is True:
+        return {}
+    if not isinstance(adaptive_prefetch, dict):
+        raise TypeError(
+            "adaptive_prefetch should be a bool or a dict, but got "
+            f"{type(adaptive_prefetch)}"
+        )
+    for key in adaptive_prefetch:
+        if key not in _ADAPTIVE_PREFETCH_KEYS:
+            raise ValueError(
+                f"unknown adaptive_prefetch config '{key}', supported "
+                f"configs: {_ADAPTIVE_PREFETCH_KEYS}"
+            )
+    return dict(adaptive_prefetch)
+
+
+class _AdaptivePrefetchController:
+    """
+    Decide in-flight batch number and active worker number of the
+    multi-process DataLoader by measuring, in a window of batches:
+
+    1. consumer wait: time blocked in :code:`__next__` reading a batch.
+    2. producer wait: time the reading thread blocked in :code:`_get_data`
+       waiting for batches from workers.
+    3. step time: wall time between two :code:`__next__` calls.
+
+    If the consumer waits longer than :attr:`starve_ratio` of step time,
+    the training is data-starved, workers are added if the reading thread
+    is also waiting for workers, otherwise more batches are prefetched to
+    absorb jitter. If the consumer waits less than :attr:`idle_ratio` of
+    step time, resources are over-provisioned, in-flight batches are
+    reduced first, then active workers.
+
+    Args:
+        min_inflight(int): lower bound of in-flight batches.
+        max_inflight(int): upper bound of in-flight batches.
+        min_num_workers(int): lower bound of active workers.
+        max_num_workers(int): upper bound of active workers.
+        inflight_step(int): in-flight batches changed each time.
+        interval(int, optional): batch number of a measuring window.
+            Default 20.
+        starve_ratio(float, optional): consumer wait ratio of step time
+            above which resources are added. Default 0.05.
+        idle_ratio(float, optional): consumer wait ratio of step time
+            below which resources are reduced. Default 0.005.
+    """
+
+    def __init__(
+        self,
+        min_inflight,
+        max_inflight,
+        min_num_workers,
+        max_num_workers,
+        inflight_step=1,
+        interval=20,
+        starve_ratio=0.05,
+        idle_ratio=0.005,
+    ):
+        assert 0 < min_inflight <= max_inflight
+        assert 0 < min_num_workers <= max_num_workers
+        assert interval > 0, "interval should be a positive value"
+        assert 0 <= idle_ratio < starve_ratio
+        self.min_inflight = min_inflight
+        self.max_inflight = max_inflight
+        self.min_num_workers = min_num_workers
+        self.max_num_workers = max_num_workers
+        self.inflight_step = inflight_step
+        self.interval = interval
+        self.starve_ratio = starve_ratio
+        self.idle_ratio = idle_ratio
+
+        # start from the configured upper bounds, shrink if idle
+        self.inflight = max_inflight
+        self.num_workers = max_num_workers
+
+        self._last_time = None
+        self._reset_window()
+
+    def _reset_window(self):
+        self._steps = 0
+        self._consumer_wait = 0.0
+        self._producer_wait = 0.0
+        self._step_time = 0.0
+
+    def add_producer_wait(self, wait_time):
+        self._producer_wait += wait_time
+
+    def update(self, wait_time):
+        """
+        Record consumer wait time of a batch, return True if
+        :attr:`inflight` or :attr:`num_workers` changed.
+        """
+        now = time.perf_counter()
+        if self._last_time is not None:
+            self._steps += 1
+            self._consumer_wait += wait_time
+            self._step_time += now - self._last_time
+        self._last_time = now
+
+        if self._steps < self.interval:
+            return False
+
+        changed = False
+        consumer_ratio = self._consumer_wait / max(self._step_time, 1e-9)
+        producer_ratio = self._producer_wait / max(self._step_time, 1e-9)
+        if consumer_ratio > self.starve_ratio:
+            if (
+                producer_ratio > self.starve_ratio
+                and self.num_workers < self.max_num_workers
+            ):
+                self.num_workers += 1
+                changed = True
+            elif self.inflight < self.max_inflight:
+                self.inflight = min(
+                    self.inflight + self.inflight_step, self.max_inflight
+                )
+                changed = True
+        elif consumer_ratio < self.idle_ratio:
+            if self.inflight > self.min_inflight:
+                self.inflight = max(
+                    self.inflight - self.inflight_step, self.min_inflight
+                )
+                changed = True
+            elif self.num_workers > self.min_num_workers:
+                self.num_workers -= 1
+                changed = True
+
+        self._reset_window()
+        return changed
+
+    def reset_timer(self):
+        # step time between epochs should not be counted
+        self._last_time = None
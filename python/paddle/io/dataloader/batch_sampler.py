@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import math
 from typing import (
+    Any,
     Iterable,
     Iterator,
     Sequence,
@@ -172,6 +173,24 @@ class BatchSampler(Sampler[Sequence[int]]):
         num_samples += int(not self.drop_last) * (local_batch_size - 1)
         return num_samples // local_batch_size
 
+    def state_dict(self) -> dict[str, Any]:
+        """
+        Get the state to draw the same batch indices of current epoch again,
+        e.g. the random state of :attr:`sampler`, used to resume
+        :code:`paddle.io.DataLoader` iteration.
+        """
+        if hasattr(self.sampler, 'state_dict'):
+            return {'sampler': self.sampler.state_dict()}
+        return {}
+
+    def load_state_dict(self, state_dict: dict[str, Any]) -> None:
+        """
+        Load state got by :code:`state_dict`, the next iteration draws the
+        same batch indices as the epoch the state is got from.
+        """
+        if 'sampler' in state_dict and hasattr(self.sampler, 'load_state_dict'):
+            self.sampler.load_state_dict(state_dict['sampler'])
+
 
 class _InfiniteIterableSampler(Sampler[Sequence[None]]):
     dataset: IterableDataset
@@ -318,6 +337,8 @@ class DistributedBatchSampler(BatchSampler):
             ]
 
         assert len(indices) == self.total_size
+        # epoch used by this iteration, see state_dict
+        self._iter_epoch = self.epoch
         if self.shuffle:
             np.random.RandomState(self.epoch).shuffle(indices)
             self.epoch += 1
@@ -368,6 +389,12 @@ class DistributedBatchSampler(BatchSampler):
         num_samples += int(not self.drop_last) * (local_batch_size - 1)
         return num_samples // local_batch_size
 
+    def state_dict(self) -> dict[str, Any]:
+        return {'epoch': getattr(self, '_iter_epoch', self.epoch)}
+
+    def load_state_dict(self, state_dict: dict[str, Any]) -> None:
+        self.epoch = state_dict['epoch']
+
     def set_epoch(self, epoch: int) -> None:
         """
         Sets the epoch number. When :attr:`shuffle=True`, this number is used
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import numbers
+import operator
 from collections.abc import Mapping, Sequence
 
 import numpy as np
@@ -109,3 +110,176 @@ def default_convert_fn(batch):
         return [default_convert_fn(d) for d in batch]
     else:
         return batch
+
+
+class _CollateField:
+    """
+    A leaf field of the sample schema, which records how to get the field
+    from a sample and how to collate it among samples.
+    """
+
+    NDARRAY = 0
+    TENSOR = 1
+    NUMBER = 2
+    STRING = 3
+
+    def __init__(self, path, kind, value):
+        self.kind = kind
+        self.getters = [operator.itemgetter(key) for key in path]
+        self.buffer = None
+        if kind == _CollateField.NUMBER:
+            self.dtype = np.array([value]).dtype
+            self.shape = ()
+            self.value_types = {type(value)}
+        elif kind == _CollateField.NDARRAY:
+            self.dtype = value.dtype
+            self.shape = value.shape
+
+    def gather(self, batch):
+        values = batch
+        for getter in self.getters:
+            values = map(getter, values)
+        return list(values)
+
+    def collate(self, values, reuse_buffers):
+        if self.kind == _CollateField.TENSOR:
+            return paddle.stack(values, axis=0)
+        if self.kind == _CollateField.STRING:
+            return values
+        if self.kind == _CollateField.NUMBER:
+            value_types = set(map(type, values))
+            if value_types != self.value_types:
+                # NOTE: numbers of different types, e.g. floats after ints,
+                # are widened as np.array does, instead of being truncated
+                # to the dtype of the first batch
+                self.value_types = value_types
+                dtype = np.array(values).dtype
+                if dtype != self.dtype:
+                    self.dtype = dtype
+                    self.buffer = None
+        elif self.kind == _CollateField.NDARRAY:
+            first = values[0]
+            if first.shape != self.shape or first.dtype != self.dtype:
+                # variable shape field, re-infer shape and drop buffer
+                self.shape, self.dtype = first.shape, first.dtype
+                self.buffer = None
+        if not reuse_buffers:
+            if self.kind == _CollateField.NDARRAY:
+                return np.stack(values, axis=0)
+            return np.array(values, dtype=self.dtype)
+
+        batch_size = len(values)
+        if self.buffer is None or self.buffer.shape[0] < batch_size:
+            self.buffer = np.empty((batch_size, *self.shape), dtype=self.dtype)
+        out = self.buffer[:batch_size]
+        if self.kind == _CollateField.NDARRAY:
+            np.stack(values, axis=0, out=out)
+        else:
+            out[...] = values
+        return out
+
+
+class CachedCollateFn:
+    """
+    Batch collating function with the same output as
+    :code:`default_collate_fn`, which infers the sample schema from the
+    first batch only once, and compiles it into a flat field plan.
+
+    For each following batch, every field is gathered from samples and
+    stacked directly without inspecting types and recursing through
+    nested dictionaries and sequences of each sample, numpy array and
+    number fields are stacked into reusable preallocated output buffers
+    in place. This is useful for small samples with many fields, e.g.
+    tabular data, where the per-batch recursion of
+    :code:`default_collate_fn` costs more than collating the data.
+
+    Notes:
+        All samples should share the schema of the first sample, i.e. the
+        same nested structure and field types. Numpy array fields may
+        change shape among batches, buffers are re-allocated then.
+
+    Notes:
+        If :attr:`reuse_buffers` is True, the output arrays are overwritten
+        by the next call. :code:`paddle.io.DataLoader` copies the output
+        before collating the next batch, but buffer reusing is disabled
+        in workers if :attr:`use_shared_memory` of DataLoader is False, for
+        output batches are serialized asynchronously then.
+
+    Args:
+        reuse_buffers(bool, optional): whether to stack numpy array and
+            number fields into preallocated buffers reused among batches.
+            Default True.
+
+    Examples:
+
+        .. code-block:: python
+
+            >>> import numpy as np
+            >>> from paddle.io.dataloader.collate import CachedCollateFn
+
+            >>> collate_fn = CachedCollateFn(reuse_buffers=False)
+            >>> batch = [
+            ...     {'dense': np.ones([4], 'float32'), 'label': i} for i in range(8)
+            ... ]
+            >>> data = collate_fn(batch)
+            >>> print(data['dense'].shape, data['label'].shape)
+            (8, 4) (8,)
+    """
+
+    def __init__(self, reuse_buffers=True):
+        self.reuse_buffers = reuse_buffers
+        self._fields = None
+        self._restore = None
+
+    def __getstate__(self):
+        # buffers are not sent to workers, plan is compiled in each worker
+        return {'reuse_buffers': self.reuse_buffers}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def _compile(self, sample):
+        fields = []
+
+        def _build(data, path):
+            if isinstance(data, np.ndarray):
+                kind = _CollateField.NDARRAY
+            elif isinstance(data, paddle.Tensor):
+                kind = _CollateField.TENSOR
+            elif isinstance(data, numbers.Number):
+                kind = _CollateField.NUMBER
+            elif isinstance(data, (str, bytes)):
+                kind = _CollateField.STRING
+            elif isinstance(data, Mapping):
+                items = [(key, _build(data[key], (*path, key))) for key in data]
+                return lambda outputs: {
+                    key: restore(outputs) for key, restore in items
+                }
+            elif isinstance(data, Sequence):
+                restores = [_build(d, (*path, i)) for i, d in enumerate(data)]
+                return lambda outputs: [
+                    restore(outputs) for restore in restores
+                ]
+            else:
+                raise TypeError(
+                    "batch data can only contain: tensor, numpy.ndarray, "
+                    f"dict, list, number, but got {type(data)}"
+                )
+            fields.append(_CollateField(path, kind, data))
+            return operator.itemgetter(len(fields) - 1)
+
+        # NOTE: the restore step is compiled into nested functions, which
+        # build a new batch from field outputs without copying and walking
+        # a structure template for each batch
+        self._restore = _build(sample, ())
+        self._fields = fields
+
+    def __call__(self, batch):
+        if self._fields is None:
+            self._compile(batch[0])
+
+        outputs = [
+            field.collate(field.gather(batch), self.reuse_buffers)
+            for field in self._fields
+        ]
+        return self._restore(outputs)
@@ -36,9 +36,12 @@ from ..multiprocess_utils import (
     CleanupFuncRegistrar,
     _set_SIGCHLD_handler,
 )
+from .adaptive import _AdaptivePrefetchController
 from .batch_sampler import _InfiniteIterableSampler
 from .collate import default_collate_fn, default_convert_fn
 from .flat import _flatten_batch, _restore_batch
+from .shm_slab import _SharedMemorySlabPool, _SlabBatch
+from .stats import MAIN_PROCESS_WORKER_ID, _WorkerStats
 from .worker import (
     _DatasetKind,
     _IterableDatasetStopIteration,
@@ -105,8 +108,21 @@ class _DataLoaderIterBase:
         self._worker_init_fn = loader.worker_init_fn
         self._dataset_kind = loader.dataset_kind
         self._pin_memory = loader.pin_memory
+        self._stats = loader._stats
+
+        # NOTE: state loaded by DataLoader.load_state_dict is applied to
+        # the next created iterator only
+        self._resume_state = loader._resume_state
+        loader._resume_state = None
+        if (
+            self._resume_state is not None
+            and 'sampler' in self._resume_state
+            and hasattr(self._batch_sampler, 'load_state_dict')
+        ):
+            self._batch_sampler.load_state_dict(self._resume_state['sampler'])
 
         self._sampler_iter = iter(self._index_sampler)
+        self._init_consumed_state()
         if self._auto_collate_batch:
             self._collate_fn = loader.collate_fn or default_collate_fn
         else:
@@ -137,9 +153,93 @@ class _DataLoaderIterBase:
     def __next__(self):
         raise NotImplementedError('Should implement `__next__` for a iterator')
 
+    def _init_consumed_state(self):
+        # NOTE: _consumed_batches counts batches output to users in this
+        # epoch, for IterableDataset, each worker iterates its own dataset
+        # copy, so batches output from each worker are also counted in
+        # _iterable_offsets to resume each worker independently
+        self._consumed_batches = 0
+        self._iterable_offsets = [0] * max(self._num_workers, 1)
+        state = self._resume_state
+        if state is None:
+            return
+
+        self._consumed_batches = state['consumed_batches']
+        if self._dataset_kind == _DatasetKind.MAP:
+            # fast-forward indices of consumed batches, samples of these
+            # batches are not read from dataset
+            self._sampler_iter = itertools.islice(
+                self._sampler_iter, self._consumed_batches, None
+            )
+        else:
+            offsets = state['iterable_offsets']
+            assert len(offsets) == len(self._iterable_offsets), (
+                "DataLoader state of IterableDataset can only be loaded "
+                f"with the same num_workers, state is saved with "
+                f"{len(offsets)} worker(s) but num_workers is "
+                f"{self._num_workers}"
+            )
+            self._iterable_offsets = list(offsets)
+
+    def _iterable_skip(self, worker_id):
+        # sample number to skip for the worker on resuming
+        if (
+            self._resume_state is None
+            or self._dataset_kind != _DatasetKind.ITER
+        ):
+            return 0
+        batch_size = (
+            self._batch_sampler.batch_size if self._auto_collate_batch else 1
+        )
+        return self._resume_state['iterable_offsets'][worker_id] * batch_size
+
+    def state_dict(self):
+        """
+        Get the position of this iterator in current epoch, which can be
+        loaded by :code:`DataLoader.load_state_dict` to resume iterating
+        from the next batch.
+
+        Returns:
+            dict: consumed batch number, state of batch sampler (e.g. the
+            random state to draw the same indices), and consumed batch
+            number of each worker for IterableDataset.
+        """
+        state = {
+            'consumed_batches': self._consumed_batches,
+            'iterable_offsets': list(self._iterable_offsets),
+        }
+        if self._auto_collate_batch and hasattr(
+            self._batch_sampler, 'state_dict'
+        ):
+            state['sampler'] = self._batch_sampler.state_dict()
+        return state
+
+    def _on_consumed(self, worker_ids):
+        self._consumed_batches += len(self._places)
+        for worker_id in worker_ids:
+            if worker_id is not None:
+                self._iterable_offsets[worker_id] += 1
+
     def __len__(self):
         return len(self._batch_sampler)
 
+    def _begin_stage(self, name):
+        # NOTE: pipeline stages are recorded as RecordEvent only if
+        # DataLoader stats is enabled, to keep timelines clean by default
+        event = None
+        if self._stats is not None and in_profiler_mode():
+            event = profiler.RecordEvent(
+                name=name, event_type=profiler.TracerEventType.Dataloader
+            )
+            event.begin()
+        return time.perf_counter(), event
+
+    def _end_stage(self, stage):
+        start, event = stage
+        if event is not None:
+            event.end()
+        return time.perf_counter() - start
+
     def _exit_thread_expectedly(self):
         self._thread_done_event.set()
         if self._blocking_queue:
@@ -167,6 +267,8 @@ class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
             self._collate_fn,
             self._drop_last,
         )
+        if self._iterable_skip(0) > 0:
+            self._dataset_fetcher.skip(self._iterable_skip(0))
 
         # NOTE: _structure_infos used to record the data structure of
         # batch to restore batch structure after reading Tensor
@@ -242,9 +344,18 @@ class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
                 # read data from dataset in mini-batch
                 # with paddle.base.dygraph.guard(place=paddle.CPUPlace()):
                 # read data from dataset in mini-batch
+                stage = self._begin_stage("_DataLoaderIterSingleProcess.fetch")
                 batch = self._dataset_fetcher.fetch(
                     indices, self._thread_done_event
                 )
+                fetch_time = self._end_stage(stage)
+                if self._stats is not None and batch is not None:
+                    collate_time = self._dataset_fetcher.collate_time
+                    self._stats.record_worker(
+                        MAIN_PROCESS_WORKER_ID,
+                        fetch_time - collate_time,
+                        collate_time,
+                    )
             except StopIteration:
                 self._exit_thread_expectedly()
                 return
@@ -260,6 +371,7 @@ class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
                 break
 
             try:
+                stage = self._begin_stage("_DataLoaderIterSingleProcess.push")
                 # pack as DenseTensorArray
                 array = core.DenseTensorArray()
                 for slot in batch:
@@ -279,6 +391,9 @@ class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
                     self._blocking_queue.push(array)
                 except:
                     self._exit_thread_expectedly()
+                push_time = self._end_stage(stage)
+                if self._stats is not None:
+                    self._stats.record_push(push_time)
 
             except Exception as e:
                 self._exit_thread_unexpectedly()
@@ -296,6 +411,7 @@ class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
         try:
             benchmark().check_if_need_record(self)
             benchmark().before_reader()
+            read_start = time.perf_counter()
             if in_dynamic_mode():
                 data = core.eager.read_next_tensor_list(
                     self._reader.read_next_list()[0]
@@ -319,6 +435,12 @@ class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
                         data = data[0]
                 else:
                     data = self._reader.read_next()
+            if self._stats is not None:
+                self._stats.record_next(
+                    time.perf_counter() - read_start,
+                    blocking_queue=self._blocking_queue.size(),
+                )
+            self._on_consumed([0] * len(self._places))
             benchmark().after_reader()
 
             return data
@@ -370,7 +492,12 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         super().__init__(loader)
 
         self._persistent_workers = loader._persistent_workers
+        # NOTE: in persistent workers mode, workers, indices queues and
+        # the reading thread are kept alive among epochs, _reset waits
+        # for all workers resumed by _ResumeIteration flags before
+        # sending indices of a new epoch
         self._resume_worker_cnt = 0
+        self._resume_done_event = threading.Event()
 
         assert self._num_workers > 0, (
             "Multi-process DataLoader "
@@ -388,6 +515,9 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         self._batches_outstanding = 0
         self._task_infos = {}
         self._structure_infos = []
+        # worker id of each batch in _structure_infos order, to count
+        # consumed batches of each worker for IterableDataset
+        self._batch_workers = []
 
         # indices outstand as _outstanding_capacity at first, and
         # blocking_queue capacity is also _outstanding_capacity.
@@ -402,7 +532,22 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         # see _try_put_indices
         self._thread_lock = threading.Lock()
 
+        # NOTE: in adaptive prefetch mode, in-flight batches and active
+        # workers are adjusted in [lower bound, _outstanding_capacity] and
+        # [lower bound, _num_workers], blocking_queue is still created
+        # with _outstanding_capacity
+        self._inflight_capacity = self._outstanding_capacity
+        self._active_num_workers = self._num_workers
+        self._prefetch_controller = None
+        if loader.adaptive_prefetch is not None:
+            self._init_prefetch_controller(loader.adaptive_prefetch)
+
         self._base_seed = np.random.randint(low=0, high=sys.maxsize)
+        # reuse worker seeds on resuming to get the same random transforms
+        if self._resume_state is not None:
+            self._base_seed = self._resume_state.get(
+                'base_seed', self._base_seed
+            )
 
         # Note(zhangbo): shm_buffer_size is used for MemoryMapAllocationPool.
         # MemoryMapAllocationPool is used to cache and reuse shm, thus reducing munmap in dataloader.
@@ -427,6 +572,13 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
             (self._worker_shm_buffer_size) * 2 * self._num_workers
         )
 
+        # NOTE: shared memory slabs are recycled among outstanding batches,
+        # batches cached in blocking_queue and batches held by users, slabs
+        # are twice of _outstanding_capacity, workers fall back to normal
+        # transport if no slab is free
+        self._shm_slab_size = loader.shm_slab_size
+        self._slab_pool = None
+
         # init workers and indices queues and put 2 indices in each indices queue
         self._init_workers()
         for _ in range(self._outstanding_capacity):
@@ -435,6 +587,50 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         self._init_thread()
         self._shutdown = False
 
+    def _init_prefetch_controller(self, config):
+        if self._dataset_kind == _DatasetKind.ITER:
+            # each worker iterates its own copy of IterableDataset, batches
+            # of inactive workers would be lost, so adaptive prefetch is
+            # only supported for map-style dataset
+            warnings.warn(
+                "adaptive_prefetch is only supported for map-style dataset, "
+                "it is ignored for IterableDataset."
+            )
+            return
+        num_places = len(self._places)
+        config = dict(config)
+        min_prefetch_factor = config.pop('min_prefetch_factor', 1)
+        min_num_workers = config.pop('min_num_workers', 1)
+        assert (
+            0 < min_prefetch_factor <= self._prefetch_factor
+        ), "min_prefetch_factor should be in range (0, prefetch_factor]"
+        assert (
+            0 < min_num_workers <= self._num_workers
+        ), "min_num_workers should be in range (0, num_workers]"
+        self._prefetch_controller = _AdaptivePrefetchController(
+            min_inflight=min_prefetch_factor * max(min_num_workers, num_places),
+            max_inflight=self._outstanding_capacity,
+            min_num_workers=min_num_workers,
+            max_num_workers=self._num_workers,
+            # keep in-flight batches a multiple of places, for each
+            # output iteration composes len(places) batches
+            inflight_step=num_places,
+            **config,
+        )
+
+    def _adapt_prefetch(self, wait_time):
+        controller = self._prefetch_controller
+        if not controller.update(wait_time):
+            return
+        with self._thread_lock:
+            grow = controller.inflight - self._inflight_capacity
+            self._inflight_capacity = controller.inflight
+            self._active_num_workers = controller.num_workers
+        # put indices for newly granted in-flight slots, shrinking takes
+        # effect by not putting indices in _on_output_batch
+        for _ in range(grow):
+            self._try_put_indices()
+
     def _init_workers(self):
         from paddle.incubate import multiprocessing
 
@@ -447,6 +643,13 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         # create data_queue for workers
         self._data_queue = multiprocessing.Queue()
 
+        if self._shm_slab_size > 0:
+            self._slab_pool = _SharedMemorySlabPool(
+                2 * self._outstanding_capacity,
+                self._shm_slab_size,
+                multiprocessing.Queue(),
+            )
+
         # event for workers and thread, thread event is only need
         # in multi-processing mode
         self._workers_done_event = multiprocessing.Event()
@@ -473,6 +676,9 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     self._use_shared_memory,
                     self._base_seed,
                     self._worker_shm_buffer_size,
+                    self._slab_pool,
+                    self._stats is not None,
+                    self._iterable_skip(i),
                 ),
             )
             worker.daemon = True
@@ -539,26 +745,31 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         # put _ResumeIteration to all worker as resume iteration flag
         with self._thread_lock:
             self._resume_worker_cnt = self._num_workers
+            self._resume_done_event.clear()
             for worker_id in range(self._num_workers):
                 self._indices_queues[worker_id].put(_ResumeIteration())
                 self._batches_outstanding += 1
-        # all flag will be check in _thread_loop, simply wait here
-        while self._resume_worker_cnt > 0:
-            time.sleep(0.5)
 
         # 2. clear blocking_queue caches
-        # in order not to restart the thread, we just clear
-        # the blocking_queue cachees instead of recreating one
-        while self._blocking_queue.size() >= len(self._places):
-            if in_dynamic_mode():
-                data = core.eager.read_next_tensor_list(
-                    self._reader.read_next_list()[0]
-                )
-            else:
-                if self._return_list:
-                    self._reader.read_next_list()
-                else:
-                    data = self._reader.read_next()
+        # all flag will be check in _thread_loop, if last epoch is not
+        # iterated to the end, batches of last epoch are still pushing
+        # to blocking_queue before flags, so discard batches in
+        # blocking_queue while waiting for all workers resumed. The
+        # outstanding batches are no more than the blocking_queue
+        # capacity, so _thread never blocks on pushing them. In order not
+        # to restart the thread, we just clear the blocking_queue caches
+        # instead of recreating one
+        while True:
+            # NOTE: check the flag before discarding, batches pushed before
+            # the flag is set are discarded in the same round, otherwise a
+            # batch pushed between discarding and checking would be left
+            # to the next epoch
+            resumed = self._resume_done_event.is_set()
+            while self._blocking_queue.size() >= len(self._places):
+                self._discard_next()
+            if resumed:
+                break
+            self._resume_done_event.wait()
 
         # 3. reset all states
         self._send_idx = 0
@@ -566,6 +777,9 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         self._batches_outstanding = 0
         self._task_infos = {}
         self._structure_infos = []
+        self._batch_workers = []
+        self._resume_state = None
+        self._init_consumed_state()
 
         # set all worker status available
         self._worker_status = [True] * self._num_workers
@@ -576,6 +790,14 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         for _ in range(self._outstanding_capacity):
             self._try_put_indices()
 
+    def _discard_next(self):
+        if in_dynamic_mode():
+            core.eager.read_next_tensor_list(self._reader.read_next_list()[0])
+        elif self._return_list:
+            self._reader.read_next_list()
+        else:
+            self._reader.read_next()
+
     def _shutdown_worker(self, worker_id, shutdown=False):
         if self._worker_status[worker_id] or (
             self._persistent_workers and shutdown
@@ -602,6 +824,8 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     for q in self._indices_queues:
                         q.cancel_join_thread()
                         q.close()
+                    if self._slab_pool is not None:
+                        self._slab_pool.close()
             finally:
                 core._erase_process_pids(id(self))
                 self._shutdown = True
@@ -616,7 +840,13 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         _set_expected_place(legacy_expected_place)
 
         while not self._thread_done_event.is_set():
+            stage = self._begin_stage("_DataLoaderIterMultiProcess._get_data")
             batch = self._get_data()
+            wait_time = self._end_stage(stage)
+            if self._prefetch_controller is not None:
+                self._prefetch_controller.add_producer_wait(wait_time)
+            if self._stats is not None:
+                self._stats.record_get_data(wait_time)
             if not self._thread_done_event.is_set():
                 if batch is None:
                     self._exit_thread_expectedly()
@@ -624,11 +854,23 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     if isinstance(batch, _ResumeIteration):
                         assert self._resume_worker_cnt > 0
                         self._resume_worker_cnt -= 1
+                        if self._resume_worker_cnt == 0:
+                            self._resume_done_event.set()
                         continue
                     try:
+                        stage = self._begin_stage(
+                            "_DataLoaderIterMultiProcess.push"
+                        )
                         # pack as DenseTensorArray
                         array = core.DenseTensorArray()
-                        if self._use_shared_memory:
+                        if isinstance(batch, _SlabBatch):
+                            # wrap slab memory as DenseTensor without copy,
+                            # slab is recycled when tensors are released
+                            for arr in self._slab_pool.read(batch):
+                                tmp = core.DenseTensor()
+                                tmp.set(arr, core.CPUPlace(), True)
+                                array.append(tmp)
+                        elif self._use_shared_memory:
                             for tensor in batch:
                                 array.append(tensor)
                         else:
@@ -645,6 +887,9 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
 
                         if not self._blocking_queue.push(array):
                             self._blocking_queue.close()
+                        push_time = self._end_stage(stage)
+                        if self._stats is not None:
+                            self._stats.record_push(push_time)
                     except Exception as e:
                         self._exit_thread_unexpectedly()
                         raise e
@@ -692,6 +937,7 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
             ):
                 info = self._task_infos.pop(self._rcvd_idx)
                 self._structure_infos.append(info[2])
+                self._batch_workers.append(info[0])
                 return info[1]
 
             try:
@@ -736,6 +982,13 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                 )
                 raise e
             else:
+                if isinstance(data, _WorkerStats):
+                    if self._stats is not None:
+                        self._stats.record_worker(
+                            data.worker_id, data.fetch_time, data.collate_time
+                        )
+                    continue
+
                 if self._dataset_kind == _DatasetKind.ITER and isinstance(
                     data, _IterableDatasetStopIteration
                 ):
@@ -766,8 +1019,8 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     batch.reraise()
 
                 if idx == self._rcvd_idx:
-                    if idx in self._task_infos:
-                        del self._task_infos[idx]
+                    info = self._task_infos.pop(idx, None)
+                    self._batch_workers.append(info[0] if info else None)
                     self._structure_infos.append(structure)
                     return batch
                 else:
@@ -788,6 +1041,12 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         # function which is not in data reading pipeline, this lock almost no
         # influence on performance
         with self._thread_lock:
+            if (
+                self._prefetch_controller is not None
+                and self._batches_outstanding >= self._inflight_capacity
+            ):
+                return
+
             try:
                 indices = next(self._sampler_iter)
             except StopIteration:
@@ -795,7 +1054,10 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
 
             for i in range(self._num_workers):
                 worker_idx = next(self._workers_idx_cycle)
-                if self._worker_status[worker_idx]:
+                if (
+                    worker_idx < self._active_num_workers
+                    and self._worker_status[worker_idx]
+                ):
                     break
             else:
                 return
@@ -835,6 +1097,7 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     self._thread_done_event.set()
                     self._blocking_queue.close()
 
+            read_start = time.perf_counter()
             if in_dynamic_mode():
                 data = core.eager.read_next_tensor_list(
                     self._reader.read_next_list()[0]
@@ -857,10 +1120,25 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                         data = data[0]
                 else:
                     data = self._reader.read_next()
+            read_time = time.perf_counter() - read_start
+            if self._stats is not None:
+                self._stats.record_next(
+                    read_time,
+                    blocking_queue=self._blocking_queue.size(),
+                    outstanding=self._batches_outstanding,
+                    reorder=len(self._task_infos),
+                )
+            self._on_consumed(
+                [self._batch_workers.pop(0) for _ in range(len(self._places))]
+            )
             self._on_output_batch()
+            if self._prefetch_controller is not None:
+                self._adapt_prefetch(read_time)
             benchmark().after_reader()
             return data
         except StopIteration:
+            if self._prefetch_controller is not None:
+                self._prefetch_controller.reset_timer()
             if not self._persistent_workers:
                 self._reader.shutdown()
                 self._try_shutdown_all()
@@ -869,6 +1147,11 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
             if in_profiler_mode():
                 trace_event.end()
 
+    def state_dict(self):
+        state = super().state_dict()
+        state['base_seed'] = self._base_seed
+        return state
+
     def _on_output_batch(self):
         for _ in range(len(self._places)):
             self._batches_outstanding -= 1
@@ -55,6 +55,13 @@ class Dataset(Generic[_T]):
     :code:`__len__`: return dataset sample number. This method is required
     by some implements of :code:`paddle.io.BatchSampler`
 
+    Subclasses can optionally implement following method:
+
+    :code:`__getitems__`: get a list of samples with a list of indices. If
+    implemented, :code:`paddle.io.DataLoader` calls it once per batch instead
+    of calling :code:`__getitem__` for each index, datasets backed by arrays
+    or columnar storage can serve a batch with one vectorized read.
+
     see :code:`paddle.io.DataLoader`.
 
     Examples:
@@ -336,10 +343,27 @@ class TensorDataset(Dataset["Tensor"]):
     def __getitem__(self, index: int) -> tuple[Tensor, ...]:
         return tuple(tensor[index] for tensor in self.tensors)
 
+    def __getitems__(self, indices: Sequence[int]) -> list[tuple[Tensor, ...]]:
+        # gather each tensor only once for all indices
+        index = paddle.to_tensor(indices, dtype='int64')
+        fields = [
+            paddle.unbind(paddle.gather(tensor, index), axis=0)
+            for tensor in self.tensors
+        ]
+        return list(zip(*fields))
+
     def __len__(self) -> int:
         return self.tensors[0].shape[0]
 
 
+def _getitems(dataset, indices):
+    # use batched __getitems__ of dataset if implemented
+    getitems = getattr(dataset, '__getitems__', None)
+    if getitems is not None:
+        return getitems(indices)
+    return [dataset[idx] for idx in indices]
+
+
 def to_list(value):
     if value is None:
         return value
@@ -414,6 +438,13 @@ class ComposeDataset(Dataset[Tuple[Unpack[_Ts]]]):
             sample.extend(to_list(dataset[idx]))
         return tuple(sample)
 
+    def __getitems__(self, indices: Sequence[int]) -> list[tuple[Unpack[_Ts]]]:
+        samples = [[] for _ in indices]
+        for dataset in self.datasets:
+            for sample, field in zip(samples, _getitems(dataset, indices)):
+                sample.extend(to_list(field))
+        return [tuple(sample) for sample in samples]
+
 
 class ChainDataset(IterableDataset[Any]):
     """
@@ -517,6 +548,9 @@ class Subset(Dataset[_T]):
     def __getitem__(self, idx: int) -> _T:
         return self.dataset[self.indices[idx]]
 
+    def __getitems__(self, indices: Sequence[int]) -> list[_T]:
+        return _getitems(self.dataset, [self.indices[idx] for idx in indices])
+
     def __len__(self) -> int:
         return len(self.indices)
 
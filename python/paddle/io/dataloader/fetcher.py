@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import itertools
+import time
+
 
 class _DatasetFetcher:
     def __init__(self, dataset, auto_collate_batch, collate_fn, drop_last):
@@ -19,6 +22,17 @@ class _DatasetFetcher:
         self.auto_collate_batch = auto_collate_batch
         self.collate_fn = collate_fn
         self.drop_last = drop_last
+        # time cost of collate_fn in last fetch, used by DataLoader stats
+        self.collate_time = 0.0
+
+    def _collate(self, data):
+        if not self.collate_fn:
+            self.collate_time = 0.0
+            return data
+        start = time.perf_counter()
+        data = self.collate_fn(data)
+        self.collate_time = time.perf_counter() - start
+        return data
 
     # NOTE: fetch function here perform the whole pipeline of dataset
     #       reading and data transforms of a batch in each calling, this
@@ -40,6 +54,14 @@ class _IterableDatasetFetcher(_DatasetFetcher):
         super().__init__(dataset, auto_collate_batch, collate_fn, drop_last)
         self.dataset_iter = iter(dataset)
 
+    def skip(self, num_samples):
+        # NOTE: skip samples consumed before DataLoader is resumed from
+        #       state_dict, skipped samples are only drawn from the dataset
+        #       iterator without collating and transferring
+        next(
+            itertools.islice(self.dataset_iter, num_samples, num_samples), None
+        )
+
     def fetch(self, batch_indices, done_event=None):
         if self.auto_collate_batch:
             data = []
@@ -60,17 +82,22 @@ class _IterableDatasetFetcher(_DatasetFetcher):
         else:
             data = next(self.dataset_iter)
 
-        if self.collate_fn:
-            data = self.collate_fn(data)
-        return data
+        return self._collate(data)
 
 
 class _MapDatasetFetcher(_DatasetFetcher):
     def __init__(self, dataset, auto_collate_batch, collate_fn, drop_last):
         super().__init__(dataset, auto_collate_batch, collate_fn, drop_last)
+        # NOTE: datasets can implement __getitems__ to get samples of
+        #       a batch in one call, e.g. by one vectorized read
+        self._getitems = getattr(dataset, '__getitems__', None)
 
     def fetch(self, batch_indices, done_event=None):
-        if self.auto_collate_batch:
+        if self.auto_collate_batch and self._getitems is not None:
+            if done_event is not None and done_event.is_set():
+                return None
+            data = self._getitems(list(batch_indices))
+        elif self.auto_collate_batch:
             data = []
             for idx in batch_indices:
                 if done_event is None or not done_event.is_set():
@@ -81,6 +108,4 @@ class _MapDatasetFetcher(_DatasetFetcher):
         else:
             data = self.dataset[batch_indices]
 
-        if self.collate_fn:
-            data = self.collate_fn(data)
-        return data
+        return self._collate(data)
@@ -119,6 +119,29 @@ class Sampler(Generic[_T]):
         def __len__(self) -> int: ...
 
 
+class _NumpyRandomStateMixin:
+    """
+    Record global numpy random state before a sampler draws indices of an
+    epoch, so that the same indices can be drawn again after restarting
+    from :code:`state_dict`, used by resumable DataLoader iterator.
+    """
+
+    _rng_state = None
+    _rng_state_to_load = None
+
+    def _record_random_state(self):
+        if self._rng_state_to_load is not None:
+            np.random.set_state(self._rng_state_to_load)
+            self._rng_state_to_load = None
+        self._rng_state = np.random.get_state()
+
+    def state_dict(self) -> dict[str, Any]:
+        return {'rng_state': self._rng_state}
+
+    def load_state_dict(self, state_dict: dict[str, Any]) -> None:
+        self._rng_state_to_load = state_dict['rng_state']
+
+
 class SequenceSampler(Sampler[int]):
     """
     Iterate samples sequentially, yield :code:`0, 1, 2, ..., len(data_source) -1`
@@ -176,7 +199,7 @@ class SequenceSampler(Sampler[int]):
         return len(self.data_source)
 
 
-class RandomSampler(Sampler[int]):
+class RandomSampler(_NumpyRandomStateMixin, Sampler[int]):
     """
     Iterate samples randomly, yield shuffled indices, if :attr:`replacement=False`,
     yield shuffled indices of the whole data source, if :attr:`replacement=True`,
@@ -275,6 +298,7 @@ class RandomSampler(Sampler[int]):
                     return
                 yield index
         else:
+            self._record_random_state()
             if self.replacement:
                 for index in np.random.choice(
                     np.arange(n), self.num_samples, replace=True
@@ -322,7 +346,7 @@ def _weighted_sample(weights, num_samples, replacement=True):
     return np.array(rets)
 
 
-class WeightedRandomSampler(Sampler[int]):
+class WeightedRandomSampler(_NumpyRandomStateMixin, Sampler[int]):
     """
     Random sample with given weights (probabilities), sample index will be in range
     [0, len(weights) - 1], if :attr:`replacement` is True, index can be sampled
@@ -378,6 +402,7 @@ class WeightedRandomSampler(Sampler[int]):
         self.replacement = replacement
 
     def __iter__(self) -> Iterator[int]:
+        self._record_random_state()
         idxs = _weighted_sample(
             self.weights, self.num_samples, self.replacement
         )
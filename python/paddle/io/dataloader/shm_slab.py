@@ -0,0 +1,240 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import mmap
+import os
+import queue
+import tempfile
+import uuid
+
+import numpy as np
+
+from ..multiprocess_utils import CleanupFuncRegistrar
+
+# NOTE: offsets of arrays in a slab are aligned to cache line size, so
+# that tensors wrapped on slab memory are properly aligned for kernels
+_SLAB_ALIGNMENT = 64
+
+# NOTE: [ slab files clear ] slab files are created by the main process
+# and only unlinked by it, record all live slab files here to unlink
+# them if the main process exits unexpectedly
+_live_slab_files = set()
+
+
+def _cleanup_slab_files():
+    for path in list(_live_slab_files):
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+    _live_slab_files.clear()
+
+
+CleanupFuncRegistrar.register(_cleanup_slab_files)
+
+
+def _align(nbytes):
+    return (nbytes + _SLAB_ALIGNMENT - 1) // _SLAB_ALIGNMENT * _SLAB_ALIGNMENT
+
+
+def _shm_dir():
+    # /dev/shm is a tmpfs on Linux, fall back to temp dir otherwise
+    if os.path.isdir('/dev/shm'):
+        return '/dev/shm'
+    return tempfile.gettempdir()
+
+
+class _SlabBatch:
+    """
+    Descriptor of a batch written into a shared memory slab, only this
+    descriptor is sent through the inter-process queue.
+
+    Args:
+        slab_id(int): index of the slab in the pool.
+        metas(list): (offset, shape, dtype string) of each flattened field.
+    """
+
+    def __init__(self, slab_id, metas):
+        self.slab_id = slab_id
+        self.metas = metas
+
+
+class _SlabLease:
+    """
+    Hold a slab while arrays wrapped on it are alive. The slab is given
+    back to the free list when the last array (and the DenseTensor
+    sharing it) is released.
+    """
+
+    def __init__(self, pool, slab_id):
+        self._pool = pool
+        self._slab_id = slab_id
+
+    def __del__(self):
+        try:
+            self._pool._release(self._slab_id)
+        except Exception:
+            # interpreter may be shutting down, queues may be closed
+            pass
+
+
+class _SlabArray(np.ndarray):
+    # NOTE: numpy array subclass to carry the slab lease, DenseTensor
+    # set with zero_copy=True keeps a reference to the array, so the
+    # lease lives exactly as long as the tensor data is in use
+    pass
+
+
+class _SharedMemorySlabPool:
+    """
+    A pool of pre-allocated, recycled shared memory slabs for the
+    multi-process DataLoader.
+
+    Workers acquire a free slab, copy collated numpy arrays into it and
+    put a :code:`_SlabBatch` descriptor into the result queue instead of
+    pickling the arrays. The main process wraps slab memory as tensors
+    without copying, and the slab is recycled once these tensors are
+    released.
+
+    Args:
+        num_slabs(int): number of slabs in the pool.
+        slab_size(int): size of each slab in bytes.
+        free_queue(multiprocessing.Queue): queue of free slab ids shared
+            between the main process and workers.
+    """
+
+    def __init__(self, num_slabs, slab_size, free_queue):
+        assert num_slabs > 0, "num_slabs should be a positive value"
+        assert slab_size > 0, "slab_size should be a positive value"
+        self._slab_size = _align(slab_size)
+        self._free_queue = free_queue
+
+        prefix = f"paddle_dataloader_slab_{os.getpid()}_{uuid.uuid4().hex}"
+        self._paths = []
+        for i in range(num_slabs):
+            path = os.path.join(_shm_dir(), f"{prefix}_{i}")
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_RDWR, 0o600)
+            try:
+                os.ftruncate(fd, self._slab_size)
+            finally:
+                os.close(fd)
+            _live_slab_files.add(path)
+            self._paths.append(path)
+            self._free_queue.put(i)
+
+        self._buffers = {}
+        self._closed = False
+
+    def __getstate__(self):
+        # only paths and queue are sent to workers, slabs are mapped lazily
+        return {
+            '_slab_size': self._slab_size,
+            '_free_queue': self._free_queue,
+            '_paths': self._paths,
+            '_closed': self._closed,
+        }
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._buffers = {}
+
+    def __len__(self):
+        return len(self._paths)
+
+    @property
+    def slab_size(self):
+        return self._slab_size
+
+    def _buffer(self, slab_id):
+        buf = self._buffers.get(slab_id)
+        if buf is None:
+            fd = os.open(self._paths[slab_id], os.O_RDWR)
+            try:
+                buf = mmap.mmap(fd, self._slab_size)
+            finally:
+                os.close(fd)
+            self._buffers[slab_id] = buf
+        return buf
+
+    def _release(self, slab_id):
+        if not self._closed:
+            self._free_queue.put(slab_id)
+
+    def write(self, arrays):
+        """
+        Copy arrays into a free slab, called in worker processes.
+
+        Returns:
+            _SlabBatch|None: the slab descriptor, or None if no slab is
+            free now or the arrays do not fit in one slab, in which case
+            the caller should fall back to the normal transport.
+        """
+        if not all(isinstance(a, np.ndarray) for a in arrays):
+            return None
+        if any(a.dtype.hasobject for a in arrays):
+            return None
+        if sum(_align(a.nbytes) for a in arrays) > self._slab_size:
+            return None
+
+        try:
+            slab_id = self._free_queue.get_nowait()
+        except queue.Empty:
+            return None
+
+        buf = self._buffer(slab_id)
+        metas = []
+        offset = 0
+        for arr in arrays:
+            dst = np.ndarray(
+                arr.shape, dtype=arr.dtype, buffer=buf, offset=offset
+            )
+            np.copyto(dst, arr, casting='no')
+            metas.append((offset, arr.shape, arr.dtype.str))
+            offset += _align(arr.nbytes)
+        return _SlabBatch(slab_id, metas)
+
+    def read(self, slab_batch):
+        """
+        Wrap a slab written by workers as numpy arrays without copying,
+        called in the main process. The slab is recycled when all the
+        returned arrays are released.
+        """
+        buf = self._buffer(slab_batch.slab_id)
+        lease = _SlabLease(self, slab_batch.slab_id)
+        arrays = []
+        for offset, shape, dtype in slab_batch.metas:
+            arr = np.ndarray(
+                shape, dtype=np.dtype(dtype), buffer=buf, offset=offset
+            ).view(_SlabArray)
+            arr._slab_lease = lease
+            arrays.append(arr)
+        return arrays
+
+    def close(self):
+        """
+        Unlink all slab files, mapped memory is released by the OS after
+        all tensors on it are released.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        for path in self._paths:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+            _live_slab_files.discard(path)
+        # NOTE: do not close mmap here, tensors wrapped on it may still
+        # be in use, mmap is unmapped when it is garbage collected
+        self._buffers = {}
@@ -0,0 +1,192 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+# worker id used for batches loaded in main process, i.e. single-process
+# DataLoader
+MAIN_PROCESS_WORKER_ID = -1
+
+
+class _WorkerStats:
+    """
+    Timing of a batch sent from workers to the main process along with
+    the batch data, only sent if DataLoader stats is enabled.
+    """
+
+    def __init__(self, worker_id, fetch_time, collate_time):
+        self.worker_id = worker_id
+        self.fetch_time = fetch_time
+        self.collate_time = collate_time
+
+
+class DataLoaderStats:
+    """
+    Per-stage timing and queue depth metrics of :code:`paddle.io.DataLoader`
+    pipeline, collected if DataLoader is created with
+    :attr:`enable_stats=True` and got by :code:`DataLoader.stats`.
+
+    Following metrics are recorded, times are in seconds:
+
+    - workers: for each worker, the batch number, total time of reading
+      samples from dataset (:code:`fetch_time`) and total time of
+      :attr:`collate_fn` (:code:`collate_time`). Batches loaded in the
+      main process in single-process mode are recorded with worker id -1.
+    - reader: in the reading thread, total time blocked waiting for batches
+      from workers (:code:`get_data_time`), and total time converting
+      batches to DenseTensor and pushing them into the blocking queue
+      (:code:`push_time`), which includes the host to device copy if
+      :attr:`use_buffer_reader` is False, and blocking on a full queue.
+    - consumer: total time blocked in :code:`__next__` reading a batch
+      (:code:`wait_time`), which includes the host to device copy if the
+      copy is not finished by the buffered reader in advance.
+    - queues: average and max depth of the blocking queue, of outstanding
+      batches sent to workers and of batches waiting to be reordered,
+      sampled at each :code:`__next__`.
+
+    These stages are also recorded as :code:`paddle.profiler.RecordEvent`
+    ranges in the main process, which show in :code:`paddle.profiler`
+    timelines.
+
+    Examples:
+
+        .. code-block:: python
+
+            >>> import numpy as np
+            >>> from paddle.io import Dataset, DataLoader
+
+            >>> class RandomDataset(Dataset):  # type: ignore[type-arg]
+            ...     def __getitem__(self, idx):
+            ...         return np.random.random([8]).astype('float32')
+            ...
+            ...     def __len__(self):
+            ...         return 16
+            ...
+            >>> loader = DataLoader(RandomDataset(), batch_size=4, enable_stats=True)
+            >>> for data in loader:
+            ...     pass
+            >>> summary = loader.stats.summary()
+            >>> print(summary['consumer']['batches'])
+            4
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """
+        Clear all recorded metrics.
+        """
+        with self._lock:
+            self._workers = {}
+            self._get_data_time = 0.0
+            self._push_time = 0.0
+            self._pushed_batches = 0
+            self._wait_time = 0.0
+            self._consumed_batches = 0
+            self._queue_depths = {
+                'blocking_queue': [0, 0],
+                'outstanding': [0, 0],
+                'reorder': [0, 0],
+            }
+
+    def record_worker(self, worker_id, fetch_time, collate_time):
+        with self._lock:
+            record = self._workers.setdefault(worker_id, [0, 0.0, 0.0])
+            record[0] += 1
+            record[1] += fetch_time
+            record[2] += collate_time
+
+    def record_get_data(self, wait_time):
+        with self._lock:
+            self._get_data_time += wait_time
+
+    def record_push(self, push_time):
+        with self._lock:
+            self._push_time += push_time
+            self._pushed_batches += 1
+
+    def record_next(self, wait_time, **queue_depths):
+        with self._lock:
+            self._wait_time += wait_time
+            self._consumed_batches += 1
+            for name, depth in queue_depths.items():
+                record = self._queue_depths[name]
+                record[0] += depth
+                record[1] = max(record[1], depth)
+
+    def summary(self):
+        """
+        Get recorded metrics.
+
+        Returns:
+            dict: metrics of each stage, see :code:`DataLoaderStats`.
+        """
+        with self._lock:
+            consumed = max(self._consumed_batches, 1)
+            return {
+                'workers': {
+                    worker_id: {
+                        'batches': batches,
+                        'fetch_time': fetch_time,
+                        'collate_time': collate_time,
+                    }
+                    for worker_id, (
+                        batches,
+                        fetch_time,
+                        collate_time,
+                    ) in sorted(self._workers.items())
+                },
+                'reader': {
+                    'batches': self._pushed_batches,
+                    'get_data_time': self._get_data_time,
+                    'push_time': self._push_time,
+                },
+                'consumer': {
+                    'batches': self._consumed_batches,
+                    'wait_time': self._wait_time,
+                },
+                'queues': {
+                    name: {'avg': total / consumed, 'max': max_depth}
+                    for name, (total, max_depth) in self._queue_depths.items()
+                },
+            }
+
+    def __str__(self):
+        summary = self.summary()
+        lines = ["DataLoader stats:"]
+        for worker_id, record in summary['workers'].items():
+            name = 'main' if worker_id == MAIN_PROCESS_WORKER_ID else worker_id
+            lines.append(
+                f"  worker {name}: batches {record['batches']}, "
+                f"fetch {record['fetch_time']:.4f}s, "
+                f"collate {record['collate_time']:.4f}s"
+            )
+        reader = summary['reader']
+        lines.append(
+            f"  reader: batches {reader['batches']}, "
+            f"get_data {reader['get_data_time']:.4f}s, "
+            f"push {reader['push_time']:.4f}s"
+        )
+        consumer = summary['consumer']
+        lines.append(
+            f"  consumer: batches {consumer['batches']}, "
+            f"wait {consumer['wait_time']:.4f}s"
+        )
+        for name, record in summary['queues'].items():
+            lines.append(
+                f"  queue {name}: avg {record['avg']:.2f}, max {record['max']}"
+            )
+        return "\n".join(lines)
@@ -16,6 +16,7 @@ from __future__ import annotations
 import os
 import queue
 import sys
+import time
 import traceback
 from typing import TYPE_CHECKING, Any
 
@@ -29,8 +30,10 @@ from ..multiprocess_utils import (
     CleanupFuncRegistrar,
     _cleanup_mmap,
 )
+from .collate import CachedCollateFn
 from .fetcher import _IterableDatasetFetcher, _MapDatasetFetcher
 from .flat import _flatten_batch
+from .stats import _WorkerStats
 
 if TYPE_CHECKING:
     from paddle.io import Dataset
@@ -293,6 +296,9 @@ def _worker_loop(
     use_shared_memory,
     base_seed,
     shm_cache_size=0,
+    slab_pool=None,
+    enable_stats=False,
+    iterable_skip=0,
 ):
     try:
         # NOTE: [ mmap files clear ] When the child process exits unexpectedly,
@@ -327,6 +333,12 @@ def _worker_loop(
             seed=base_seed,
         )
 
+        # NOTE: batches are serialized asynchronously by the feeder thread
+        # of out_queue if not using shared memory, output buffers of
+        # collate_fn may be overwritten before sent and cannot be reused
+        if not use_shared_memory and isinstance(collate_fn, CachedCollateFn):
+            collate_fn.reuse_buffers = False
+
         init_exception = None
         try:
             if init_fn is not None:
@@ -334,6 +346,10 @@ def _worker_loop(
             fetcher = _DatasetKind.create_fetcher(
                 dataset_kind, dataset, auto_collate_batch, collate_fn, drop_last
             )
+            # skip samples this worker produced before DataLoader resumed
+            # from state_dict, only for iterable dataset
+            if iterable_skip > 0:
+                fetcher.skip(iterable_skip)
         except:
             init_exception = _WorkerException(worker_id)
 
@@ -349,9 +365,17 @@ def _worker_loop(
             if isinstance(data, _ResumeIteration):
                 out_queue.put((data, None, None))
                 iterator_drained = False
-                fetcher = _DatasetKind.create_fetcher(
-                    dataset_kind, dataset, auto_collate_batch, collate_fn, True
-                )
+                # NOTE: only iterable dataset needs a new fetcher to create
+                # a new dataset iterator, map-style dataset fetcher is
+                # stateless and reused among epochs
+                if dataset_kind == _DatasetKind.ITER:
+                    fetcher = _DatasetKind.create_fetcher(
+                        dataset_kind,
+                        dataset,
+                        auto_collate_batch,
+                        collate_fn,
+                        drop_last,
+                    )
                 continue
 
             # None as poison piil, so worker event should be set
@@ -376,8 +400,21 @@ def _worker_loop(
                     #       may copy CPU tensor to GPU even if users want to use
                     #       CPU tensor operation, so we add CPUPlace guard here
                     #       to make sure tensor will be operated only on CPU
+                    fetch_start = time.perf_counter()
                     with paddle.base.dygraph.guard(place=paddle.CPUPlace()):
                         batch = fetcher.fetch(indices)
+                    if enable_stats:
+                        # NOTE: timing is sent before the batch, so it has
+                        # been recorded when the batch is read out
+                        out_queue.put(
+                            _WorkerStats(
+                                worker_id,
+                                time.perf_counter()
+                                - fetch_start
+                                - fetcher.collate_time,
+                                fetcher.collate_time,
+                            )
+                        )
             except Exception as e:
                 if (
                     isinstance(e, StopIteration)
@@ -391,7 +428,15 @@ def _worker_loop(
                 if isinstance(batch, _WorkerException):
                     out_queue.put((idx, batch, None))
                 batch, structure = _flatten_batch(batch)
-                if use_shared_memory:
+                # NOTE: write batch into a shared memory slab and only send
+                # slab descriptor if slab pool is enabled, fall back to the
+                # following transport if no slab free or batch not fit
+                slab_batch = (
+                    slab_pool.write(batch) if slab_pool is not None else None
+                )
+                if slab_batch is not None:
+                    out_queue.put((idx, slab_batch, structure))
+                elif use_shared_memory:
 
                     def numpy2lodtensor(arr):
                         lodtensor = core.DenseTensor()
@@ -19,6 +19,7 @@ import multiprocessing
 import sys
 import time
 import warnings
+import weakref
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -38,12 +39,14 @@ from ..base.framework import (
 )
 from ..framework import core, in_dynamic_mode
 from .dataloader import BatchSampler, IterableDataset, Subset
+from .dataloader.adaptive import _parse_adaptive_prefetch
 from .dataloader.batch_sampler import _InfiniteIterableSampler
 from .dataloader.dataloader_iter import (
     _DataLoaderIterMultiProcess,
     _DataLoaderIterSingleProcess,
     _DatasetKind,
 )
+from .dataloader.stats import DataLoaderStats
 
 if TYPE_CHECKING:
     import numbers
@@ -357,7 +360,37 @@ class DataLoader:
         worker_init_fn(Callable|None, optional): init function which will be called with
             worker id on each subprocess starting if not set as None. Default
             None.
-        persistent_workers(bool, optional): whether to keep the workers in the DataLoader. Default False.
+        persistent_workers(bool, optional): whether to keep the workers in the DataLoader.
+            If True, worker processes, their queues and the reading thread are
+            created once and kept alive among epochs, each new epoch only resumes
+            workers and sends sampler indices to them, which saves re-spawning
+            workers and re-initializing datasets in workers. Only one iterator of
+            the DataLoader can be used at a time in this mode. Default False.
+        shm_slab_size(int, optional): size in bytes of each pre-allocated shared
+            memory slab used to transfer batches from workers. If set as a
+            positive number, workers copy collated numpy arrays into a pool
+            of recycled shared memory slabs and only send slab descriptors
+            to the main process, which wraps slab memory as tensors without
+            copying. Batches which do not fit in one slab fall back to the
+            normal transport. Only enabled in multi-process mode(num_workers
+            > 0). Default 0, which means not using slabs.
+        adaptive_prefetch(bool|dict, optional): whether to adjust in-flight
+            batches and active workers at runtime in multi-process mode. The
+            DataLoader measures the time blocked in reading each batch against
+            the step time, and the time waiting for workers, then prefetches
+            more batches or activates more workers if training waits for data,
+            and releases them if not. :attr:`prefetch_factor` and
+            :attr:`num_workers` are used as upper bounds. It can be a dict to
+            set ``min_prefetch_factor`` (default 1), ``min_num_workers``
+            (default 1), ``interval`` (batch number of a measuring window,
+            default 20), ``starve_ratio`` (default 0.05) and ``idle_ratio``
+            (default 0.005). Only supported for map-style dataset. Default False.
+        enable_stats(bool, optional): whether to record per-stage timing and
+            queue depth metrics of the loading pipeline, e.g. fetch and collate
+            time of each worker, time blocked waiting for workers and time
+            blocked in reading each batch. Metrics are got by
+            :code:`DataLoader.stats`, and stages are also recorded as
+            :code:`paddle.profiler.RecordEvent` ranges. Default False.
 
     Returns:
         DataLoader: an iterable object for data iterating, each element of the generated data is a Tensor.
@@ -441,6 +474,8 @@ class DataLoader:
     dataset_kind: _DatasetKind
     use_shared_memory: bool
     timeout: int
+    shm_slab_size: int
+    adaptive_prefetch: dict[str, float] | None
     batch_sampler: BatchSampler | _InfiniteIterableSampler | None
     drop_last: bool
     auto_collate_batch: bool
@@ -463,6 +498,9 @@ class DataLoader:
         timeout: int = 0,
         worker_init_fn: Callable[[int], None] | None = None,
         persistent_workers: bool = False,
+        shm_slab_size: int = 0,
+        adaptive_prefetch: bool | dict[str, float] = False,
+        enable_stats: bool = False,
     ) -> None:
         self.return_list = return_list
         self.collate_fn = collate_fn
@@ -506,6 +544,15 @@ class DataLoader:
         assert timeout >= 0, "timeout should be a non-negative value"
         self.timeout = timeout
 
+        assert (
+            shm_slab_size >= 0
+        ), "shm_slab_size should be a non-negative value"
+        self.shm_slab_size = shm_slab_size if num_workers > 0 else 0
+
+        self.adaptive_prefetch = _parse_adaptive_prefetch(adaptive_prefetch)
+
+        self._stats = DataLoaderStats() if enable_stats else None
+
         if isinstance(dataset, IterableDataset):
             self.dataset_kind = _DatasetKind.ITER
             if shuffle:
@@ -558,8 +605,19 @@ class DataLoader:
 
         self._persistent_workers = persistent_workers
         self._iterator = None
+        # state to resume the next iterator from, see load_state_dict
+        self._resume_state = None
+        self._last_iterator = None
         self.num_workers = AuToTune(self).__call__()
 
+    @property
+    def stats(self) -> DataLoaderStats | None:
+        """
+        Pipeline metrics of the DataLoader, None if :attr:`enable_stats`
+        is False, see :code:`paddle.io.dataloader.stats.DataLoaderStats`.
+        """
+        return self._stats
+
     def __len__(self) -> int:
         if self.dataset_kind == _DatasetKind.ITER:
             raise ValueError("length of IterableDataset not supported")
@@ -571,15 +629,80 @@ class DataLoader:
 
     def __iter__(self) -> _DataLoaderIterBase:
         if self.num_workers == 0:
-            return _DataLoaderIterSingleProcess(self)
+            iterator = _DataLoaderIterSingleProcess(self)
         elif self._persistent_workers:
-            if self._iterator is None:
+            # workers need to skip consumed samples from start on resuming,
+            # so persistent workers are restarted to load state
+            if self._iterator is not None and self._resume_state is not None:
+                self._iterator._try_shutdown_all()
+            if self._iterator is None or self._iterator._shutdown:
                 self._iterator = _DataLoaderIterMultiProcess(self)
             else:
                 self._iterator._reset()
-            return self._iterator
+            iterator = self._iterator
         else:
-            return _DataLoaderIterMultiProcess(self)
+            iterator = _DataLoaderIterMultiProcess(self)
+        self._last_iterator = weakref.ref(iterator)
+        return iterator
 
     def __call__(self) -> _DataLoaderIterBase:
         return self.__iter__()
+
+    def state_dict(self) -> dict[str, Any]:
+        """
+        Get the position of the latest created iterator in current epoch,
+        including consumed batch number, the state of batch sampler (e.g.
+        random state to draw the same shuffled indices) and consumed batch
+        number of each worker for IterableDataset. It should be called
+        while the iterator is alive, e.g. inside the iterating loop.
+
+        Returns:
+            dict: the iterator state, empty if no iterator is alive.
+
+        Examples:
+
+            .. code-block:: python
+
+                >>> import numpy as np
+                >>> from paddle.io import Dataset, DataLoader
+
+                >>> class RandomDataset(Dataset):  # type: ignore[type-arg]
+                ...     def __getitem__(self, idx):
+                ...         return np.array([idx]).astype('int64')
+                ...
+                ...     def __len__(self):
+                ...         return 10
+                ...
+                >>> loader = DataLoader(RandomDataset(), batch_size=2, shuffle=True)
+                >>> for i, data in enumerate(loader):
+                ...     if i == 1:
+                ...         state = loader.state_dict()
+                ...         break
+                >>> print(state['consumed_batches'])
+                2
+
+                >>> # resume in a new DataLoader, e.g. after restarting
+                >>> loader = DataLoader(RandomDataset(), batch_size=2, shuffle=True)
+                >>> loader.load_state_dict(state)
+                >>> print(len([data for data in loader]))
+                3
+        """
+        iterator = self._last_iterator() if self._last_iterator else None
+        if iterator is None:
+            return {}
+        return iterator.state_dict()
+
+    def load_state_dict(self, state_dict: dict[str, Any]) -> None:
+        """
+        Load state got by :code:`state_dict`, the next iterator of the
+        DataLoader resumes from the batch after the consumed ones of the
+        saved epoch. Consumed batches are skipped by fast-forwarding
+        sampler indices without reading samples for map-style dataset,
+        and each worker skips samples it produced before from its own
+        dataset iterator without collating for IterableDataset, which
+        requires the same :attr:`num_workers`.
+
+        Args:
+            state_dict(dict): state got by :code:`state_dict`.
+        """
+        self._resume_state = state_dict or None
@@ -21,8 +21,15 @@ from .api import (
     save,
     to_static,
 )
+from .cache_budget import cache_stats, set_cache_budget
 from .dy2static.logging_utils import set_code_level, set_verbosity
 from .dy2static.program_translator import enable_to_static
+from .dy2static.shape_bucket import ShapeBucketPolicy
+from .input_signatures import (
+    record_input_signatures,
+    save_input_signatures,
+    warmup,
+)
 from .translated_layer import TranslatedLayer
 
 __all__ = [
@@ -35,4 +42,10 @@ __all__ = [
     'set_verbosity',
     'not_to_static',
     'enable_to_static',
+    'set_cache_budget',
+    'cache_stats',
+    'ShapeBucketPolicy',
+    'record_input_signatures',
+    'save_input_signatures',
+    'warmup',
 ]
@@ -78,6 +78,7 @@ from .dy2static.program_translator import (
     SymbolicStaticFunction,
     unwrap_decorators,
 )
+from .dy2static.shape_bucket import ShapeBucketPolicy
 from .pir_translated_layer import PIR_INFER_MODEL_SUFFIX, PirTranslatedLayer
 from .translated_layer import (
     INFER_MODEL_SUFFIX,
@@ -181,6 +182,7 @@ def _check_and_set_backend(backend, build_strategy):
 class _ToStaticOptions(TypedDict):
     property: NotRequired[bool]
     full_graph: NotRequired[bool]
+    bucket_policy: NotRequired[ShapeBucketPolicy | None]
 
 
 class _ToStaticDecorator(Protocol):
@@ -238,6 +240,11 @@ def to_static(
     If the decorated function calls other dynamic graph function, the called one
     will be converted into static graph function as well.
 
+    If the environment variable TO_STATIC_CACHE_DIR is set, the transformed ASTs
+    of functions are cached in the directory and reused by other processes. It
+    only affects the AST mode (`full_graph=True`), since the SOT mode does not
+    transform ASTs.
+
     Args:
         function (callable): Callable dynamic graph function. If it used as a
             decorator, the decorated function will be parsed as this parameter.
@@ -252,7 +259,9 @@ def to_static(
             None. When backend is `CINN`, CINN compiler will be used to speed up
             training and inference.
         kwargs: Support keys including `property`, set `property` to True if the function
-            is python property.
+            is python property. And `bucket_policy`, set it to a `paddle.jit.ShapeBucketPolicy`
+            to pad input tensors of variable lengths to buckets, which bounds the number of
+            translated programs.
 
     Returns:
         Tensor(s): containing the numerical result.
@@ -281,6 +290,13 @@ def to_static(
     """
     property = kwargs.get("property", False)
     full_graph = kwargs.get("full_graph", None)
+    bucket_policy = kwargs.get("bucket_policy", None)
+    if bucket_policy is not None and not isinstance(
+        bucket_policy, ShapeBucketPolicy
+    ):
+        raise TypeError(
+            f"Required type(bucket_policy) shall be `paddle.jit.ShapeBucketPolicy`, but received {type(bucket_policy).__name__}"
+        )
 
     def decorated(python_func):
         """
@@ -315,6 +331,7 @@ def to_static(
                 build_strategy=build_strategy,
                 property=property,
                 backend=backend,
+                bucket_policy=bucket_policy,
             ),
         )
 
@@ -0,0 +1,299 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import collections
+import itertools
+import sys
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any
+
+from paddle.utils.environments import IntegerEnvironmentVariable
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+__all__ = []
+
+# 0 means no limit
+ENV_TO_STATIC_CACHE_MAX_ENTRIES = IntegerEnvironmentVariable(
+    "TO_STATIC_CACHE_MAX_ENTRIES", 0
+)
+ENV_TO_STATIC_CACHE_MAX_BYTES = IntegerEnvironmentVariable(
+    "TO_STATIC_CACHE_MAX_BYTES", 0
+)
+
+# NOTE: the memory of a program is estimated by its op number, the size of
+# parameters is not counted since they are owned by layers
+ESTIMATED_OP_BYTES = 1024
+
+PROGRAM_CACHE = "program_cache"
+SOT_CACHE = "sot_cache"
+
+
+def estimate_program_bytes(program) -> int:
+    """
+    Estimate the memory of a program, for both PIR and legacy programs.
+    """
+    if hasattr(program, 'num_ops'):
+        num_ops = program.num_ops()
+    else:
+        num_ops = sum(len(block.ops) for block in program.blocks)
+    return num_ops * ESTIMATED_OP_BYTES
+
+
+def estimate_code_bytes(code) -> int:
+    """
+    Estimate the memory of a code object generated by SOT.
+    """
+    if code is None:
+        return 0
+    return (
+        sys.getsizeof(code)
+        + len(code.co_code)
+        + sum(sys.getsizeof(const) for const in code.co_consts)
+    )
+
+
+class CacheBudget:
+    """
+    A global budget of entries of the program caches of to_static and the
+    code caches of SOT. Entries are evicted in LRU order when the entry
+    number or the estimated bytes exceeds the limits. The most recently
+    used entry of each cache instance is never evicted, since it may be
+    used without lookup, e.g. by :code:`paddle.jit.save` through
+    :code:`ProgramCache.last`, so the limits may be exceeded by the number
+    of cache instances. An entry is removed from its cache by calling
+    :code:`owner.evict(key)`.
+
+    Args:
+        max_entries(int, optional): the max number of entries, 0 means no
+            limit. Default 0.
+        max_bytes(int, optional): the max estimated bytes of entries, 0
+            means no limit. Default 0.
+    """
+
+    def __init__(self, max_entries: int = 0, max_bytes: int = 0):
+        self._lock = threading.RLock()
+        # {(owner_id, key): (cache_name, nbytes)}
+        self._entries = collections.OrderedDict()
+        # {owner_id: weakref of owner}
+        self._owners = {}
+        # {owner_id: key of the most recently used entry}
+        self._recent_keys = {}
+        self._owner_ids = itertools.count()
+        self._bytes = 0
+        self._stats = collections.defaultdict(
+            lambda: {'hits': 0, 'misses': 0, 'evictions': 0}
+        )
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 or self.max_bytes > 0
+
+    def register_owner(self, owner: Any) -> int:
+        """
+        Return an id of a cache instance for its entries, entries of the
+        owner are discarded when it is garbage collected.
+        """
+        with self._lock:
+            owner_id = next(self._owner_ids)
+            self._owners[owner_id] = weakref.ref(owner)
+        weakref.finalize(owner, self._unregister_owner, owner_id)
+        return owner_id
+
+    def _unregister_owner(self, owner_id):
+        with self._lock:
+            self.discard_owner(owner_id)
+            self._owners.pop(owner_id, None)
+            self._recent_keys.pop(owner_id, None)
+
+    def set_limits(
+        self, max_entries: int | None = None, max_bytes: int | None = None
+    ) -> None:
+        with self._lock:
+            if max_entries is not None:
+                self.max_entries = max_entries
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            self._shrink()
+
+    def hit(self, cache_name: str, owner_id: int, key: Hashable) -> None:
+        with self._lock:
+            self._stats[cache_name]['hits'] += 1
+            if (owner_id, key) in self._entries:
+                self._entries.move_to_end((owner_id, key))
+                self._recent_keys[owner_id] = key
+
+    def miss(self, cache_name: str) -> None:
+        with self._lock:
+            self._stats[cache_name]['misses'] += 1
+
+    def add(
+        self,
+        cache_name: str,
+        owner_id: int,
+        key: Hashable,
+        nbytes: int,
+    ) -> None:
+        """
+        Add an entry of nbytes estimated bytes, and evict entries if the
+        budget is exceeded.
+        """
+        with self._lock:
+            self._remove((owner_id, key))
+            self._entries[(owner_id, key)] = (cache_name, nbytes)
+            self._bytes += nbytes
+            self._recent_keys[owner_id] = key
+            self._shrink()
+
+    def remove(self, owner_id: int, key: Hashable) -> None:
+        with self._lock:
+            self._remove((owner_id, key))
+
+    def discard_owner(self, owner_id: int) -> None:
+        """
+        Remove all entries of a cache instance, e.g. when it is cleared.
+        """
+        with self._lock:
+            for entry_key in [k for k in self._entries if k[0] == owner_id]:
+                self._remove(entry_key)
+
+    def _remove(self, entry_key):
+        entry = self._entries.pop(entry_key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+            owner_id, key = entry_key
+            if self._recent_keys.get(owner_id) == key:
+                del self._recent_keys[owner_id]
+        return entry
+
+    def _exceeded(self):
+        return (
+            self.max_entries > 0 and len(self._entries) > self.max_entries
+        ) or (self.max_bytes > 0 and self._bytes > self.max_bytes)
+
+    def _shrink(self):
+        while self._exceeded():
+            for entry_key in self._entries:
+                owner_id, key = entry_key
+                if self._recent_keys.get(owner_id) != key:
+                    break
+            else:
+                # only the most recently used entries of owners are left
+                return
+            cache_name, _ = self._remove(entry_key)
+            self._stats[cache_name]['evictions'] += 1
+            owner = self._owners[owner_id]()
+            if owner is not None:
+                owner.evict(key)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            result = {
+                name: dict(stats, entries=0, bytes=0)
+                for name, stats in self._stats.items()
+            }
+            for cache_name, nbytes in self._entries.values():
+                stats = result.setdefault(
+                    cache_name,
+                    {
+                        'hits': 0,
+                        'misses': 0,
+                        'evictions': 0,
+                        'entries': 0,
+                        'bytes': 0,
+                    },
+                )
+                stats['entries'] += 1
+                stats['bytes'] += nbytes
+            return result
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+_CACHE_BUDGET = CacheBudget(
+    ENV_TO_STATIC_CACHE_MAX_ENTRIES.get(), ENV_TO_STATIC_CACHE_MAX_BYTES.get()
+)
+
+
+def get_cache_budget() -> CacheBudget:
+    return _CACHE_BUDGET
+
+
+def set_cache_budget(
+    max_entries: int | None = None, max_bytes: int | None = None
+) -> None:
+    """
+    Set the global budget of the caches of translated programs of
+    :code:`paddle.jit.to_static`, including the program caches of the AST
+    mode and the code caches of the SOT mode. When the budget is exceeded,
+    the least recently used entries are evicted and translated again when
+    they are used next time. The default budget is set by the environment
+    variables TO_STATIC_CACHE_MAX_ENTRIES and TO_STATIC_CACHE_MAX_BYTES.
+
+    Note:
+        The budget is shared by all functions, but the most recently used
+        program of each function is never evicted, so that it can still be
+        saved by :code:`paddle.jit.save` without :attr:`input_spec`. Thus
+        the cached entries may exceed the budget by the number of
+        functions.
+
+    Args:
+        max_entries(int|None, optional): the max number of cached entries,
+            0 means no limit, None means unchanged. Default None.
+        max_bytes(int|None, optional): the max estimated bytes of cached
+            entries, 0 means no limit, None means unchanged. Default None.
+
+    Examples:
+        .. code-block:: python
+
+            >>> import paddle
+            >>> paddle.jit.set_cache_budget(max_entries=100)
+    """
+    for name, value in (('max_entries', max_entries), ('max_bytes', max_bytes)):
+        if value is not None and (not isinstance(value, int) or value < 0):
+            raise ValueError(
+                f"{name} should be a non-negative integer, but received {value}"
+            )
+    _CACHE_BUDGET.set_limits(max_entries, max_bytes)
+
+
+def cache_stats() -> dict[str, dict[str, int]]:
+    """
+    Return the statistics of the caches of translated programs of
+    :code:`paddle.jit.to_static`, which is a dict of cache names
+    ('program_cache' of the AST mode and 'sot_cache' of the SOT mode) to
+    dicts of 'hits', 'misses', 'evictions', 'entries' and 'bytes'.
+
+    Returns:
+        dict, the statistics of caches.
+
+    Examples:
+        .. code-block:: python
+
+            >>> import paddle
+            >>> net = paddle.jit.to_static(paddle.nn.Linear(2, 2), full_graph=True)
+            >>> out = net(paddle.rand([1, 2]))
+            >>> stats = paddle.jit.cache_stats()
+            >>> print(stats['program_cache']['entries'])
+            1
+    """
+    return _CACHE_BUDGET.stats()
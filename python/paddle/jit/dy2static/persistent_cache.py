@@ -0,0 +1,160 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# This file implements the on-disk cache of transformed ASTs, which is
+# enabled by setting the environment variable TO_STATIC_CACHE_DIR. The
+# transformed AST of a function is saved as:
+#
+#   <cache_dir>/v<version>/<key[:2]>/<key>.pkl
+#
+# in which key is the sha1 of the format version, the python, paddle and gast
+# versions, the transformation options, and the source code and location of
+# the function.
+# The pickled AST holds the origin info of the function, so it is only
+# reused for the same source code at the same location.
+#
+# NOTE: only the AST transformation of the AST mode (full_graph=True) is
+# cached, the SOT mode does not transform ASTs. Programs and SOT compiled
+# codes hold live objects of the process, e.g. parameters and guards on
+# python objects, so they are still built in each process.
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+import tempfile
+
+import paddle
+from paddle.framework import use_pir_api
+from paddle.utils import gast
+from paddle.utils.environments import StringEnvironmentVariable
+
+from . import logging_utils
+
+__all__ = []
+
+PERSISTENT_CACHE_VERSION = 1
+
+ENV_TO_STATIC_CACHE_DIR = StringEnvironmentVariable("TO_STATIC_CACHE_DIR", "")
+
+
+def _func_location(func):
+    try:
+        filepath = inspect.getsourcefile(func)
+    except TypeError:
+        filepath = None
+    code = getattr(func, '__code__', None)
+    lineno = code.co_firstlineno if code is not None else None
+    return filepath, lineno
+
+
+class PersistentAstCache:
+    """
+    The on-disk cache of transformed ASTs, shared by processes.
+
+    Args:
+        cache_dir(str): the root directory of the cache.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+
+    @staticmethod
+    def key(func, source_code):
+        """
+        Return the cache key of a function with its dedent source code.
+        """
+        filepath, lineno = _func_location(func)
+        key = repr(
+            (
+                PERSISTENT_CACHE_VERSION,
+                # NOTE: pickled gast nodes depend on the ast module of the
+                # interpreter and the gast version, gast is vendored in
+                # paddle.utils, so it may have no version but the paddle one
+                tuple(sys.version_info),
+                getattr(gast, '__version__', None),
+                paddle.__version__,
+                getattr(paddle.version, 'commit', None),
+                use_pir_api(),
+                os.environ.get('FLAGS_optim_transformation'),
+                filepath,
+                lineno,
+                source_code,
+            )
+        )
+        return hashlib.sha1(key.encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(
+            self.cache_dir,
+            f'v{PERSISTENT_CACHE_VERSION}',
+            key[:2],
+            f'{key}.pkl',
+        )
+
+    def load(self, key):
+        """
+        Return the cached AST root, or None if it is not cached.
+        """
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            # NOTE: a broken cache file is treated as missing, it will be
+            # overwritten after the function is transformed again
+            logging_utils.warn(
+                f"Failed to load the transformed AST from {path}: {e}"
+            )
+            return None
+
+    def save(self, key, root):
+        """
+        Save the transformed AST root, errors are warned and ignored since
+        the cache is only an optimization.
+        """
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # NOTE: the file is written to a temporary file which is renamed
+            # at last, so readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(root, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        except Exception as e:
+            logging_utils.warn(
+                f"Failed to save the transformed AST to {path}: {e}"
+            )
+
+
+def get_persistent_ast_cache():
+    """
+    Return the on-disk AST cache in the directory given by the environment
+    variable TO_STATIC_CACHE_DIR, or None if it is not set. It is only used
+    by the AST mode (full_graph=True).
+    """
+    cache_dir = ENV_TO_STATIC_CACHE_DIR.get()
+    if not cache_dir:
+        return None
+    return PersistentAstCache(os.path.expanduser(cache_dir))
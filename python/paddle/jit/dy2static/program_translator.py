@@ -40,6 +40,15 @@ from paddle.pir import Value
 from paddle.pir.core import _convert_into_value, static_op_arg_cast_guard
 from paddle.utils import flatten, gast
 
+from ..cache_budget import (
+    PROGRAM_CACHE,
+    estimate_program_bytes,
+    get_cache_budget,
+)
+from ..input_signatures import (
+    is_recording_input_signatures,
+    record_input_signature,
+)
 from . import error, logging_utils
 from .function_spec import (
     FunctionSpec,
@@ -53,6 +62,7 @@ from .origin_info import (
     update_op_callstack_with_origin_info,
 )
 from .partial_program import PartialProgramLayer, PartialProgramLayerHook
+from .persistent_cache import get_persistent_ast_cache
 from .pir_partial_program import (
     PartialProgramLayer as PirPartialProgramLayer,
     PartialProgramLayerHook as PirPartialProgramLayerHook,
@@ -221,9 +231,7 @@ class FunctionCache:
         if source_code in self._code_to_ast_caches:
             root = self._code_to_ast_caches[source_code]
         else:
-            root = gast.parse(source_code)
-            root = attach_origin_info(root, func)
-            root = self._dygraph_to_static.get_static_ast(root)
+            root = self._transform(func, source_code)
             self._code_to_ast_caches[source_code] = root
 
         # Get static function from AST
@@ -232,6 +240,26 @@ class FunctionCache:
         create_and_update_origin_info_map(root, static_func)
         return static_func
 
+    def _transform(self, func, source_code):
+        """
+        Transforms the source code of func into the static AST, which is
+        loaded from or saved to the on-disk cache if TO_STATIC_CACHE_DIR is
+        set, so that other processes skip the transformation.
+        """
+        persistent_cache = get_persistent_ast_cache()
+        if persistent_cache is not None:
+            key = persistent_cache.key(func, source_code)
+            root = persistent_cache.load(key)
+            if root is not None:
+                return root
+
+        root = gast.parse(source_code)
+        root = attach_origin_info(root, func)
+        root = self._dygraph_to_static.get_static_ast(root)
+        if persistent_cache is not None:
+            persistent_cache.save(key, root)
+        return root
+
     def exist(self, func):
         return func in self._converted_static_func_caches
 
@@ -433,6 +461,9 @@ class StaticFunction(Generic[_InputT, _RetT]):
         self._cuda_graph_capture_mode = ""
         self._cuda_graph_pool_id = 0
         self._property = kwargs.get("property", False)
+        self._bucket_policy = kwargs.get("bucket_policy", None)
+        # {json string: input signature} recorded for paddle.jit.warmup
+        self._input_signatures = {}
         # Note: Record the patched method name for rollback.
         self._patched_name = None
         self._get_debug_name()
@@ -554,7 +585,24 @@ class StaticFunction(Generic[_InputT, _RetT]):
                 "following API: paddle.disable_static()."
             )
 
-        return self._perform_call(*args, **kwargs)
+        if self._bucket_policy is not None:
+            # NOTE: inputs are padded to bucket lengths to reuse programs
+            # translated for the buckets, see ShapeBucketPolicy
+            args, kwargs, origin_lengths = self._bucket_policy.pad_inputs(
+                self.dygraph_function, args, kwargs
+            )
+
+        if is_recording_input_signatures():
+            record_input_signature(
+                self, args, kwargs, is_train=self._is_train_mode()
+            )
+
+        outputs = self._perform_call(*args, **kwargs)
+        if self._bucket_policy is not None:
+            return self._bucket_policy.slice_outputs_back(
+                outputs, origin_lengths
+            )
+        return outputs
 
     def _is_train_mode(self) -> bool:
         if self.class_instance is not None:
@@ -591,6 +639,13 @@ class StaticFunction(Generic[_InputT, _RetT]):
         if self.is_property:
             raise RuntimeError("Can not call the func when property=True.")
 
+    def _warmup(self, args, kwargs, is_train):
+        """
+        Translate the function ahead of time for the inputs, used by
+        paddle.jit.warmup.
+        """
+        raise NotImplementedError("Not implemented yet.")
+
     def get_concrete_program(
         self, *args: _InputT.args, **kwargs: _InputT.kwargs
     ) -> tuple[ConcreteProgram, PirPartialProgramLayer]:
@@ -807,6 +862,11 @@ class SymbolicStaticFunction(StaticFunction):
             args = (self.class_instance, *args)
         return traced_fun(*args, **kwargs)
 
+    def _warmup(self, args, kwargs, is_train):
+        # NOTE: SOT translates the function while running it, so the
+        # function is called with the inputs
+        self(*args, **kwargs)
+
     @property
     def code(self):
         raise_error_template("code")()
@@ -892,6 +952,12 @@ class ASTStaticFunction(StaticFunction[_InputT, _RetT]):
                 )
                 raise e
 
+    def _warmup(self, args, kwargs, is_train):
+        # NOTE: the same as _perform_call, so the programs are cached with
+        # the same keys as the calls, but not run
+        args, kwargs = self._function_spec.unified_args_and_kwargs(args, kwargs)
+        self.get_concrete_program(*args, **kwargs, is_train=is_train)
+
     def get_concrete_program(
         self, *args: _InputT.args, **kwargs: _InputT.kwargs
     ) -> tuple[ConcreteProgram, PirPartialProgramLayer]:
@@ -1615,6 +1681,11 @@ class PirAutoRecomputeHooker(PirPartialProgramLayerHook):
         return whole_program, forward_end_idx, src_vars
 
 
+# NOTE: programs are built on the global main program and unique name
+# generator, so the builds of all program caches are serialized.
+_BUILD_LOCK = threading.RLock()
+
+
 class ProgramCache:
     """
     Wrapper class for the program functions defined by dygraph function.
@@ -1626,6 +1697,9 @@ class ProgramCache:
         # trace mostly recent used program
         self._recent_key = None
         self._recent_cache_key = None
+        # NOTE: programs are evicted in LRU order by the global cache budget,
+        # see paddle.jit.set_cache_budget
+        self._owner_id = get_cache_budget().register_owner(self)
 
     def _build_once(self, cache_key):
         # TODO(Aurelius84): Need a gloabl FLAGS to enable/disable to_prim
@@ -1694,8 +1768,25 @@ class ProgramCache:
         item_id = hash(item)
         self._recent_cache_key = item
         self._recent_key = item_id
-        if item_id not in self._caches:
+        cache_budget = get_cache_budget()
+        if item_id in self._caches:
+            cache_budget.hit(PROGRAM_CACHE, self._owner_id, item_id)
+            return self._caches[item_id]
+
+        with _BUILD_LOCK:
+            # NOTE: the program may be built by another thread, e.g. by
+            # paddle.jit.warmup, while waiting for the lock
+            if item_id in self._caches:
+                cache_budget.hit(PROGRAM_CACHE, self._owner_id, item_id)
+                return self._caches[item_id]
+            cache_budget.miss(PROGRAM_CACHE)
             self._caches[item_id] = self._build_once(item)
+            cache_budget.add(
+                PROGRAM_CACHE,
+                self._owner_id,
+                item_id,
+                estimate_program_bytes(self._caches[item_id][0].main_program),
+            )
             # Note: raise warnings if number of traced program is more than `max_tracing_count`
             current_tracing_count = len(self._caches)
             if current_tracing_count > MAX_TRACED_PROGRAM_COUNT:
@@ -1703,11 +1794,11 @@ class ProgramCache:
                     f"Current traced program number: {current_tracing_count} > `max_tracing_count`:{MAX_TRACED_PROGRAM_COUNT}. Too much cached programs will bring expensive overhead. "
                     "The reason may be: (1) passing tensors with different shapes, (2) passing python objects instead of tensors."
                 )
-
-        return self._caches[item_id]
+            return self._caches[item_id]
 
     def get_program_without_cache(self, cache_key):
-        return self._build_once(cache_key=cache_key)
+        with _BUILD_LOCK:
+            return self._build_once(cache_key=cache_key)
 
     def get_program(self, item):
         if not isinstance(item, CacheKey):
@@ -1734,8 +1825,12 @@ class ProgramCache:
     def concrete_programs(self):
         return [cp for key, (cp, _) in self._caches.items()]
 
+    def evict(self, item_id):
+        self._caches.pop(item_id, None)
+
     def clear(self):
         self._caches = collections.OrderedDict()
+        get_cache_budget().discard_owner(self._owner_id)
 
 
 class PrimHooker(PartialProgramLayerHook):
@@ -0,0 +1,228 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import bisect
+import inspect
+from typing import TYPE_CHECKING, Any
+
+import paddle
+from paddle.utils import flatten, map_structure, pack_sequence_as
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+__all__ = []
+
+
+class ShapeBucketPolicy:
+    """
+    The shape bucketing policy of :code:`paddle.jit.to_static`, which bounds
+    the number of programs translated for inputs of variable lengths, e.g.
+    sequence lengths of NLP models.
+
+    The lengths of the input tensors along :attr:`axis` are rounded up to
+    buckets, and the tensors are padded with :attr:`pad_value` to the bucket
+    lengths before calling the static function, so that only one program is
+    translated for each bucket. Outputs are returned as the function returns
+    them, i.e. of the bucket lengths, unless :attr:`output_axes` names the
+    axes of outputs aligned with the padded inputs, which are sliced back to
+    the lengths of the inputs.
+
+    Note:
+        The padded positions are seen by the function, so it should not be
+        changed by padding, e.g. by masking padded positions, or ignoring
+        them in reductions along :attr:`axis`.
+
+    Args:
+        axis(int, optional): the axis of the variable length of input
+            tensors. Default 1.
+        buckets(list[int]|None, optional): the sorted bucket lengths. If
+            None, lengths are rounded up to powers of two. Lengths larger
+            than the last bucket are not padded. Default None.
+        pad_value(float|int, optional): the value to pad. Default 0.
+        input_names(list[str]|None, optional): the names of arguments to
+            pad, all tensor arguments which have :attr:`axis` are padded if
+            it is None. Default None.
+        output_axes(list[int|None]|None, optional): the axes to slice of the
+            flattened outputs, in which None means an output is not sliced,
+            e.g. ``[1, None]`` for a function returning a sequence output
+            and a pooled output. If None, no output is sliced. Default None.
+
+    Examples:
+        .. code-block:: python
+
+            >>> # doctest: +SKIP('`paddle.jit.to_static` can not run in xdoctest')
+            >>> import paddle
+
+            >>> @paddle.jit.to_static(
+            ...     full_graph=True,
+            ...     bucket_policy=paddle.jit.ShapeBucketPolicy(
+            ...         axis=1, output_axes=[1]
+            ...     ),
+            ... )
+            ... def func(x):
+            ...     return x * 2
+            ...
+            >>> out = func(paddle.ones([2, 5]))
+            >>> print(out.shape)
+            [2, 5]
+            >>> # translated only once for lengths 5 to 8
+            >>> out = func(paddle.ones([2, 7]))
+    """
+
+    def __init__(
+        self,
+        axis: int = 1,
+        buckets: Sequence[int] | None = None,
+        pad_value: float = 0,
+        input_names: Sequence[str] | None = None,
+        output_axes: Sequence[int | None] | None = None,
+    ) -> None:
+        if not isinstance(axis, int):
+            raise TypeError(f"axis should be an int, but received {axis}")
+        if buckets is not None:
+            buckets = list(buckets)
+            if not buckets or any(
+                not isinstance(b, int) or b <= 0 for b in buckets
+            ):
+                raise ValueError(
+                    f"buckets should be a non-empty list of positive integers, but received {buckets}"
+                )
+            if buckets != sorted(set(buckets)):
+                raise ValueError(
+                    f"buckets should be sorted in increasing order, but received {buckets}"
+                )
+        if output_axes is not None:
+            output_axes = list(output_axes)
+            if any(
+                a is not None and not isinstance(a, int) for a in output_axes
+            ):
+                raise TypeError(
+                    f"output_axes should be a list of int or None, but received {output_axes}"
+                )
+        self.axis = axis
+        self.buckets = buckets
+        self.pad_value = pad_value
+        self.input_names = (
+            None if input_names is None else frozenset(input_names)
+        )
+        self.output_axes = output_axes
+
+    def bucket_length(self, length: int) -> int:
+        """
+        Return the bucket length of a length.
+        """
+        if length <= 0:
+            return length
+        if self.buckets is None:
+            return 1 << (length - 1).bit_length()
+        index = bisect.bisect_left(self.buckets, length)
+        if index == len(self.buckets):
+            return length
+        return self.buckets[index]
+
+    @staticmethod
+    def _tensor_axis(x, axis):
+        # the non-negative axis of a tensor, or None if it is not bucketed
+        if not isinstance(x, paddle.Tensor) or not (-x.ndim <= axis < x.ndim):
+            return None
+        return axis % x.ndim
+
+    def _pad(self, x, lengths):
+        axis = self._tensor_axis(x, self.axis)
+        if axis is None:
+            return x
+        length = x.shape[axis]
+        bucket = self.bucket_length(length)
+        lengths.setdefault(bucket, set()).add(length)
+        if bucket == length:
+            return x
+        pad_shape = list(x.shape)
+        pad_shape[axis] = bucket - length
+        # NOTE: full_like creates the padding on the place of x, the slice
+        # along axis is not empty since length > 0 here.
+        padding = paddle.full_like(
+            paddle.slice(x, axes=[axis], starts=[0], ends=[1]), self.pad_value
+        ).expand(pad_shape)
+        return paddle.concat([x, padding], axis=axis)
+
+    def pad_inputs(
+        self, function: Callable[..., Any], args: tuple, kwargs: dict
+    ) -> tuple[tuple, dict, dict[int, int]]:
+        """
+        Pad the input tensors, return the padded args and kwargs, and a dict
+        of bucket lengths to the original lengths, in which the bucket
+        lengths of different original lengths are not included.
+        """
+        lengths: dict[int, set[int]] = {}
+
+        def pad(x):
+            return self._pad(x, lengths)
+
+        if self.input_names is None:
+            args, kwargs = map_structure(pad, (args, kwargs))
+            args = tuple(args)
+        else:
+            bound = inspect.signature(function).bind_partial(*args, **kwargs)
+            for name in self.input_names & bound.arguments.keys():
+                bound.arguments[name] = map_structure(
+                    pad, bound.arguments[name]
+                )
+            args, kwargs = bound.args, bound.kwargs
+
+        # NOTE: a bucket length is ambiguous if inputs of different lengths
+        # are padded to it, outputs of it are not sliced
+        origin_lengths = {
+            bucket: next(iter(origins))
+            for bucket, origins in lengths.items()
+            if len(origins) == 1 and bucket not in origins
+        }
+        return args, kwargs, origin_lengths
+
+    def slice_outputs_back(self, outputs, origin_lengths: dict[int, int]):
+        """
+        Slice the outputs named by :attr:`output_axes` back to the original
+        lengths.
+        """
+        if self.output_axes is None or not origin_lengths:
+            return outputs
+
+        flat_outputs = flatten(outputs)
+        if len(flat_outputs) != len(self.output_axes):
+            raise ValueError(
+                f"The number of output_axes should be equal to the number of outputs {len(flat_outputs)}, but received {self.output_axes}"
+            )
+
+        def unpad(x, axis):
+            axis = None if axis is None else self._tensor_axis(x, axis)
+            if axis is None:
+                return x
+            # NOTE: outputs of an ambiguous bucket length are not sliced
+            length = origin_lengths.get(x.shape[axis])
+            if length is None:
+                return x
+            return paddle.slice(x, axes=[axis], starts=[0], ends=[length])
+
+        return pack_sequence_as(
+            outputs,
+            [unpad(x, axis) for x, axis in zip(flat_outputs, self.output_axes)],
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"ShapeBucketPolicy(axis={self.axis}, buckets={self.buckets}, "
+            f"pad_value={self.pad_value}, output_axes={self.output_axes})"
+        )
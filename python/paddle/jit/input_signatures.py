@@ -0,0 +1,315 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import concurrent.futures
+import json
+import os
+import tempfile
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+import paddle
+from paddle.utils.environments import BooleanEnvironmentVariable
+
+if TYPE_CHECKING:
+    from paddle.nn import Layer
+
+    from .dy2static.program_translator import StaticFunction
+
+__all__ = []
+
+INPUT_SIGNATURES_VERSION = 1
+
+# NOTE: the number of recorded signatures of a function is bounded, since
+# inputs of unbounded shapes would make both the manifest and the warmup
+# unbounded, see ShapeBucketPolicy to bound the shapes.
+MAX_RECORDED_SIGNATURES = 256
+
+ENV_TO_STATIC_RECORD_INPUT_SIGNATURES = BooleanEnvironmentVariable(
+    "TO_STATIC_RECORD_INPUT_SIGNATURES", False
+)
+
+_record_input_signatures = ENV_TO_STATIC_RECORD_INPUT_SIGNATURES.get()
+
+
+class _UnsupportedInput(Exception):
+    pass
+
+
+def _encode(value):
+    if isinstance(value, paddle.Tensor):
+        return {
+            "__tensor__": {
+                "shape": list(value.shape),
+                "dtype": paddle.base.data_feeder.convert_dtype(value.dtype),
+                "stop_gradient": value.stop_gradient,
+            }
+        }
+    if isinstance(value, np.ndarray):
+        return {
+            "__ndarray__": {
+                "shape": list(value.shape),
+                "dtype": str(value.dtype),
+            }
+        }
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, list):
+        return [_encode(v) for v in value]
+    if isinstance(value, tuple):
+        return {"__tuple__": [_encode(v) for v in value]}
+    if isinstance(value, dict) and all(isinstance(k, str) for k in value):
+        return {"__dict__": {k: _encode(v) for k, v in value.items()}}
+    raise _UnsupportedInput(type(value).__name__)
+
+
+def _decode(value):
+    if isinstance(value, list):
+        return [_decode(v) for v in value]
+    if not isinstance(value, dict):
+        return value
+    if "__tensor__" in value:
+        meta = value["__tensor__"]
+        tensor = paddle.zeros(meta["shape"], dtype=meta["dtype"])
+        tensor.stop_gradient = meta["stop_gradient"]
+        return tensor
+    if "__ndarray__" in value:
+        meta = value["__ndarray__"]
+        return np.zeros(meta["shape"], dtype=meta["dtype"])
+    if "__tuple__" in value:
+        return tuple(_decode(v) for v in value["__tuple__"])
+    return {k: _decode(v) for k, v in value["__dict__"].items()}
+
+
+def is_recording_input_signatures() -> bool:
+    return _record_input_signatures
+
+
+def record_input_signature(
+    static_function: StaticFunction, args: tuple, kwargs: dict, is_train: bool
+) -> None:
+    """
+    Record the shapes and dtypes of tensors and the values of other inputs
+    of a call, calls with inputs which can not be saved to json, e.g. Layer
+    objects, are not recorded.
+    """
+    signatures = static_function._input_signatures
+    if len(signatures) >= MAX_RECORDED_SIGNATURES:
+        return
+    try:
+        signature = {
+            "args": _encode(list(args)),
+            "kwargs": _encode(kwargs),
+            "is_train": is_train,
+        }
+    except _UnsupportedInput:
+        return
+    signatures.setdefault(json.dumps(signature, sort_keys=True), signature)
+
+
+def _get_static_function(name, function):
+    from .dy2static.program_translator import StaticFunction
+
+    if isinstance(function, paddle.nn.Layer):
+        function = function.forward
+    if not isinstance(function, StaticFunction):
+        raise TypeError(
+            f"functions['{name}'] should be a function or Layer decorated by "
+            f"`paddle.jit.to_static`, but received {type(function)}"
+        )
+    return function
+
+
+def record_input_signatures(enable: bool = True) -> None:
+    """
+    Enable or disable recording the input signatures of functions decorated
+    by :code:`paddle.jit.to_static`, i.e. the shapes and dtypes of input
+    tensors and the values of other inputs, which can be saved by
+    :ref:`api_paddle_jit_save_input_signatures` and used to translate the
+    functions ahead of time by :ref:`api_paddle_jit_warmup`. The default
+    value is set by the environment variable
+    TO_STATIC_RECORD_INPUT_SIGNATURES.
+
+    Args:
+        enable(bool, optional): whether to record input signatures.
+            Default True.
+
+    Examples:
+        .. code-block:: python
+
+            >>> import paddle
+            >>> paddle.jit.record_input_signatures(True)
+    """
+    global _record_input_signatures
+    _record_input_signatures = bool(enable)
+
+
+def save_input_signatures(
+    functions: dict[str, StaticFunction | Layer], path: str
+) -> None:
+    """
+    Save the recorded input signatures of functions decorated by
+    :code:`paddle.jit.to_static` into a json manifest, see
+    :ref:`api_paddle_jit_record_input_signatures`.
+
+    Args:
+        functions(dict[str, StaticFunction|Layer]): the functions or layers
+            decorated by :code:`paddle.jit.to_static`, the keys are the
+            names of them in the manifest.
+        path(str): the path of the manifest.
+
+    Examples:
+        .. code-block:: python
+
+            >>> # doctest: +SKIP('`paddle.jit.to_static` can not run in xdoctest')
+            >>> import paddle
+            >>> paddle.jit.record_input_signatures(True)
+            >>> net = paddle.jit.to_static(paddle.nn.Linear(4, 4), full_graph=True)
+            >>> for batch_size in [1, 8]:
+            ...     out = net(paddle.rand([batch_size, 4]))
+            >>> paddle.jit.save_input_signatures({'net': net}, 'signatures.json')
+    """
+    manifest = {"version": INPUT_SIGNATURES_VERSION, "functions": {}}
+    for name, function in functions.items():
+        static_function = _get_static_function(name, function)
+        manifest["functions"][name] = list(
+            static_function._input_signatures.values()
+        )
+
+    dirname = os.path.dirname(os.path.abspath(path))
+    os.makedirs(dirname, exist_ok=True)
+    # NOTE: the manifest may be saved periodically by a serving process,
+    # write a temporary file and rename it so readers never see a partial file
+    fd, tmp_path = tempfile.mkstemp(dir=dirname)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(manifest, f, indent=1)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load_input_signatures(path: str) -> dict[str, list[dict[str, Any]]]:
+    with open(path) as f:
+        manifest = json.load(f)
+    if manifest.get("version") != INPUT_SIGNATURES_VERSION:
+        raise ValueError(
+            f"The version of input signatures in {path} should be "
+            f"{INPUT_SIGNATURES_VERSION}, but received {manifest.get('version')}"
+        )
+    return manifest["functions"]
+
+
+def _warmup_signatures(tasks):
+    from .dy2static import logging_utils
+
+    num_warmed = 0
+    for name, static_function, args, kwargs, is_train in tasks:
+        try:
+            static_function._warmup(args, kwargs, is_train)
+            num_warmed += 1
+        except Exception as e:
+            # NOTE: warmup is only an optimization, a failed signature is
+            # translated again when it is called
+            logging_utils.warn(f"Failed to warm up '{name}': {e}")
+    return num_warmed
+
+
+def warmup(
+    functions: dict[str, StaticFunction | Layer],
+    path: str,
+    background: bool = True,
+) -> concurrent.futures.Future[int] | int:
+    """
+    Translate functions decorated by :code:`paddle.jit.to_static` ahead of
+    time for the input signatures saved by
+    :ref:`api_paddle_jit_save_input_signatures`, so that the first calls of
+    the recorded input signatures do not pay the translation cost, e.g. at
+    the startup of a serving process.
+
+    For the AST mode (:code:`full_graph=True`), the programs are built for
+    inputs of zeros without running them. For the SOT mode, the functions
+    are called with inputs of zeros in the current thread, so they should
+    not have side effects, and signatures recorded in a different training
+    mode from the current one are skipped.
+
+    Note:
+        Programs are built one by one since they are built on the global
+        program and name generator of Paddle. If :attr:`background` is True,
+        wait for the returned future before calling the functions, since
+        calls at the same time with warmup are also serialized.
+
+    Args:
+        functions(dict[str, StaticFunction|Layer]): the functions or layers
+            decorated by :code:`paddle.jit.to_static`, the keys are the
+            names of them in the manifest.
+        path(str): the path of the manifest.
+        background(bool, optional): whether to build the programs of the AST
+            mode in a background thread. Default True.
+
+    Returns:
+        Future[int]|int, the number of warmed up signatures, or a future of
+        it if :attr:`background` is True.
+
+    Examples:
+        .. code-block:: python
+
+            >>> # doctest: +SKIP('`paddle.jit.to_static` can not run in xdoctest')
+            >>> import paddle
+            >>> net = paddle.jit.to_static(paddle.nn.Linear(4, 4), full_graph=True)
+            >>> future = paddle.jit.warmup({'net': net}, 'signatures.json')
+            >>> num_warmed = future.result()
+    """
+    from .dy2static.program_translator import SymbolicStaticFunction
+
+    signatures = load_input_signatures(path)
+    sot_tasks, ast_tasks = [], []
+    for name, function in functions.items():
+        static_function = _get_static_function(name, function)
+        is_sot = isinstance(static_function, SymbolicStaticFunction)
+        for signature in signatures.get(name, []):
+            if is_sot and (
+                signature["is_train"] != static_function._is_train_mode()
+            ):
+                continue
+            # NOTE: inputs are created in the current thread, only programs
+            # are built in the background thread
+            task = (
+                name,
+                static_function,
+                tuple(_decode(signature["args"])),
+                _decode(signature["kwargs"]),
+                signature["is_train"],
+            )
+            (sot_tasks if is_sot else ast_tasks).append(task)
+
+    # NOTE: the frame evaluation hook of SOT is shared by all threads of the
+    # interpreter, so SOT functions are only warmed up in the current thread
+    num_warmed = _warmup_signatures(sot_tasks)
+    if not background:
+        return num_warmed + _warmup_signatures(ast_tasks)
+
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="to_static_warmup"
+    )
+    try:
+        return executor.submit(
+            lambda: num_warmed + _warmup_signatures(ast_tasks)
+        )
+    finally:
+        executor.shutdown(wait=False)
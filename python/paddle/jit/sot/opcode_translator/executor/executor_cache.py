@@ -19,11 +19,17 @@ import traceback
 from typing import TYPE_CHECKING, List, Tuple
 
 from paddle.base.dygraph.base import sot_simulation_mode_guard
+from paddle.jit.cache_budget import (
+    SOT_CACHE,
+    estimate_code_bytes,
+    get_cache_budget,
+)
 
 from ...profiler import EventGuard, event_register
 from ...psdb import NO_FALLBACK_CODES
 from ...utils import (
     ENV_SOT_ALLOW_DYNAMIC_SHAPE,
+    ENV_SOT_ENABLE_GUARD_TREE,
     BreakGraphError,
     FallbackError,
     InnerError,
@@ -34,6 +40,7 @@ from ...utils import (
 )
 from ..custom_code import CustomCode
 from .guard import Guard
+from .guard_tree import GuardTree
 from .opcode_executor import OpcodeExecutor, OpcodeExecutorBase
 
 if TYPE_CHECKING:
@@ -51,21 +58,28 @@ class OpcodeExecutorCache(metaclass=Singleton):
     """
     A singleton class that implements a cache for translated instructions.
     This cache is used to store previously translated instructions along with their corresponding guard functions.
+    Entries are evicted in LRU order by the global cache budget, see `paddle.jit.set_cache_budget`. If the budget is
+    not set, at most MAX_CACHE_SIZE entries are cached for a code object. If SOT_ENABLE_GUARD_TREE is set, guards of
+    a code object are looked up by a GuardTree instead of one by one.
 
     Attributes:
         cache (dict): A dictionary that maps code objects to tuples of a cache getter function and a list of guarded functions.
         translate_count (int): The count of how many instructions have been translated. It is used to test whether the cache hits.
+        guard_trees (dict): A dictionary that maps code objects to the guard trees of their guarded functions, which are rebuilt after the guarded functions change.
     """
 
     MAX_CACHE_SIZE = 20
     cache: dict[types.CodeType, GuardedFunctions]
     translate_count: int
     code_symbolic_inputs: dict[types.CodeType, dict[str, None | dict[int, int]]]
+    guard_trees: dict[types.CodeType, GuardTree]
 
     def __init__(self):
         self.cache = {}
         self.translate_count = 0
         self.code_symbolic_inputs = {}
+        self.guard_trees = {}
+        self._owner_id = get_cache_budget().register_owner(self)
 
     def get_symbolic_inputs(
         self, code: types.CodeType
@@ -80,6 +94,41 @@ class OpcodeExecutorCache(metaclass=Singleton):
         self.cache.clear()
         self.translate_count = 0
         self.code_symbolic_inputs.clear()
+        self.guard_trees.clear()
+        get_cache_budget().discard_owner(self._owner_id)
+
+    def add_entry(
+        self,
+        code: types.CodeType,
+        custom_code: CustomCode,
+        guard_fn: Guard,
+    ):
+        """
+        Adds a guarded function of the code object, and accounts it in the global cache budget.
+        """
+        self.cache.setdefault(code, []).append((custom_code, guard_fn))
+        self.guard_trees.pop(code, None)
+        get_cache_budget().add(
+            SOT_CACHE,
+            self._owner_id,
+            (code, guard_fn),
+            estimate_code_bytes(custom_code.code),
+        )
+
+    def evict(self, key: tuple[types.CodeType, Guard]):
+        """
+        Removes a guarded function evicted by the global cache budget.
+        """
+        code, guard_fn = key
+        guarded_fns = self.cache.get(code)
+        if guarded_fns is None:
+            return
+        self.guard_trees.pop(code, None)
+        guarded_fns[:] = [
+            guarded_fn
+            for guarded_fn in guarded_fns
+            if guarded_fn[1] is not guard_fn
+        ]
 
     def dump_state(self):
         return {
@@ -92,14 +141,26 @@ class OpcodeExecutorCache(metaclass=Singleton):
         self.cache = state["cache"]
         self.translate_count = state["translate_count"]
         self.code_symbolic_inputs = state["code_symbolic_inputs"]
+        self.guard_trees.clear()
+        cache_budget = get_cache_budget()
+        cache_budget.discard_owner(self._owner_id)
+        for code, guarded_fns in self.cache.items():
+            for custom_code, guard_fn in guarded_fns:
+                cache_budget.add(
+                    SOT_CACHE,
+                    self._owner_id,
+                    (code, guard_fn),
+                    estimate_code_bytes(custom_code.code),
+                )
 
     def __call__(self, frame: types.FrameType, **kwargs) -> CustomCode:
         code: types.CodeType = frame.f_code
         if code not in self.cache:
             log(2, f"[Cache]: Firstly call {code}\n")
+            get_cache_budget().miss(SOT_CACHE)
             new_custom_code, guard_fn = self.translate(frame, **kwargs)
             assert guard_fn is not None
-            self.cache[code] = [(new_custom_code, guard_fn)]
+            self.add_entry(code, new_custom_code, guard_fn)
             return new_custom_code
         guarded_fns = self.cache[code]
         return self.lookup(frame, guarded_fns, **kwargs)
@@ -118,12 +179,29 @@ class OpcodeExecutorCache(metaclass=Singleton):
         Returns:
             CustomCode: The custom code object if a matching guard function is found, otherwise None.
         """
-
-        if len(guarded_fns) >= self.MAX_CACHE_SIZE:
-            log(2, "[Cache]: Exceed max cache size, skip it\n")
-            return CustomCode(None, False)
-
-        for custom_code, guard_fn in guarded_fns:
+        cache_budget = get_cache_budget()
+        if ENV_SOT_ENABLE_GUARD_TREE.get():
+            with EventGuard("lookup guard tree"):
+                index = self.get_guard_tree(frame.f_code, guarded_fns).lookup(
+                    frame
+                )
+            if index >= 0:
+                custom_code, guard_fn = guarded_fns[index]
+                log(
+                    2,
+                    f"[Cache]: Cache hit, Guard is \n{getattr(guard_fn, 'expr', 'None')}\n",
+                )
+                cache_budget.hit(
+                    SOT_CACHE, self._owner_id, (frame.f_code, guard_fn)
+                )
+                return custom_code
+            # all guards have been checked by the guard tree
+            guarded_fns_to_try = []
+        else:
+            # NOTE: guarded_fns may be changed by eviction while iterating
+            guarded_fns_to_try = list(guarded_fns)
+
+        for custom_code, guard_fn in guarded_fns_to_try:
             try:
                 with EventGuard("try guard"):
                     guard_result = guard_fn(frame)
@@ -132,6 +210,9 @@ class OpcodeExecutorCache(metaclass=Singleton):
                         2,
                         f"[Cache]: Cache hit, Guard is \n{getattr(guard_fn, 'expr', 'None')}\n",
                     )
+                    cache_budget.hit(
+                        SOT_CACHE, self._owner_id, (frame.f_code, guard_fn)
+                    )
                     return custom_code
                 else:
                     log_do(
@@ -156,11 +237,28 @@ class OpcodeExecutorCache(metaclass=Singleton):
                 continue
 
         log(2, "[Cache]: all guards missed\n")
+        cache_budget.miss(SOT_CACHE)
+        if not cache_budget.enabled and len(guarded_fns) >= self.MAX_CACHE_SIZE:
+            log(2, "[Cache]: Exceed max cache size, skip it\n")
+            return CustomCode(None, False)
+
         new_custom_code, guard_fn = self.translate(frame, **kwargs)
         if guard_fn is not None:
-            guarded_fns.append((new_custom_code, guard_fn))
+            self.add_entry(frame.f_code, new_custom_code, guard_fn)
         return new_custom_code
 
+    def get_guard_tree(
+        self, code: types.CodeType, guarded_fns: GuardedFunctions
+    ) -> GuardTree:
+        """
+        Returns the guard tree of the guarded functions of the code object, which is built when first used.
+        """
+        guard_tree = self.guard_trees.get(code)
+        if guard_tree is None or len(guard_tree) != len(guarded_fns):
+            guard_tree = GuardTree([guard_fn for _, guard_fn in guarded_fns])
+            self.guard_trees[code] = guard_tree
+        return guard_tree
+
     def before_translate_hook(self, frame: types.FrameType):
         if not ENV_SOT_ALLOW_DYNAMIC_SHAPE.get():
             return
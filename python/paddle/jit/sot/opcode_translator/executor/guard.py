@@ -135,6 +135,7 @@ def make_guard(stringified_guards: list[StringifiedExpression]) -> Guard:
             guard = lambda frame: True
             guard.expr = "lambda frame: True"
             guard.original_guard = guard
+            guard.stringified_guards = []
             return guard
 
         free_vars = union_free_vars(
@@ -152,6 +153,8 @@ def make_guard(stringified_guards: list[StringifiedExpression]) -> Guard:
         log(3, f"[Guard]: {inlined_guard_expr}\n")
         guard.inlined_expr = inlined_guard_expr
         guard.expr = guard_expr
+        # used to build the guard tree, see guard_tree.py
+        guard.stringified_guards = list(stringified_guards)
 
         assert callable(guard), "guard must be callable."
 
@@ -0,0 +1,217 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable
+
+from ...profiler import EventGuard
+from ...utils import log
+
+if TYPE_CHECKING:
+    import types
+
+    from .guard import Guard
+
+    GuardAtom = tuple[Any, Callable[[types.FrameType], Any]]
+
+# NOTE(guard tree): [How does the guard tree work?]
+# A guard made by `make_guard` is a conjunction of StringifiedExpressions,
+# which we call atoms here. Guards of the same code object usually share
+# most of their atoms, e.g. type and dtype checks, and only differ in a few
+# atoms, e.g. shape checks. So instead of evaluating the guards one by one,
+# we
+# 1. sort the atoms of each guard by the number of guards sharing it, so
+#    shared atoms come first. It is safe to reorder the atoms since each
+#    atom is a pure check, and an atom raising an error is treated as False.
+# 2. insert the sorted atoms of guards into a trie, in which paths of
+#    shared atoms are merged, and chains without branches are compressed.
+# 3. generate a function from the trie, which evaluates each atom at most
+#    once along the path and returns the index of the matched guard.
+#
+# If several guards match a frame, the returned one may be different from
+# the first one in order, which is fine since the code of any matched guard
+# is valid for the frame.
+
+# max depth of nested branches in one generated function, deeper subtrees
+# are generated as separate functions to keep the indentation bounded.
+MAX_BRANCH_DEPTH = 32
+
+
+def _compile_atom(expr: str, free_vars: dict[str, Any]):
+    atom_src = (
+        "def atom(frame):\n"
+        "    try:\n"
+        f"        return {expr}\n"
+        "    except Exception:\n"
+        "        return False\n"
+    )
+    namespace = dict(free_vars)
+    exec(atom_src, namespace)
+    return namespace["atom"]
+
+
+def get_guard_atoms(guard_fn: Guard) -> list[GuardAtom]:
+    """
+    Split a guard into a list of (key, atom_fn). Atoms with the same key are
+    the same check, they are compiled once for a guard and cached on it.
+    """
+    atoms = getattr(guard_fn, "guard_atoms", None)
+    if atoms is not None:
+        return atoms
+    stringified_guards = getattr(guard_fn, "stringified_guards", None)
+    if stringified_guards is None:
+        # an opaque guard is a single atom
+        atoms = [
+            (
+                ("guard", id(guard_fn)),
+                _compile_atom("guard(frame)", {"guard": guard_fn}),
+            )
+        ]
+    else:
+        atoms = []
+        for expr in stringified_guards:
+            # NOTE: the same expression string may refer to different free
+            # variables in different guards, so they are part of the key
+            key = (
+                expr.inlined_expr,
+                tuple(
+                    sorted(
+                        (name, id(value))
+                        for name, value in expr.free_vars.items()
+                    )
+                ),
+            )
+            atoms.append(
+                (key, _compile_atom(expr.inlined_expr, expr.free_vars))
+            )
+    try:
+        guard_fn.guard_atoms = atoms
+    except AttributeError:
+        pass
+    return atoms
+
+
+class _Node:
+    __slots__ = ("atoms", "children", "index")
+
+    def __init__(self, atoms):
+        # chain of (key, atom_fn) checked before entering this node
+        self.atoms = atoms
+        # {key of first atom: child node}
+        self.children: dict[Any, _Node] = {}
+        self.index: int | None = None
+
+    def compress(self):
+        for child in self.children.values():
+            while child.index is None and len(child.children) == 1:
+                (grandchild,) = child.children.values()
+                child.atoms = child.atoms + grandchild.atoms
+                child.children = grandchild.children
+                child.index = grandchild.index
+            child.compress()
+
+
+class GuardTree:
+    """
+    A decision tree of the guards of a code object, which finds the matched
+    guard in one pass and evaluates shared checks once.
+
+    Args:
+        guards (list[Guard]): the guards in lookup order.
+    """
+
+    def __init__(self, guards: list[Guard]):
+        with EventGuard("build guard tree"):
+            self.guards = list(guards)
+            guard_atoms = [get_guard_atoms(guard) for guard in self.guards]
+
+            counts: dict[Any, int] = {}
+            for atoms in guard_atoms:
+                for key in {key for key, _ in atoms}:
+                    counts[key] = counts.get(key, 0) + 1
+
+            self.root = _Node([])
+            for index, atoms in enumerate(guard_atoms):
+                atoms = sorted(atoms, key=lambda atom: -counts[atom[0]])
+                node = self.root
+                for atom in atoms:
+                    key = atom[0]
+                    if key not in node.children:
+                        node.children[key] = _Node([atom])
+                    node = node.children[key]
+                # the first guard wins if several guards have the same atoms
+                if node.index is None:
+                    node.index = index
+            self.root.compress()
+
+            self.num_atoms = len(counts)
+            self.lookup_fn = self._generate()
+            log(
+                3,
+                f"[GuardTree]: build guard tree of {len(self.guards)} guards "
+                f"with {self.num_atoms} unique checks\n",
+            )
+
+    def __len__(self):
+        return len(self.guards)
+
+    def lookup(self, frame: types.FrameType) -> int:
+        """
+        Return the index of the matched guard, or -1 if no guard matches.
+        """
+        return self.lookup_fn(frame)
+
+    def _generate(self):
+        namespace: dict[str, Any] = {}
+        atom_names: dict[Any, str] = {}
+        functions: list[list[str]] = []
+
+        def atom_name(atom):
+            key, fn = atom
+            if key not in atom_names:
+                atom_names[key] = f"__atom_{len(atom_names)}"
+                namespace[atom_names[key]] = fn
+            return atom_names[key]
+
+        def gen_function(node):
+            name = f"__node_{len(functions)}"
+            lines = [f"def {name}(frame):"]
+            functions.append(lines)
+            gen_node(node, lines, 1)
+            lines.append("    return -1")
+            return name
+
+        def gen_node(node, lines, depth):
+            indent = "    " * depth
+            if node.index is not None:
+                lines.append(f"{indent}return {node.index}")
+                return
+            for child in node.children.values():
+                cond = " and ".join(
+                    f"{atom_name(atom)}(frame)" for atom in child.atoms
+                )
+                lines.append(f"{indent}if {cond}:")
+                if child.index is None and depth >= MAX_BRANCH_DEPTH:
+                    child_fn = gen_function(child)
+                    lines.append(f"{indent}    __index = {child_fn}(frame)")
+                    lines.append(f"{indent}    if __index >= 0:")
+                    lines.append(f"{indent}        return __index")
+                else:
+                    gen_node(child, lines, depth + 1)
+
+        entry = gen_function(self.root)
+        source = "\n".join("\n".join(lines) for lines in functions)
+        exec(source, namespace)
+        return namespace[entry]
@@ -32,6 +32,7 @@ if TYPE_CHECKING:
     import numpy.typing as npt
 
     from paddle import Tensor
+    from paddle.distributed.communication.group import Group
 
 
 __all__ = []
@@ -41,6 +42,73 @@ def _is_numpy_(var):
     return isinstance(var, (np.ndarray, np.generic))
 
 
+def _check_metric_input(var, name):
+    # NOTE: Tensor inputs are not copied to host, metric states updated by
+    # them are kept as tensors on the same device, and only synchronized to
+    # host in accumulate
+    if not isinstance(var, paddle.Tensor) and not _is_numpy_(var):
+        raise ValueError(f"The '{name}' must be a numpy ndarray or Tensor.")
+    return var
+
+
+def _add_state(state, value):
+    """
+    Add the statistic value of a batch to the metric state, the state
+    becomes a tensor on the device of value if value is a Tensor.
+    """
+    if isinstance(value, paddle.Tensor):
+        if not isinstance(state, paddle.Tensor):
+            state = paddle.to_tensor(
+                state, dtype=value.dtype, place=value.place
+            )
+        return state + value
+    if isinstance(state, paddle.Tensor):
+        return state + paddle.to_tensor(
+            value, dtype=state.dtype, place=state.place
+        )
+    return state + value
+
+
+_STATE_REDUCE_TYPES = ('sum', 'min', 'max', 'concat')
+
+
+def _sync_state(value, reduce_type, group):
+    """
+    Reduce a metric state across ranks, the reduced state keeps the type
+    of value, i.e. Tensor, numpy ndarray, list or a scalar.
+    """
+    if reduce_type == 'concat':
+        # NOTE: concatenated states may have different lengths on ranks
+        if isinstance(value, paddle.Tensor):
+            local = value.numpy()
+        else:
+            local = value
+        gathered = []
+        paddle.distributed.all_gather_object(gathered, local, group=group)
+        if isinstance(local, list):
+            return [item for values in gathered for item in values]
+        merged = np.concatenate(gathered, axis=0)
+        if isinstance(value, paddle.Tensor):
+            return paddle.to_tensor(merged, place=value.place)
+        return merged
+
+    op = {
+        'sum': paddle.distributed.ReduceOp.SUM,
+        'min': paddle.distributed.ReduceOp.MIN,
+        'max': paddle.distributed.ReduceOp.MAX,
+    }[reduce_type]
+    if isinstance(value, paddle.Tensor):
+        paddle.distributed.all_reduce(value, op=op, group=group)
+        return value
+    tensor = paddle.to_tensor(np.asarray(value))
+    paddle.distributed.all_reduce(tensor, op=op, group=group)
+    if isinstance(value, np.ndarray):
+        return tensor.numpy()
+    if isinstance(value, (list, tuple)):
+        return type(value)(tensor.numpy().tolist())
+    return tensor.item()
+
+
 class Metric(metaclass=abc.ABCMeta):
     r"""
     Base class for metric, encapsulates metric logic and APIs
@@ -122,11 +190,98 @@ class Metric(metaclass=abc.ABCMeta):
             ...         self.total[i] += num_corrects
             ...         self.count[i] += num_samples
             ...     return accs
+
+    Advanced usage for distributed evaluation:
+
+    States of a metric can be declared by :code:`add_state` with how they
+    are reduced across ranks, then :code:`sync` reduces the declared states
+    of all ranks in place, so :code:`accumulate` returns the metric over the
+    samples of all ranks. Only the compact states are communicated, instead
+    of outputs and labels of all samples. :code:`paddle.Model` syncs metrics
+    which declare their states in distributed evaluation.
+
+        .. code-block:: python
+            :name: code-sync-example
+
+            >>> # doctest: +SKIP('run in distributed mode.')
+            >>> import paddle
+            >>> import paddle.distributed as dist
+            >>> dist.init_parallel_env()
+
+            >>> m = paddle.metric.Precision()
+            >>> m.update(paddle.to_tensor([0.9, 0.2]), paddle.to_tensor([1, 0]))
+            >>> m.sync()
+            >>> res = m.accumulate()
+            >>> # doctest: -SKIP
     """
 
+    # whether _update_on_device accepts Tensor inputs and keeps states on
+    # device, then paddle.Model with deferred logs updates it without
+    # fetching inputs to host in each step
+    _device_update = False
+
     def __init__(self) -> None:
         pass
 
+    def _update_on_device(self, *args: Any) -> Any:
+        # update states with Tensor inputs without synchronizing to host,
+        # only called for metrics of _device_update
+        return self.update(*args)
+
+    def add_state(
+        self,
+        name: str,
+        reduce_type: Literal['sum', 'min', 'max', 'concat'] = 'sum',
+    ) -> None:
+        """
+        Declare the attribute :attr:`name` as a state reduced across ranks
+        by :code:`sync`.
+
+        Args:
+            name (str): The attribute name of the state. The state can be a
+                Tensor, numpy ndarray, list or a scalar.
+            reduce_type (str, optional): How the state is reduced across ranks,
+                'sum', 'min' and 'max' are element-wise reductions, 'concat'
+                concatenates states of ranks along the first axis, which may
+                have different lengths. Default is 'sum'.
+        """
+        if reduce_type not in _STATE_REDUCE_TYPES:
+            raise ValueError(
+                f"reduce_type should be one of {_STATE_REDUCE_TYPES}, but "
+                f"got '{reduce_type}'."
+            )
+        # NOTE: set in __dict__ since subclasses may not call __init__
+        if '_reducible_states' not in self.__dict__:
+            self._reducible_states = {}
+        self._reducible_states[name] = reduce_type
+
+    def sync(self, group: Group | None = None) -> None:
+        """
+        Reduce the states declared by :code:`add_state` across ranks in
+        place, it should be called on all ranks of the group, then
+        :code:`accumulate` returns the metric over samples of all ranks.
+        States are reduced again if it is called again, so it should be
+        called once after all updates, before :code:`reset`.
+
+        Args:
+            group (Group|None, optional): The process group to reduce states.
+                Default is None, which means the global group.
+        """
+        states = self.__dict__.get('_reducible_states')
+        if not states:
+            raise RuntimeError(
+                f"{self.__class__.__name__} declares no state by add_state, "
+                "which can not be synced."
+            )
+        if paddle.distributed.get_world_size(group) <= 1:
+            return
+        for name, reduce_type in states.items():
+            setattr(
+                self,
+                name,
+                _sync_state(getattr(self, name), reduce_type, group),
+            )
+
     @abc.abstractmethod
     def reset(self) -> None:
         """
@@ -249,6 +404,8 @@ class Accuracy(Metric):
 
     """
 
+    _device_update = True
+
     topk: Sequence[int]
     maxk: int
 
@@ -264,6 +421,8 @@ class Accuracy(Metric):
         self.maxk = max(topk)
         self._init_name(name)
         self.reset()
+        self.add_state('total')
+        self.add_state('count')
 
     def compute(self, pred: Tensor, label: Tensor, *args: Any) -> Tensor:
         """
@@ -315,7 +474,22 @@ class Accuracy(Metric):
         for i, k in enumerate(self.topk):
             num_corrects = correct[..., :k].sum()
             accs.append(float(num_corrects) / num_samples)
-            self.total[i] += num_corrects
+            self.total[i] = _add_state(self.total[i], num_corrects)
+            self.count[i] += num_samples
+        accs = accs[0] if len(self.topk) == 1 else accs
+        return accs
+
+    def _update_on_device(
+        self, correct: Tensor, *args: Any
+    ) -> Tensor | list[Tensor]:
+        # the same as update, but the states are updated on the device of
+        # correct, and the accuracy of current step is returned as Tensor
+        num_samples = int(np.prod(correct.shape[:-1]))
+        accs = []
+        for i, k in enumerate(self.topk):
+            num_corrects = correct[..., :k].sum()
+            accs.append(num_corrects / num_samples)
+            self.total[i] = _add_state(self.total[i], num_corrects)
             self.count[i] += num_samples
         accs = accs[0] if len(self.topk) == 1 else accs
         return accs
@@ -417,16 +591,30 @@ class Precision(Metric):
             >>> model.fit(data, batch_size=16)
     """
 
-    tp: int
-    fp: int
+    _device_update = True
 
     def __init__(
         self, name: str = 'precision', *args: Any, **kwargs: Any
     ) -> None:
         super().__init__(*args, **kwargs)
-        self.tp = 0  # true positive
-        self.fp = 0  # false positive
         self._name = name
+        self.reset()
+        self.add_state('_tp')
+        self.add_state('_fp')
+
+    @property
+    def tp(self) -> int:
+        """
+        The number of true positive samples.
+        """
+        return int(self._tp)
+
+    @property
+    def fp(self) -> int:
+        """
+        The number of false positive samples.
+        """
+        return int(self._fp)
 
     def update(
         self,
@@ -436,42 +624,32 @@ class Precision(Metric):
         """
         Update the states based on the current mini-batch prediction results.
 
+        If the inputs are Tensors, the states are updated on the device of
+        inputs without synchronizing to host.
+
         Args:
-            preds (numpy.ndarray): The prediction result, usually the output
+            preds (numpy.ndarray|Tensor): The prediction result, usually the output
                 of two-class sigmoid function. It should be a vector (column
                 vector or row vector) with data type: 'float64' or 'float32'.
-            labels (numpy.ndarray): The ground truth (labels),
+            labels (numpy.ndarray|Tensor): The ground truth (labels),
                 the shape should keep the same as preds.
                 The data type is 'int32' or 'int64'.
         """
-        if isinstance(preds, paddle.Tensor):
-            preds = np.array(preds)
-        elif not _is_numpy_(preds):
-            raise ValueError("The 'preds' must be a numpy ndarray or Tensor.")
-
-        if isinstance(labels, paddle.Tensor):
-            labels = np.array(labels)
-        elif not _is_numpy_(labels):
-            raise ValueError("The 'labels' must be a numpy ndarray or Tensor.")
-
-        sample_num = labels.shape[0]
-        preds = np.floor(preds + 0.5).astype("int32")
-
-        for i in range(sample_num):
-            pred = preds[i]
-            label = labels[i]
-            if pred == 1:
-                if pred == label:
-                    self.tp += 1
-                else:
-                    self.fp += 1
+        preds = _check_metric_input(preds, 'preds').flatten()
+        labels = _check_metric_input(labels, 'labels').flatten()
+
+        # predictions rounded to 1, same as floor(preds + 0.5) == 1
+        pred_pos = (preds >= 0.5) & (preds < 1.5)
+        tp = (pred_pos & (labels == 1)).astype('int64').sum()
+        self._tp = _add_state(self._tp, tp)
+        self._fp = _add_state(self._fp, pred_pos.astype('int64').sum() - tp)
 
     def reset(self) -> None:
         """
         Resets all of the metric state.
         """
-        self.tp = 0
-        self.fp = 0
+        self._tp = 0  # true positive
+        self._fp = 0  # false positive
 
     def accumulate(self) -> float:
         """
@@ -480,8 +658,9 @@ class Precision(Metric):
         Returns:
             A scaler float: results of the calculated precision.
         """
-        ap = self.tp + self.fp
-        return float(self.tp) / ap if ap != 0 else 0.0
+        tp, fp = self.tp, self.fp
+        ap = tp + fp
+        return float(tp) / ap if ap != 0 else 0.0
 
     def name(self) -> str:
         """
@@ -558,14 +737,28 @@ class Recall(Metric):
             >>> model.fit(data, batch_size=16)
     """
 
-    tp: int
-    fn: int
+    _device_update = True
 
     def __init__(self, name: str = 'recall', *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
-        self.tp = 0  # true positive
-        self.fn = 0  # false negative
         self._name = name
+        self.reset()
+        self.add_state('_tp')
+        self.add_state('_fn')
+
+    @property
+    def tp(self) -> int:
+        """
+        The number of true positive samples.
+        """
+        return int(self._tp)
+
+    @property
+    def fn(self) -> int:
+        """
+        The number of false negative samples.
+        """
+        return int(self._fn)
 
     def update(
         self,
@@ -575,35 +768,26 @@ class Recall(Metric):
         """
         Update the states based on the current mini-batch prediction results.
 
+        If the inputs are Tensors, the states are updated on the device of
+        inputs without synchronizing to host.
+
         Args:
-            preds(numpy.array): prediction results of current mini-batch,
+            preds(numpy.array|Tensor): prediction results of current mini-batch,
                 the output of two-class sigmoid function.
                 Shape: [batch_size, 1]. Dtype: 'float64' or 'float32'.
-            labels(numpy.array): ground truth (labels) of current mini-batch,
+            labels(numpy.array|Tensor): ground truth (labels) of current mini-batch,
                 the shape should keep the same as preds.
                 Shape: [batch_size, 1], Dtype: 'int32' or 'int64'.
         """
-        if isinstance(preds, paddle.Tensor):
-            preds = np.array(preds)
-        elif not _is_numpy_(preds):
-            raise ValueError("The 'preds' must be a numpy ndarray or Tensor.")
-
-        if isinstance(labels, paddle.Tensor):
-            labels = np.array(labels)
-        elif not _is_numpy_(labels):
-            raise ValueError("The 'labels' must be a numpy ndarray or Tensor.")
-
-        sample_num = labels.shape[0]
-        preds = np.rint(preds).astype("int32")
-
-        for i in range(sample_num):
-            pred = preds[i]
-            label = labels[i]
-            if label == 1:
-                if pred == label:
-                    self.tp += 1
-                else:
-                    self.fn += 1
+        preds = _check_metric_input(preds, 'preds').flatten()
+        labels = _check_metric_input(labels, 'labels').flatten()
+
+        # predictions rounded to 1, same as rint(preds) == 1
+        pred_pos = (preds > 0.5) & (preds < 1.5)
+        label_pos = labels == 1
+        tp = (pred_pos & label_pos).astype('int64').sum()
+        self._tp = _add_state(self._tp, tp)
+        self._fn = _add_state(self._fn, label_pos.astype('int64').sum() - tp)
 
     def accumulate(self) -> float:
         """
@@ -612,15 +796,16 @@ class Recall(Metric):
         Returns:
             A scaler float: results of the calculated Recall.
         """
-        recall = self.tp + self.fn
-        return float(self.tp) / recall if recall != 0 else 0.0
+        tp, fn = self.tp, self.fn
+        recall = tp + fn
+        return float(tp) / recall if recall != 0 else 0.0
 
     def reset(self) -> None:
         """
         Resets all of the metric state.
         """
-        self.tp = 0
-        self.fn = 0
+        self._tp = 0  # true positive
+        self._fn = 0  # false negative
 
     def name(self) -> str:
         """
@@ -633,7 +818,8 @@ class Auc(Metric):
     """
     The auc metric is for binary classification.
     Refer to https://en.wikipedia.org/wiki/Receiver_operating_characteristic#Area_under_the_curve.
-    Please notice that the auc metric is implemented with python, which may be a little bit slow.
+    If predictions are Tensors, the statistics are accumulated on their device,
+    and only synchronized to host in :code:`accumulate`.
 
     The `auc` function creates four local variables, `true_positives`,
     `true_negatives`, `false_positives` and `false_negatives` that are used to
@@ -709,6 +895,8 @@ class Auc(Metric):
             >>> model.fit(data, batch_size=16)
     """
 
+    _device_update = True
+
     def __init__(
         self,
         curve: Literal['ROC', 'PR'] = 'ROC',
@@ -720,11 +908,10 @@ class Auc(Metric):
         super().__init__(*args, **kwargs)
         self._curve = curve
         self._num_thresholds = num_thresholds
-
-        _num_pred_buckets = num_thresholds + 1
-        self._stat_pos = np.zeros(_num_pred_buckets)
-        self._stat_neg = np.zeros(_num_pred_buckets)
         self._name = name
+        self.reset()
+        self.add_state('_stat_pos')
+        self.add_state('_stat_neg')
 
     def update(
         self,
@@ -735,31 +922,39 @@ class Auc(Metric):
         Update the auc curve with the given predictions and labels.
 
         Args:
-            preds (numpy.array): An numpy array in the shape of
+            preds (numpy.array|Tensor): An numpy array in the shape of
                 (batch_size, 2), preds[i][j] denotes the probability of
                 classifying the instance i into the class j.
-            labels (numpy.array): an numpy array in the shape of
+            labels (numpy.array|Tensor): an numpy array in the shape of
                 (batch_size, 1), labels[i] is either o or 1,
                 representing the label of the instance i.
         """
-        if isinstance(labels, paddle.Tensor):
-            labels = np.array(labels)
-        elif not _is_numpy_(labels):
-            raise ValueError("The 'labels' must be a numpy ndarray or Tensor.")
+        labels = _check_metric_input(labels, 'labels').flatten()
+        preds = _check_metric_input(preds, 'preds')
 
+        bin_idx = (preds[:, 1] * self._num_thresholds).astype('int64')
         if isinstance(preds, paddle.Tensor):
-            preds = np.array(preds)
-        elif not _is_numpy_(preds):
-            raise ValueError("The 'preds' must be a numpy ndarray or Tensor.")
-
-        for i, lbl in enumerate(labels):
-            value = preds[i, 1]
-            bin_idx = int(value * self._num_thresholds)
-            assert bin_idx <= self._num_thresholds
-            if lbl:
-                self._stat_pos[bin_idx] += 1.0
-            else:
-                self._stat_neg[bin_idx] += 1.0
+            # NOTE: checking the range on device needs a host sync, so the
+            # out of range predictions are clipped to the boundary buckets
+            bin_idx = paddle.clip(bin_idx, 0, self._num_thresholds)
+            if not isinstance(self._stat_pos, paddle.Tensor):
+                self._stat_pos = paddle.to_tensor(
+                    self._stat_pos, place=preds.place
+                )
+                self._stat_neg = paddle.to_tensor(
+                    self._stat_neg, place=preds.place
+                )
+            pos = paddle.cast(labels != 0, 'float64')
+            paddle.index_add_(self._stat_pos, bin_idx, 0, pos)
+            paddle.index_add_(self._stat_neg, bin_idx, 0, 1.0 - pos)
+        else:
+            assert bin_idx.max(initial=0) <= self._num_thresholds
+            pos = labels != 0
+            num_buckets = self._num_thresholds + 1
+            stat_pos = np.bincount(bin_idx[pos], minlength=num_buckets)
+            stat_neg = np.bincount(bin_idx[~pos], minlength=num_buckets)
+            self._stat_pos = _add_state(self._stat_pos, stat_pos)
+            self._stat_neg = _add_state(self._stat_neg, stat_neg)
 
     @staticmethod
     def trapezoid_area(x1: float, x2: float, y1: float, y2: float) -> float:
@@ -772,20 +967,15 @@ class Auc(Metric):
         Return:
             float: the area under auc curve
         """
-        tot_pos = 0.0
-        tot_neg = 0.0
-        auc = 0.0
-
-        idx = self._num_thresholds
-        while idx >= 0:
-            tot_pos_prev = tot_pos
-            tot_neg_prev = tot_neg
-            tot_pos += self._stat_pos[idx]
-            tot_neg += self._stat_neg[idx]
-            auc += self.trapezoid_area(
-                tot_neg, tot_neg_prev, tot_pos, tot_pos_prev
-            )
-            idx -= 1
+        # walk the thresholds from high to low, each bucket adds a
+        # trapezoid of width stat_neg, and heights of total positive
+        # samples before and after adding the bucket
+        stat_pos = np.array(self._stat_pos, dtype='float64')[::-1]
+        stat_neg = np.array(self._stat_neg, dtype='float64')[::-1]
+        cum_pos = np.cumsum(stat_pos)
+        auc = float(np.sum(stat_neg * (2 * cum_pos - stat_pos)) / 2.0)
+        tot_pos = float(cum_pos[-1])
+        tot_neg = float(np.sum(stat_neg))
 
         return (
             auc / tot_pos / tot_neg if tot_pos > 0.0 and tot_neg > 0.0 else 0.0
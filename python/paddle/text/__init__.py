@@ -18,6 +18,7 @@ from .datasets import (
     Conll05st,
     Imdb,
     Imikolov,
+    LengthBucketBatchSampler,
     Movielens,
     UCIHousing,
 )
@@ -31,6 +32,7 @@ __all__ = [
     'UCIHousing',
     'WMT14',
     'WMT16',
+    'LengthBucketBatchSampler',
     'ViterbiDecoder',
     'viterbi_decode',
 ]
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from .conll05 import Conll05st  # noqa: F401
+from .corpus import LengthBucketBatchSampler  # noqa: F401
 from .imdb import Imdb  # noqa: F401
 from .imikolov import Imikolov  # noqa: F401
 from .movielens import Movielens  # noqa: F401
@@ -0,0 +1,336 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# This file implements the token id cache of text datasets. A tokenized
+# corpus is saved in a directory keyed by the data file and the dataset
+# configs:
+#
+#   <name>.ids.npy        token ids of all sequences of a field, int32
+#   <name>.offsets.npy    start offsets of sequences in ids, int64, with
+#                         the total length appended
+#   <name>.npy            other per-sample arrays, e.g. labels
+#   meta.pkl             format version, field names and the vocabulary
+#
+# Arrays are memory-mapped when the cache is loaded, so constructing a
+# dataset from the cache does not read the corpus into memory.
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+import os
+import pickle
+import shutil
+import tempfile
+from typing import TYPE_CHECKING, Any, List
+
+import numpy as np
+
+from paddle.io import Sampler
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+
+    import numpy.typing as npt
+
+__all__ = []
+
+CORPUS_CACHE_VERSION = 1
+
+
+class _FlatSequences:
+    """
+    A read-only list of int sequences stored in a flat id array with offsets,
+    sequences are got as int64 arrays.
+    """
+
+    def __init__(self, ids, offsets):
+        self.ids = ids
+        self.offsets = offsets
+
+    @classmethod
+    def from_list(cls, sequences):
+        lengths = np.fromiter(
+            (len(s) for s in sequences), dtype=np.int64, count=len(sequences)
+        )
+        offsets = np.zeros(len(sequences) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        ids = np.fromiter(
+            itertools.chain.from_iterable(sequences),
+            dtype=np.int32,
+            count=int(offsets[-1]),
+        )
+        return cls(ids, offsets)
+
+    @property
+    def lengths(self):
+        return np.diff(self.offsets)
+
+    def __getitem__(self, idx):
+        return self.ids[self.offsets[idx] : self.offsets[idx + 1]].astype(
+            np.int64
+        )
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+
+class _ZippedSequences:
+    # a read-only list of tuples of sequences in several fields
+    def __init__(self, *fields):
+        self.fields = fields
+
+    def __getitem__(self, idx):
+        return tuple(field[idx] for field in self.fields)
+
+    def __len__(self):
+        return len(self.fields[0])
+
+
+def _sequence_lengths(sequences):
+    if isinstance(sequences, _FlatSequences):
+        return sequences.lengths
+    return np.fromiter(
+        (len(s) for s in sequences), dtype=np.int64, count=len(sequences)
+    )
+
+
+class _CorpusCache:
+    """
+    The token id cache of a dataset, keyed by path, size and modification
+    time of the data file, and the dataset configs.
+
+    Args:
+        cache_dir(str): the root directory of caches.
+        data_file(str): the data file the corpus is tokenized from.
+        configs(dict): dataset configs which change the tokenized corpus.
+    """
+
+    def __init__(self, cache_dir, data_file, configs):
+        stat = os.stat(data_file)
+        key = repr(
+            (
+                CORPUS_CACHE_VERSION,
+                os.path.abspath(data_file),
+                stat.st_size,
+                stat.st_mtime_ns,
+                sorted(configs.items()),
+            )
+        )
+        self.path = os.path.join(
+            cache_dir,
+            f'v{CORPUS_CACHE_VERSION}',
+            hashlib.sha1(key.encode()).hexdigest(),
+        )
+
+    def load(self):
+        """
+        Load the cache, return (sequences, arrays, vocab) in which arrays are
+        memory-mapped, or None if the cache does not exist.
+        """
+        meta_path = os.path.join(self.path, 'meta.pkl')
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path, 'rb') as f:
+            meta = pickle.load(f)
+
+        def load_array(name):
+            return np.load(os.path.join(self.path, name), mmap_mode='r')
+
+        sequences = {
+            name: _FlatSequences(
+                load_array(f'{name}.ids.npy'), load_array(f'{name}.offsets.npy')
+            )
+            for name in meta['sequences']
+        }
+        arrays = {name: load_array(f'{name}.npy') for name in meta['arrays']}
+        return sequences, arrays, meta['vocab']
+
+    def save(self, sequences, arrays, vocab=None):
+        """
+        Save lists of sequences, per-sample arrays and the vocabulary, and
+        load them back memory-mapped.
+        """
+        parent = os.path.dirname(self.path)
+        os.makedirs(parent, exist_ok=True)
+        # NOTE: files are written to a temporary directory which is renamed
+        # at last, so readers never see a partial cache
+        tmp_dir = tempfile.mkdtemp(dir=parent)
+        try:
+            for name, seqs in sequences.items():
+                flat = _FlatSequences.from_list(seqs)
+                np.save(os.path.join(tmp_dir, f'{name}.ids.npy'), flat.ids)
+                np.save(
+                    os.path.join(tmp_dir, f'{name}.offsets.npy'), flat.offsets
+                )
+            for name, array in arrays.items():
+                np.save(os.path.join(tmp_dir, f'{name}.npy'), np.asarray(array))
+            with open(os.path.join(tmp_dir, 'meta.pkl'), 'wb') as f:
+                pickle.dump(
+                    {
+                        'version': CORPUS_CACHE_VERSION,
+                        'sequences': list(sequences),
+                        'arrays': list(arrays),
+                        'vocab': vocab,
+                    },
+                    f,
+                )
+            try:
+                os.rename(tmp_dir, self.path)
+            except OSError:
+                # saved by another process at the same time
+                pass
+        finally:
+            if os.path.exists(tmp_dir):
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+        return self.load()
+
+
+def _load_or_build_corpus(
+    cache_dir: str,
+    data_file: str,
+    configs: dict[str, Any],
+    build: Callable[[], tuple[dict, dict, Any]],
+):
+    """
+    Load the tokenized corpus from the cache, or tokenize it by build and
+    save it to the cache. build returns (sequences, arrays, vocab), in which
+    sequences are dicts of lists of int lists, and arrays are dicts of
+    per-sample lists.
+    """
+    cache = _CorpusCache(cache_dir, data_file, configs)
+    cached = cache.load()
+    if cached is None:
+        cached = cache.save(*build())
+    return cached
+
+
+class LengthBucketBatchSampler(Sampler[List[int]]):
+    """
+    Sampler that yields batches of indices whose samples have similar
+    lengths, which reduces padding of variable length sequences.
+
+    It is used as the :attr:`batch_sampler` of :code:`paddle.io.DataLoader`,
+    but it is not a :code:`paddle.io.BatchSampler`, since it samples from
+    lengths instead of wrapping a sampler of a dataset.
+
+    Indices are split into pools of :attr:`pool_size` batches, and sorted by
+    length in each pool, then cut into batches. If :attr:`shuffle` is True,
+    indices are shuffled before split into pools, and batches are shuffled
+    after cut, with a random state decided by the epoch, see
+    :code:`set_epoch`.
+
+    Args:
+        lengths(list[int]|np.ndarray): lengths of samples, e.g. the
+            :attr:`lengths` of :code:`Imdb`, :code:`Imikolov` or
+            :code:`WMT16`.
+        batch_size(int, optional): sample number of a batch. Default 1.
+        pool_size(int, optional): number of batches of which samples are
+            sorted together, larger pools give less padding but less
+            randomness. Default 100.
+        shuffle(bool, optional): whether to shuffle indices and batches.
+            Default False.
+        drop_last(bool, optional): whether to drop the last incomplete batch.
+            Default False.
+
+    Returns:
+        LengthBucketBatchSampler: an iterable object for indices iterating.
+
+    Examples:
+
+        .. code-block:: python
+
+            >>> from paddle.text import LengthBucketBatchSampler
+
+            >>> lengths = [5, 1, 4, 2, 3, 6]
+            >>> sampler = LengthBucketBatchSampler(lengths, batch_size=2)
+            >>> print(list(sampler))
+            [[1, 3], [4, 2], [0, 5]]
+    """
+
+    def __init__(
+        self,
+        lengths: Sequence[int] | npt.NDArray[Any],
+        batch_size: int = 1,
+        pool_size: int = 100,
+        shuffle: bool = False,
+        drop_last: bool = False,
+    ) -> None:
+        assert (
+            isinstance(batch_size, int) and batch_size > 0
+        ), "batch_size should be a positive integer"
+        assert (
+            isinstance(pool_size, int) and pool_size > 0
+        ), "pool_size should be a positive integer"
+        assert isinstance(shuffle, bool), "shuffle should be a boolean value"
+        assert isinstance(
+            drop_last, bool
+        ), "drop_last should be a boolean value"
+        super().__init__()
+        self.lengths = np.asarray(lengths)
+        self.batch_size = batch_size
+        self.pool_size = pool_size
+        self.shuffle = shuffle
+        self.drop_last = drop_last
+        self.epoch = 0
+
+    def __iter__(self) -> Iterator[list[int]]:
+        num_samples = len(self.lengths)
+        # epoch used by this iteration, see state_dict
+        self._iter_epoch = self.epoch
+        if self.shuffle:
+            rng = np.random.RandomState(self.epoch)
+            indices = rng.permutation(num_samples)
+            self.epoch += 1
+        else:
+            indices = np.arange(num_samples)
+
+        pool = self.batch_size * self.pool_size
+        for start in range(0, num_samples, pool):
+            chunk = indices[start : start + pool]
+            indices[start : start + pool] = chunk[
+                np.argsort(self.lengths[chunk], kind='stable')
+            ]
+
+        batches = [
+            indices[i : i + self.batch_size].tolist()
+            for i in range(0, num_samples, self.batch_size)
+        ]
+        if self.drop_last and num_samples % self.batch_size != 0:
+            batches.pop()
+        if self.shuffle:
+            rng.shuffle(batches)
+        yield from batches
+
+    def __len__(self) -> int:
+        num_samples = len(self.lengths)
+        num_samples += int(not self.drop_last) * (self.batch_size - 1)
+        return num_samples // self.batch_size
+
+    def state_dict(self) -> dict[str, Any]:
+        return {'epoch': getattr(self, '_iter_epoch', self.epoch)}
+
+    def load_state_dict(self, state_dict: dict[str, Any]) -> None:
+        self.epoch = state_dict['epoch']
+
+    def set_epoch(self, epoch: int) -> None:
+        """
+        Sets the epoch number. When :attr:`shuffle=True`, this number is used
+        as seeds of random numbers. By default, it increases by one after
+        each epoch.
+
+        Args:
+            epoch (int): Epoch number.
+        """
+        self.epoch = epoch
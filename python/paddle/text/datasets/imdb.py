@@ -24,6 +24,8 @@ import numpy as np
 from paddle.dataset.common import _check_exists_and_download
 from paddle.io import Dataset
 
+from .corpus import _load_or_build_corpus, _sequence_lengths
+
 if TYPE_CHECKING:
     from re import Pattern
 
@@ -47,6 +49,10 @@ class Imdb(Dataset):
         cutoff(int): cutoff number for building word dictionary. Default 150.
         download(bool): whether to download dataset automatically if
             :attr:`data_file` is not set. Default True.
+        cache_dir(str|None): directory to cache the tokenized dataset. If
+            set, documents are tokenized once and saved as flat token id
+            arrays, which are memory-mapped when the dataset is constructed
+            again with the same data file and configs. Default None.
 
     Returns:
         Dataset: instance of IMDB dataset
@@ -102,6 +108,7 @@ class Imdb(Dataset):
         mode: _ImdbDataSetMode = 'train',
         cutoff: int = 150,
         download: bool = True,
+        cache_dir: str | None = None,
     ) -> None:
         assert mode.lower() in [
             'train',
@@ -118,11 +125,34 @@ class Imdb(Dataset):
                 data_file, URL, MD5, 'imdb', download
             )
 
-        # Build a word dictionary from the corpus
-        self.word_idx = self._build_work_dict(cutoff)
+        if cache_dir is None:
+            # Build a word dictionary from the corpus
+            self.word_idx = self._build_work_dict(cutoff)
+
+            # read dataset into memory
+            self._load_anno()
+        else:
+            sequences, arrays, self.word_idx = _load_or_build_corpus(
+                cache_dir,
+                self.data_file,
+                {'dataset': 'Imdb', 'mode': self.mode, 'cutoff': cutoff},
+                lambda: self._build_corpus(cutoff),
+            )
+            self.docs = sequences['docs']
+            self.labels = arrays['labels']
 
-        # read dataset into memory
+    def _build_corpus(self, cutoff: int):
+        self.word_idx = self._build_work_dict(cutoff)
         self._load_anno()
+        return {'docs': self.docs}, {'labels': self.labels}, self.word_idx
+
+    @property
+    def lengths(self) -> npt.NDArray[np.int64]:
+        """
+        Token numbers of documents, e.g. for
+        :code:`paddle.text.LengthBucketBatchSampler`.
+        """
+        return _sequence_lengths(self.docs)
 
     def _build_work_dict(self, cutoff: int) -> dict[str, int]:
         word_freq = collections.defaultdict(int)
@@ -22,6 +22,8 @@ import numpy as np
 from paddle.dataset.common import _check_exists_and_download
 from paddle.io import Dataset
 
+from .corpus import _load_or_build_corpus, _sequence_lengths, _ZippedSequences
+
 if TYPE_CHECKING:
     import numpy.typing as npt
 
@@ -46,6 +48,10 @@ class Imikolov(Dataset):
         min_word_freq(int): minimal word frequence for building word dictionary. Default 50.
         download(bool): whether to download dataset automatically if
             :attr:`data_file` is not set. Default True
+        cache_dir(str|None): directory to cache the tokenized dataset. If
+            set, sentences are tokenized once and saved as flat token id
+            arrays, which are memory-mapped when the dataset is constructed
+            again with the same data file and configs. Default None.
 
     Returns:
         Dataset: instance of imikolov dataset
@@ -103,6 +109,7 @@ class Imikolov(Dataset):
         mode: _ImikolovDataSetMode = 'train',
         min_word_freq: int = 50,
         download: bool = True,
+        cache_dir: str | None = None,
     ) -> None:
         assert data_type.upper() in [
             'NGRAM',
@@ -128,11 +135,54 @@ class Imikolov(Dataset):
                 data_file, URL, MD5, 'imikolov', download
             )
 
-        # Build a word dictionary from the corpus
-        self.word_idx = self._build_work_dict(min_word_freq)
+        if cache_dir is None:
+            # Build a word dictionary from the corpus
+            self.word_idx = self._build_work_dict(min_word_freq)
+
+            # read dataset into memory
+            self._load_anno()
+        else:
+            sequences, _, self.word_idx = _load_or_build_corpus(
+                cache_dir,
+                self.data_file,
+                {
+                    'dataset': 'Imikolov',
+                    'mode': self.mode,
+                    'data_type': self.data_type,
+                    'window_size': window_size,
+                    'min_word_freq': min_word_freq,
+                },
+                self._build_corpus,
+            )
+            if self.data_type == 'NGRAM':
+                self.data = sequences['ngrams']
+            else:
+                self.data = _ZippedSequences(sequences['src'], sequences['trg'])
 
-        # read dataset into memory
+    def _build_corpus(self):
+        self.word_idx = self._build_work_dict(self.min_word_freq)
         self._load_anno()
+        if self.data_type == 'NGRAM':
+            sequences = {'ngrams': self.data}
+        else:
+            sequences = {
+                'src': [d[0] for d in self.data],
+                'trg': [d[1] for d in self.data],
+            }
+        return sequences, {}, self.word_idx
+
+    @property
+    def lengths(self) -> npt.NDArray[np.int64]:
+        """
+        Token numbers of samples, i.e. :attr:`window_size` for 'NGRAM' data
+        and lengths of source sequences for 'SEQ' data, e.g. for
+        :code:`paddle.text.LengthBucketBatchSampler`.
+        """
+        if self.data_type == 'NGRAM':
+            return _sequence_lengths(self.data)
+        if isinstance(self.data, _ZippedSequences):
+            return self.data.fields[0].lengths
+        return np.array([len(src) for src, _ in self.data], dtype=np.int64)
 
     def word_count(self, f, word_freq=None):
         if word_freq is None:
@@ -25,6 +25,8 @@ import paddle
 from paddle.dataset.common import _check_exists_and_download
 from paddle.io import Dataset
 
+from .corpus import _load_or_build_corpus, _sequence_lengths
+
 if TYPE_CHECKING:
     import numpy.typing as npt
 
@@ -72,6 +74,10 @@ class WMT16(Dataset):
         lang(str): source language, 'en' or 'de'. Default 'en'.
         download(bool): whether to download dataset automatically if
             :attr:`data_file` is not set. Default True.
+        cache_dir(str|None): directory to cache the tokenized dataset. If
+            set, sentences are tokenized once and saved as flat token id
+            arrays, which are memory-mapped when the dataset is constructed
+            again with the same data file and configs. Default None.
 
     Returns:
         Dataset: Instance of WMT16 dataset. The instance of dataset has 3 fields:
@@ -135,6 +141,7 @@ class WMT16(Dataset):
         trg_dict_size: int = -1,
         lang: _Wmt16Language = 'en',
         download: bool = True,
+        cache_dir: str | None = None,
     ) -> None:
         assert mode.lower() in [
             'train',
@@ -169,7 +176,42 @@ class WMT16(Dataset):
         )
 
         # load data
-        self.data = self._load_data()
+        if cache_dir is None:
+            self.data = self._load_data()
+        else:
+            sequences, _, _ = _load_or_build_corpus(
+                cache_dir,
+                self.data_file,
+                {
+                    'dataset': 'WMT16',
+                    'mode': self.mode,
+                    'lang': lang,
+                    'src_dict_size': src_dict_size,
+                    'trg_dict_size': trg_dict_size,
+                },
+                self._build_corpus,
+            )
+            self.src_ids = sequences['src_ids']
+            self.trg_ids = sequences['trg_ids']
+            self.trg_ids_next = sequences['trg_ids_next']
+            self.data = None
+
+    def _build_corpus(self):
+        self._load_data()
+        sequences = {
+            'src_ids': self.src_ids,
+            'trg_ids': self.trg_ids,
+            'trg_ids_next': self.trg_ids_next,
+        }
+        return sequences, {}, None
+
+    @property
+    def lengths(self) -> npt.NDArray[np.int64]:
+        """
+        Token numbers of source sentences, e.g. for
+        :code:`paddle.text.LengthBucketBatchSampler`.
+        """
+        return _sequence_lengths(self.src_ids)
 
     @overload
     def _load_dict(
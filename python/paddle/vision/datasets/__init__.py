@@ -16,11 +16,19 @@ from .cifar import Cifar10, Cifar100
 from .flowers import Flowers
 from .folder import DatasetFolder, ImageFolder
 from .mnist import MNIST, FashionMNIST
+from .sharded_folder import (
+    IterableShardedDatasetFolder,
+    ShardedDatasetFolder,
+    pack_dataset_folder,
+)
 from .voc2012 import VOC2012
 
 __all__ = [
     'DatasetFolder',
     'ImageFolder',
+    'ShardedDatasetFolder',
+    'IterableShardedDatasetFolder',
+    'pack_dataset_folder',
     'MNIST',
     'FashionMNIST',
     'Flowers',
@@ -0,0 +1,459 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# This file implements the sharded format of DatasetFolder, which packs
+# image files of a folder into a few large shard files, so that the folder
+# is not walked at startup and samples are not opened file by file.
+#
+# Directory layout:
+#
+#   meta.json           format version, classes and shard file names
+#   index.npy           a record of (shard, offset, size, label) per sample
+#   shard-00000.bin     raw bytes of image files, concatenated
+#   shard-00001.bin
+#   ...
+#
+# Samples are stored in the order of DatasetFolder, so the index is sorted
+# by (shard, offset), and a shard can be streamed sequentially.
+
+from __future__ import annotations
+
+import io
+import json
+import mmap
+import os
+from typing import TYPE_CHECKING, Any, Callable, Tuple
+
+import numpy as np
+from PIL import Image
+
+import paddle
+from paddle.io import Dataset, IterableDataset, get_worker_info
+from paddle.utils import try_import
+
+from .folder import IMG_EXTENSIONS, make_dataset
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from paddle.vision.transforms.transforms import _Transform
+
+    from ..image import _ImageDataType
+
+__all__ = []
+
+SHARD_FORMAT_VERSION = 1
+_META_FILE = 'meta.json'
+_INDEX_FILE = 'index.npy'
+_INDEX_DTYPE = np.dtype(
+    [
+        ('shard', '<i4'),
+        ('offset', '<i8'),
+        ('size', '<i8'),
+        ('label', '<i8'),
+    ]
+)
+
+
+def pack_dataset_folder(
+    root: str,
+    output_dir: str,
+    shard_size: int = 2**30,
+    extensions: Sequence[str] | None = None,
+    is_valid_file: Callable[[str], bool] | None = None,
+) -> int:
+    """
+    Pack a folder arranged as :ref:`api_paddle_vision_datasets_DatasetFolder`
+    into shard files with an index, which can be loaded by
+    :code:`ShardedDatasetFolder` and :code:`IterableShardedDatasetFolder`.
+    The folder is walked only once here, and samples are stored in the same
+    order and with the same labels as :code:`DatasetFolder`.
+
+    It could also be run as a command line tool:
+
+    .. code-block:: bash
+
+        python -m paddle.vision.datasets.sharded_folder root output_dir
+
+    Args:
+        root (str): Root directory path of the folder.
+        output_dir (str): Directory to write shard files and the index, it is
+            created if not exists.
+        shard_size (int, optional): Maximum bytes of a shard file, a sample
+            larger than it is stored in a shard alone. Default: 1GB.
+        extensions (list[str]|tuple[str]|None, optional): A list of allowed
+            extensions, same as :code:`DatasetFolder`. Default: None.
+        is_valid_file (Callable|None, optional): A function that takes path of
+            a file and check if the file is a valid file, same as
+            :code:`DatasetFolder`. Default: None.
+
+    Returns:
+        int: The number of packed samples.
+
+    Examples:
+
+        .. code-block:: python
+
+            >>> import os
+            >>> import tempfile
+            >>> import cv2
+            >>> import numpy as np
+            >>> from paddle.vision.datasets import (
+            ...     ShardedDatasetFolder, pack_dataset_folder
+            ... )
+
+            >>> root = tempfile.mkdtemp()
+            >>> for label in ['cat', 'dog']:
+            ...     os.makedirs(os.path.join(root, label))
+            ...     for i in range(2):
+            ...         img = (np.random.random((32, 32, 3)) * 255).astype('uint8')
+            ...         _ = cv2.imwrite(os.path.join(root, label, f'{i}.jpg'), img)
+
+            >>> output_dir = tempfile.mkdtemp()
+            >>> print(pack_dataset_folder(root, output_dir))
+            4
+            >>> dataset = ShardedDatasetFolder(output_dir)
+            >>> img, label = dataset[2]
+            >>> print(dataset.classes[label])
+            dog
+    """
+    assert shard_size > 0, "shard_size should be a positive value"
+    if extensions is None and is_valid_file is None:
+        extensions = IMG_EXTENSIONS
+
+    root = os.path.expanduser(root)
+    classes = sorted(d.name for d in os.scandir(root) if d.is_dir())
+    class_to_idx = {classes[i]: i for i in range(len(classes))}
+    samples = make_dataset(root, class_to_idx, extensions, is_valid_file)
+    if len(samples) == 0:
+        raise RuntimeError(f"Found 0 files in subfolders of: {root}")
+
+    os.makedirs(output_dir, exist_ok=True)
+    meta_path = os.path.join(output_dir, _META_FILE)
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+    index = np.empty(len(samples), dtype=_INDEX_DTYPE)
+    shards = []
+    shard_file = None
+    try:
+        for i, (path, label) in enumerate(samples):
+            with open(path, 'rb') as f:
+                data = f.read()
+            if shard_file is None or (
+                shard_file.tell() > 0
+                and shard_file.tell() + len(data) > shard_size
+            ):
+                if shard_file is not None:
+                    shard_file.close()
+                shards.append(f'shard-{len(shards):05d}.bin')
+                shard_file = open(os.path.join(output_dir, shards[-1]), 'wb')
+            index[i] = (len(shards) - 1, shard_file.tell(), len(data), label)
+            shard_file.write(data)
+    finally:
+        if shard_file is not None:
+            shard_file.close()
+
+    # NOTE: the meta file is written last, so an interrupted packing is not
+    # loaded as a valid dataset
+    np.save(os.path.join(output_dir, _INDEX_FILE), index)
+    meta = {
+        'version': SHARD_FORMAT_VERSION,
+        'classes': classes,
+        'shards': shards,
+        'num_samples': len(samples),
+    }
+    with open(meta_path + '.tmp', 'w') as f:
+        json.dump(meta, f)
+    os.replace(meta_path + '.tmp', meta_path)
+    return len(samples)
+
+
+def _load_index(root):
+    # the index of millions of samples is mapped rather than read
+    return np.load(os.path.join(root, _INDEX_FILE), mmap_mode='r')
+
+
+def _load_meta(root):
+    meta_path = os.path.join(root, _META_FILE)
+    if not os.path.exists(meta_path):
+        raise RuntimeError(
+            f"{root} is not a sharded dataset folder, please pack the folder "
+            "by paddle.vision.datasets.pack_dataset_folder first"
+        )
+    with open(meta_path) as f:
+        meta = json.load(f)
+    if meta['version'] > SHARD_FORMAT_VERSION:
+        raise ValueError(
+            f"the sharded dataset folder version {meta['version']} is not "
+            "supported, please upgrade paddle to load it"
+        )
+    return meta
+
+
+def default_bytes_loader(data: bytes) -> _ImageDataType:
+    """
+    Decode an encoded image to RGB by the image backend, same as the default
+    loader of :code:`DatasetFolder`.
+    """
+    from paddle.vision import get_image_backend
+
+    if get_image_backend() == 'cv2':
+        cv2 = try_import('cv2')
+        img = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+        return cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+    else:
+        return Image.open(io.BytesIO(data)).convert('RGB')
+
+
+class ShardedDatasetFolder(Dataset[Tuple["_ImageDataType", int]]):
+    """
+    A map-style dataset of a folder packed by :code:`pack_dataset_folder`,
+    which has the same samples as :ref:`api_paddle_vision_datasets_DatasetFolder`
+    of the folder. Only the index is loaded at construction, and samples are
+    read from memory-mapped shard files, so that neither walking the folder
+    nor opening a file per sample is needed.
+
+    Args:
+        root (str): Directory of the packed dataset.
+        loader (Callable|None, optional): A function to load a sample given
+            its encoded bytes. If None, images are decoded to RGB by the image
+            backend. Default: None.
+        transform (Callable|None, optional): A function/transform that takes
+            in a sample and returns a transformed version. Default: None.
+
+    Returns:
+        :ref:`api_paddle_io_Dataset`. An instance of ShardedDatasetFolder.
+
+    Examples:
+
+        .. code-block:: python
+
+            >>> # doctest: +SKIP('need a packed dataset')
+            >>> from paddle.vision.datasets import ShardedDatasetFolder
+            >>> from paddle.vision.transforms import ToTensor
+            >>> dataset = ShardedDatasetFolder('path/to/packed', transform=ToTensor())
+            >>> img, label = dataset[0]
+    """
+
+    loader: Callable[[bytes], Any]
+    transform: _Transform[Any, Any] | None
+    classes: list[str]
+    class_to_idx: dict[str, int]
+
+    def __init__(
+        self,
+        root: str,
+        loader: Callable[[bytes], Any] | None = None,
+        transform: _Transform[Any, Any] | None = None,
+    ) -> None:
+        self.root = root
+        self.loader = default_bytes_loader if loader is None else loader
+        self.transform = transform
+
+        meta = _load_meta(root)
+        self._index = _load_index(root)
+        self._shard_paths = [
+            os.path.join(root, shard) for shard in meta['shards']
+        ]
+        self.classes = meta['classes']
+        self.class_to_idx = {c: i for i, c in enumerate(self.classes)}
+        self.dtype = paddle.get_default_dtype()
+        # shard files are mapped at first access in each process
+        self._shards = {}
+
+    @property
+    def targets(self) -> list[int]:
+        return self._index['label'].tolist()
+
+    def _get_shard(self, shard_id):
+        shard = self._shards.get(shard_id)
+        if shard is None:
+            with open(self._shard_paths[shard_id], 'rb') as f:
+                shard = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._shards[shard_id] = shard
+        return shard
+
+    def read(self, index: int) -> tuple[bytes, int]:
+        """
+        Read the encoded bytes and label of a sample without decoding.
+
+        Args:
+            index (int): Index of the sample.
+
+        Returns:
+            tuple: (data, target) where data is the bytes of the image file.
+        """
+        shard_id, offset, size, label = self._index[index].tolist()
+        shard = self._get_shard(shard_id)
+        return shard[offset : offset + size], label
+
+    def __getitem__(self, index: int) -> tuple[_ImageDataType, int]:
+        data, target = self.read(index)
+        sample = self.loader(data)
+        if self.transform is not None:
+            sample = self.transform(sample)
+        return sample, target
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __getstate__(self):
+        # mappings are not pickled, but reopened in worker processes
+        state = self.__dict__.copy()
+        state['_index'] = None
+        state['_shards'] = {}
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._index = _load_index(self.root)
+
+
+class IterableShardedDatasetFolder(
+    IterableDataset[Tuple["_ImageDataType", int]]
+):
+    """
+    An iterable dataset of a folder packed by :code:`pack_dataset_folder`,
+    which streams shard files sequentially with large reads. When used in
+    multi-process :ref:`api_paddle_io_DataLoader`, shards are split among
+    workers, so each shard is read by one worker only.
+
+    Args:
+        root (str): Directory of the packed dataset.
+        loader (Callable|None, optional): A function to load a sample given
+            its encoded bytes. If None, images are decoded to RGB by the image
+            backend. Default: None.
+        transform (Callable|None, optional): A function/transform that takes
+            in a sample and returns a transformed version. Default: None.
+        shuffle (bool, optional): Whether to shuffle the order of shards, and
+            samples in each shard, at each epoch. Default: False.
+        buffer_size (int, optional): Buffer size in bytes for reading shard
+            files. Default: 16MB.
+
+    Returns:
+        :ref:`api_paddle_io_IterableDataset`. An instance of
+        IterableShardedDatasetFolder.
+
+    Examples:
+
+        .. code-block:: python
+
+            >>> # doctest: +SKIP('need a packed dataset')
+            >>> from paddle.io import DataLoader
+            >>> from paddle.vision.datasets import IterableShardedDatasetFolder
+            >>> from paddle.vision.transforms import Compose, Resize, ToTensor
+            >>> dataset = IterableShardedDatasetFolder(
+            ...     'path/to/packed',
+            ...     transform=Compose([Resize((224, 224)), ToTensor()]),
+            ...     shuffle=True,
+            ... )
+            >>> loader = DataLoader(dataset, batch_size=64, num_workers=4)
+            >>> for img, label in loader:
+            ...     pass
+    """
+
+    loader: Callable[[bytes], Any]
+    transform: _Transform[Any, Any] | None
+    classes: list[str]
+    class_to_idx: dict[str, int]
+
+    def __init__(
+        self,
+        root: str,
+        loader: Callable[[bytes], Any] | None = None,
+        transform: _Transform[Any, Any] | None = None,
+        shuffle: bool = False,
+        buffer_size: int = 2**24,
+    ) -> None:
+        self.root = root
+        self.loader = default_bytes_loader if loader is None else loader
+        self.transform = transform
+        self.shuffle = shuffle
+        self.buffer_size = buffer_size
+
+        meta = _load_meta(root)
+        self._index = _load_index(root)
+        self._shard_paths = [
+            os.path.join(root, shard) for shard in meta['shards']
+        ]
+        self.classes = meta['classes']
+        self.class_to_idx = {c: i for i, c in enumerate(self.classes)}
+        self.dtype = paddle.get_default_dtype()
+        # the index is sorted by shard, samples of shard i are in
+        # [bounds[i], bounds[i + 1])
+        self._bounds = np.searchsorted(
+            self._index['shard'], np.arange(len(self._shard_paths) + 1)
+        )
+
+    def _iter_shard(self, shard_id):
+        start, end = self._bounds[shard_id], self._bounds[shard_id + 1]
+        records = self._index[start:end]
+        if self.shuffle:
+            records = records[np.random.permutation(len(records))]
+        with open(
+            self._shard_paths[shard_id], 'rb', buffering=self.buffer_size
+        ) as f:
+            for _, offset, size, label in records.tolist():
+                if f.tell() != offset:
+                    f.seek(offset)
+                yield f.read(size), label
+
+    def __iter__(self) -> Iterator[tuple[_ImageDataType, int]]:
+        shard_ids = list(range(len(self._shard_paths)))
+        worker_info = get_worker_info()
+        if worker_info is not None:
+            shard_ids = shard_ids[worker_info.id :: worker_info.num_workers]
+        if self.shuffle:
+            np.random.shuffle(shard_ids)
+
+        for shard_id in shard_ids:
+            for data, target in self._iter_shard(shard_id):
+                sample = self.loader(data)
+                if self.transform is not None:
+                    sample = self.transform(sample)
+                yield sample, target
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __getstate__(self):
+        # the mapped index is not pickled, but reopened in worker processes
+        state = self.__dict__.copy()
+        state['_index'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._index = _load_index(self.root)
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Pack an image folder into shard files."
+    )
+    parser.add_argument('root', help="root directory of the image folder")
+    parser.add_argument('output_dir', help="directory of packed dataset")
+    parser.add_argument(
+        '--shard_size',
+        type=int,
+        default=2**30,
+        help="maximum bytes of a shard file",
+    )
+    args = parser.parse_args()
+    num_samples = pack_dataset_folder(
+        args.root, args.output_dir, args.shard_size
+    )
+    print(f"packed {num_samples} samples into {args.output_dir}")
@@ -262,6 +262,57 @@ def center_crop(img, output_size):
     return crop(img, i, j, th, tw)
 
 
+def resized_crop(img, top, left, height, width, size, interpolation='bilinear'):
+    """Crops a region of the image and resizes it to the given size by a
+    single resample, which is the same as resizing the image and cropping the
+    resized one. The region is in pixels of input image, and could have
+    fractional bounds.
+
+    Args:
+        img (np.array): Image to be cropped and resized.
+        top (float): Vertical component of the top left corner of the region.
+        left (float): Horizontal component of the top left corner of the region.
+        height (float): Height of the region.
+        width (float): Width of the region.
+        size (list|tuple): Target size (height, width) of output image.
+        interpolation (str, optional): Interpolation method, only "bilinear"
+            is supported. Default: 'bilinear'.
+
+    Returns:
+        np.array: Cropped and resized image.
+
+    """
+    cv2 = try_import('cv2')
+    if interpolation != 'bilinear':
+        raise ValueError(
+            f'interpolation should be "bilinear", but got {interpolation}'
+        )
+
+    oh, ow = size
+    scale_x = width / ow
+    scale_y = height / oh
+    # map centers of output pixels to the region in the same way as
+    # cv2.resize, borders are replicated as well
+    matrix = np.array(
+        [
+            [scale_x, 0.0, left + 0.5 * scale_x - 0.5],
+            [0.0, scale_y, top + 0.5 * scale_y - 0.5],
+        ],
+        dtype=np.float64,
+    )
+    output = cv2.warpAffine(
+        img,
+        matrix,
+        (ow, oh),
+        flags=cv2.INTER_LINEAR | cv2.WARP_INVERSE_MAP,
+        borderMode=cv2.BORDER_REPLICATE,
+    )
+    if len(img.shape) == 3 and img.shape[2] == 1:
+        return output[:, :, np.newaxis]
+    else:
+        return output
+
+
 def hflip(img):
     """Horizontally flips the given image.
 
@@ -286,6 +286,33 @@ def center_crop(img, output_size):
     return crop(img, crop_top, crop_left, crop_height, crop_width)
 
 
+def resized_crop(img, top, left, height, width, size, interpolation='bilinear'):
+    """Crops a region of the PIL Image and resizes it to the given size by a
+    single resample, which is the same as resizing the image and cropping the
+    resized one. The region is in pixels of input image, and could have
+    fractional bounds.
+
+    Args:
+        img (PIL.Image): Image to be cropped and resized.
+        top (float): Vertical component of the top left corner of the region.
+        left (float): Horizontal component of the top left corner of the region.
+        height (float): Height of the region.
+        width (float): Width of the region.
+        size (list|tuple): Target size (height, width) of output image.
+        interpolation (str, optional): Interpolation method, see :code:`resize`.
+            Default: 'bilinear'.
+
+    Returns:
+        PIL.Image: Cropped and resized image.
+
+    """
+    return img.resize(
+        (size[1], size[0]),
+        _pil_interp_from_str[interpolation],
+        box=(left, top, left + width, top + height),
+    )
+
+
 def hflip(img):
     """Horizontally flips the given PIL Image.
 
@@ -240,9 +240,10 @@ def _affine_grid(theta, w, h, ow, oh):
         tmp = paddle.assign(np.array([0.5 * w, 0.5 * h], dtype="float32"))
 
     scaled_theta = theta.transpose((0, 2, 1)) / tmp
-    output_grid = base_grid.reshape((1, oh * ow, 3)).bmm(scaled_theta)
+    # theta may hold a matrix for each image of a batch
+    output_grid = base_grid.reshape((1, oh * ow, 3)).matmul(scaled_theta)
 
-    return output_grid.reshape((1, oh, ow, 2))
+    return output_grid.reshape((-1, oh, ow, 2))
 
 
 def _grid_transform(img, grid, mode, fill):
@@ -613,7 +614,7 @@ def crop(img, top, left, height, width, data_format='CHW'):
     _assert_image_tensor(img, data_format)
 
     if _is_channel_first(data_format):
-        return img[:, top : top + height, left : left + width]
+        return img[..., top : top + height, left : left + width]
     else:
         return img[top : top + height, left : left + width, :]
 
@@ -815,7 +816,10 @@ def resize(img, size, interpolation='bilinear', data_format='CHW'):
     else:
         oh, ow = size
 
-    img = img.unsqueeze(0)
+    # images with shape (N, C, H, W) are resized as a batch
+    batched = len(img.shape) == 4
+    if not batched:
+        img = img.unsqueeze(0)
     img = F.interpolate(
         img,
         size=(oh, ow),
@@ -823,7 +827,7 @@ def resize(img, size, interpolation='bilinear', data_format='CHW'):
         data_format='N' + data_format.upper(),
     )
 
-    return img.squeeze(0)
+    return img if batched else img.squeeze(0)
 
 
 def adjust_brightness(img, brightness_factor):
@@ -954,3 +958,250 @@ def adjust_hue(img, hue_factor):
         raise ValueError("channels of input should be either 1 or 3.")
 
     return img_adjusted
+
+
+def _assert_image_batch(img):
+    if not isinstance(img, paddle.Tensor) or img.ndim != 4:
+        raise RuntimeError(
+            f'not support [type={type(img)}] image batch, it should be a Tensor with shape (N, C, H, W)'
+        )
+
+
+def _batch_factors(factors, img):
+    # per-image factors reshaped to broadcast with NCHW images
+    return paddle.to_tensor(factors, dtype='float32', place=img.place).reshape(
+        [-1, 1, 1, 1]
+    )
+
+
+def _blend_images_batch(img1, img2, ratio):
+    max_value = 1.0 if paddle.is_floating_point(img1) else 255.0
+    img1_f = img1.astype('float32')
+    img2_f = img2.astype('float32')
+    return (
+        (img2_f + ratio * (img1_f - img2_f))
+        .clip(0, max_value)
+        .astype(img1.dtype)
+    )
+
+
+def resized_crop_batch(img, boxes, size, interpolation='bilinear'):
+    """Crops a box of each image in a batch and resizes it to the given size,
+    all images are sampled by a single grid sample.
+
+    Args:
+        img (paddle.Tensor): Images with shape (N, C, H, W).
+        boxes (list|tuple): N crop boxes of (top, left, height, width).
+        size (list|tuple): Target size (height, width) of output images.
+        interpolation (str, optional): Interpolation method, "nearest" or
+            "bilinear". Default: "bilinear".
+
+    Returns:
+        paddle.Tensor: Cropped and resized images with shape (N, C, *size).
+
+    """
+    _assert_image_batch(img)
+    assert interpolation in [
+        'nearest',
+        'bilinear',
+    ], f'interpolation should be "nearest" or "bilinear", but got {interpolation}'
+    assert len(boxes) == img.shape[0], "the number of boxes should be N"
+
+    n, c, h, w = img.shape
+    oh, ow = size
+    # map the normalized coordinates of output images to the crop boxes
+    theta = np.zeros((n, 2, 3), dtype='float32')
+    for k, (top, left, bh, bw) in enumerate(boxes):
+        theta[k, 0, 0] = bw / w
+        theta[k, 0, 2] = (2 * left + bw) / w - 1
+        theta[k, 1, 1] = bh / h
+        theta[k, 1, 2] = (2 * top + bh) / h - 1
+    theta = paddle.to_tensor(theta, place=img.place)
+    grid = F.affine_grid(theta, [n, c, oh, ow], align_corners=False)
+
+    dtype = img.dtype
+    out = F.grid_sample(
+        img if paddle.is_floating_point(img) else img.astype('float32'),
+        grid,
+        mode=interpolation,
+        padding_mode='border',
+        align_corners=False,
+    )
+    if not paddle.is_floating_point(img):
+        out = out.round().clip(0, 255).astype(dtype)
+    return out
+
+
+def resized_crop(img, top, left, height, width, size, interpolation='bilinear'):
+    """Crops a region of the image and resizes it to the given size by a
+    single grid sample. With "bilinear" interpolation, it is the same as
+    resizing the image and cropping the resized one. The region is in pixels
+    of input image, and could have fractional bounds.
+
+    Args:
+        img (paddle.Tensor): Image with shape (C, H, W).
+        top (float): Vertical component of the top left corner of the region.
+        left (float): Horizontal component of the top left corner of the region.
+        height (float): Height of the region.
+        width (float): Width of the region.
+        size (list|tuple): Target size (height, width) of output image.
+        interpolation (str, optional): Interpolation method, "nearest" or
+            "bilinear". Default: "bilinear".
+
+    Returns:
+        paddle.Tensor: Cropped and resized image.
+
+    """
+    _assert_image_tensor(img, 'CHW')
+    return resized_crop_batch(
+        img.unsqueeze(0), [(top, left, height, width)], size, interpolation
+    )[0]
+
+
+def affine_batch(img, matrices, interpolation='nearest', fill=None):
+    """Affine each image in a batch by its own matrix, all images are
+    sampled by a single grid sample.
+
+    Args:
+        img (paddle.Tensor): Images with shape (N, C, H, W).
+        matrices (list|tuple|np.ndarray): N inverse affine matrices, each
+            of 6 values, see :code:`affine`.
+        interpolation (str, optional): Interpolation method, "nearest" or
+            "bilinear". Default: "nearest".
+        fill (3-tuple or int): RGB pixel fill value for area outside the
+            transformed images.
+
+    Returns:
+        paddle.Tensor: Affined images.
+
+    """
+    _assert_image_batch(img)
+    theta = paddle.to_tensor(
+        np.asarray(matrices, dtype='float32').reshape((-1, 2, 3)),
+        place=img.place,
+    )
+    shape = img.shape
+    grid = _affine_grid(
+        theta, w=shape[-1], h=shape[-2], ow=shape[-1], oh=shape[-2]
+    )
+
+    if isinstance(fill, int):
+        fill = tuple([fill] * 3)
+
+    return _grid_transform(img, grid, mode=interpolation, fill=fill)
+
+
+def flip_batch(img, flags, axis):
+    """Flips images in a batch of which flags are True along the axis.
+
+    Args:
+        img (paddle.Tensor): Images with shape (N, C, H, W).
+        flags (list|tuple): N bool flags of whether to flip each image.
+        axis (int): The axis to flip.
+
+    Returns:
+        paddle.Tensor: Flipped images.
+
+    """
+    _assert_image_batch(img)
+    flags = paddle.to_tensor(flags, dtype='bool', place=img.place)
+    return paddle.where(
+        flags.reshape([-1, 1, 1, 1]), img.flip(axis=[axis]), img
+    )
+
+
+def adjust_brightness_batch(img, brightness_factors):
+    """Adjusts brightness of each image in a batch by its own factor, see
+    :code:`adjust_brightness`.
+
+    Args:
+        img (paddle.Tensor): Images with shape (N, C, H, W).
+        brightness_factors (list|tuple): N non negative factors.
+
+    Returns:
+        paddle.Tensor: Brightness adjusted images.
+
+    """
+    _assert_image_batch(img)
+    ratio = _batch_factors(brightness_factors, img)
+    return _blend_images_batch(img, paddle.zeros_like(img), ratio)
+
+
+def adjust_contrast_batch(img, contrast_factors):
+    """Adjusts contrast of each image in a batch by its own factor, see
+    :code:`adjust_contrast`.
+
+    Args:
+        img (paddle.Tensor): Images with shape (N, C, H, W).
+        contrast_factors (list|tuple): N non negative factors.
+
+    Returns:
+        paddle.Tensor: Contrast adjusted images.
+
+    """
+    _assert_image_batch(img)
+    channels = _get_image_num_channels(img, 'CHW')
+    if channels == 1:
+        gray = img.astype('float32')
+    elif channels == 3:
+        gray = to_grayscale(img.astype('float32'))
+    else:
+        raise ValueError("channels of input should be either 1 or 3.")
+    extreme_target = paddle.mean(gray, axis=(-3, -2, -1), keepdim=True)
+    ratio = _batch_factors(contrast_factors, img)
+    return _blend_images_batch(img, extreme_target, ratio)
+
+
+def adjust_saturation_batch(img, saturation_factors):
+    """Adjusts color saturation of each image in a batch by its own factor,
+    see :code:`adjust_saturation`.
+
+    Args:
+        img (paddle.Tensor): Images with shape (N, C, H, W).
+        saturation_factors (list|tuple): N non negative factors.
+
+    Returns:
+        paddle.Tensor: Saturation adjusted images.
+
+    """
+    _assert_image_batch(img)
+    channels = _get_image_num_channels(img, 'CHW')
+    if channels == 1:
+        return img
+    elif channels != 3:
+        raise ValueError("channels of input should be either 1 or 3.")
+    ratio = _batch_factors(saturation_factors, img)
+    return _blend_images_batch(img, to_grayscale(img.astype('float32')), ratio)
+
+
+def adjust_hue_batch(img, hue_factors):
+    """Adjusts hue of each image in a batch by its own factor, see
+    :code:`adjust_hue`.
+
+    Args:
+        img (paddle.Tensor): Images with shape (N, C, H, W).
+        hue_factors (list|tuple): N factors in [-0.5, 0.5].
+
+    Returns:
+        paddle.Tensor: Hue adjusted images.
+
+    """
+    _assert_image_batch(img)
+    channels = _get_image_num_channels(img, 'CHW')
+    if channels == 1:
+        return img
+    elif channels != 3:
+        raise ValueError("channels of input should be either 1 or 3.")
+
+    dtype = img.dtype
+    if dtype == paddle.uint8:
+        img = img.astype(paddle.float32) / 255.0
+
+    h, s, v = _rgb_to_hsv(img).unbind(axis=-3)
+    h = h + _batch_factors(hue_factors, h).reshape([-1, 1, 1])
+    h = h - h.floor()
+    img_adjusted = _hsv_to_rgb(paddle.stack([h, s, v], axis=-3))
+
+    if dtype == paddle.uint8:
+        img_adjusted = (img_adjusted * 255.0).astype(dtype)
+    return img_adjusted
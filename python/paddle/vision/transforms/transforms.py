@@ -33,7 +33,12 @@ from typing_extensions import TypeAlias
 
 import paddle
 
-from . import functional as F
+from . import (
+    functional as F,
+    functional_cv2 as F_cv2,
+    functional_pil as F_pil,
+    functional_tensor as F_t,
+)
 
 if TYPE_CHECKING:
     import numpy.typing as npt
@@ -115,6 +120,15 @@ def _check_input(
     return value
 
 
+def _check_image_batch(images):
+    if not paddle.in_dynamic_mode():
+        raise RuntimeError("apply_batch only supports dynamic graph mode.")
+    if not isinstance(images, paddle.Tensor) or len(images.shape) != 4:
+        raise ValueError(
+            f"images should be a Tensor with shape (N, C, H, W), but got {type(images)}"
+        )
+
+
 class Compose(_Transform[_InputT, _RetT]):
     """
     Composes several transforms together use for composing list of transforms
@@ -167,6 +181,106 @@ class Compose(_Transform[_InputT, _RetT]):
                 raise e
         return data
 
+    def apply_batch(self, images: Tensor) -> Tensor:
+        """
+        Apply the transforms to a batch of images sequently, see
+        :code:`BaseTransform.apply_batch`. Transforms which are not
+        :code:`BaseTransform` are applied image by image.
+
+        Args:
+            images (Tensor): Images with shape (N, C, H, W).
+
+        Returns:
+            Tensor: Transformed images.
+
+        Examples:
+
+            .. code-block:: python
+
+                >>> import paddle
+                >>> from paddle.vision.transforms import (
+                ...     Compose, ColorJitter, Normalize, RandomHorizontalFlip, RandomResizedCrop
+                ... )
+                >>> transform = Compose([
+                ...     RandomResizedCrop(224),
+                ...     RandomHorizontalFlip(),
+                ...     ColorJitter(0.4, 0.4, 0.4),
+                ...     Normalize(mean=[0.5, 0.5, 0.5], std=[0.5, 0.5, 0.5]),
+                ... ])
+                >>> images = paddle.rand([8, 3, 256, 256])
+                >>> print(transform.apply_batch(images).shape)
+                [8, 3, 224, 224]
+        """
+        _check_image_batch(images)
+        for f in self.transforms:
+            try:
+                if isinstance(f, (BaseTransform, Compose)):
+                    images = f.apply_batch(images)
+                else:
+                    images = paddle.stack([f(img) for img in images.unbind(0)])
+            except Exception as e:
+                stack_info = traceback.format_exc()
+                print(
+                    f"fail to perform transform [{f}] with error: "
+                    f"{e} and stack:\n{stack_info}"
+                )
+                raise e
+        return images
+
+    def fuse(self) -> Compose[_InputT, _RetT]:
+        """
+        Return a new Compose in which common chains of transforms are fused,
+        so that images are processed in fewer passes without materializing
+        intermediate images:
+
+        - :code:`Resize` followed by :code:`CenterCrop` resamples only the
+          cropped region of the input image.
+        - :code:`ToTensor` followed by :code:`Normalize` scales and shifts
+          uint8 images in one pass.
+        - consecutive :code:`RandomAffine` with the same interpolation, fill
+          and center compose their matrices and resample the image once.
+
+        Only transforms with default :attr:`keys`, i.e. applied to images
+        only, are fused. Outputs are the same as the original transforms up
+        to interpolation error, except that pixels moved out and back in by
+        composed affine transforms are kept instead of filled. Images which
+        are not supported by a fused transform, e.g. numpy images with
+        interpolations other than "bilinear", are processed by the original
+        transforms.
+
+        Returns:
+            Compose: The Compose of fused transforms.
+
+        Examples:
+
+            .. code-block:: python
+
+                >>> import numpy as np
+                >>> from PIL import Image
+                >>> from paddle.vision.transforms import (
+                ...     Compose, CenterCrop, Normalize, Resize, ToTensor
+                ... )
+                >>> transform = Compose([
+                ...     Resize(256),
+                ...     CenterCrop(224),
+                ...     ToTensor(),
+                ...     Normalize(mean=[0.5, 0.5, 0.5], std=[0.5, 0.5, 0.5]),
+                ... ]).fuse()
+                >>> fake_img = Image.fromarray((np.random.rand(300, 320, 3) * 255.).astype(np.uint8))
+                >>> print(transform(fake_img).shape)
+                [3, 224, 224]
+        """
+        transforms = []
+        for t in self.transforms:
+            if isinstance(t, Compose):
+                t = t.fuse()
+            fused = _fuse_transforms(transforms[-1], t) if transforms else None
+            if fused is None:
+                transforms.append(t)
+            else:
+                transforms[-1] = fused
+        return Compose(transforms)
+
     def __repr__(self) -> str:
         format_string = self.__class__.__name__ + '('
         for t in self.transforms:
@@ -331,6 +445,26 @@ class BaseTransform(_Transform[_InputT, _RetT]):
             outputs = tuple(outputs)
         return outputs
 
+    def apply_batch(self, images: Tensor) -> Tensor:
+        """
+        Apply the transform to a batch of images with shape (N, C, H, W), such
+        as a collated batch or a batch on GPU, random parameters are drawn for
+        each image. Transforms implementing :code:`_apply_image_batch` process
+        the whole batch with a few tensor operations, others are applied
+        image by image. Only dynamic graph mode is supported.
+
+        Args:
+            images (Tensor): Images with shape (N, C, H, W).
+
+        Returns:
+            Tensor: Transformed images.
+        """
+        _check_image_batch(images)
+        apply_image_batch = getattr(self, '_apply_image_batch', None)
+        if apply_image_batch is None:
+            return paddle.stack([self(img) for img in images.unbind(0)])
+        return apply_image_batch(images)
+
     def _get_apply(self, key):
         return getattr(self, f"_apply_{key}", None)
 
@@ -485,6 +619,9 @@ class Resize(BaseTransform[_InputT, _RetT]):
     def _apply_image(self, img):
         return F.resize(img, self.size, self.interpolation)
 
+    def _apply_image_batch(self, images):
+        return F_t.resize(images, self.size, self.interpolation)
+
 
 class RandomResizedCrop(BaseTransform[_InputT, _RetT]):
     """Crop the input data to random size and aspect ratio.
@@ -711,6 +848,16 @@ class RandomResizedCrop(BaseTransform[_InputT, _RetT]):
         cropped_img = F.crop(img, i, j, h, w)
         return F.resize(cropped_img, self.size, self.interpolation)
 
+    def _apply_image_batch(self, images):
+        if self.interpolation not in ['nearest', 'bilinear']:
+            return paddle.stack([self(img) for img in images.unbind(0)])
+        boxes = [
+            self._dynamic_get_param(images[0]) for _ in range(images.shape[0])
+        ]
+        return F_t.resized_crop_batch(
+            images, boxes, self.size, self.interpolation
+        )
+
 
 class CenterCrop(BaseTransform[_InputT, _RetT]):
     """Crops the given the input data at the center.
@@ -756,6 +903,9 @@ class CenterCrop(BaseTransform[_InputT, _RetT]):
     def _apply_image(self, img):
         return F.center_crop(img, self.size)
 
+    def _apply_image_batch(self, images):
+        return F_t.center_crop(images, self.size)
+
 
 class RandomHorizontalFlip(BaseTransform[_InputT, _RetT]):
     """Horizontally flip the input data randomly with a given probability.
@@ -812,6 +962,10 @@ class RandomHorizontalFlip(BaseTransform[_InputT, _RetT]):
             return F.hflip(img)
         return img
 
+    def _apply_image_batch(self, images):
+        flags = [random.random() < self.prob for _ in range(images.shape[0])]
+        return F_t.flip_batch(images, flags, axis=-1)
+
     def _static_apply_image(self, img):
         return paddle.static.nn.cond(
             paddle.rand(shape=(1,)) < self.prob,
@@ -875,6 +1029,10 @@ class RandomVerticalFlip(BaseTransform[_InputT, _RetT]):
             return F.vflip(img)
         return img
 
+    def _apply_image_batch(self, images):
+        flags = [random.random() < self.prob for _ in range(images.shape[0])]
+        return F_t.flip_batch(images, flags, axis=-2)
+
     def _static_apply_image(self, img):
         return paddle.static.nn.cond(
             paddle.rand(shape=(1,)) < self.prob,
@@ -956,6 +1114,12 @@ class Normalize(BaseTransform[_InputT, _RetT]):
             img, self.mean, self.std, self.data_format, self.to_rgb
         )
 
+    def _apply_image_batch(self, images):
+        # mean and std of channels broadcast with a batch of CHW images
+        if self.data_format.upper() != 'CHW':
+            return paddle.stack([self(img) for img in images.unbind(0)])
+        return self._apply_image(images)
+
 
 class Transpose(BaseTransform[_InputT, _RetT]):
     """Transpose input data to a target format.
@@ -1063,6 +1227,16 @@ class BrightnessTransform(BaseTransform[_InputT, _RetT]):
         brightness_factor = random.uniform(self.value[0], self.value[1])
         return F.adjust_brightness(img, brightness_factor)
 
+    def _apply_image_batch(self, images):
+        if self.value is None:
+            return images
+
+        brightness_factors = [
+            random.uniform(self.value[0], self.value[1])
+            for _ in range(images.shape[0])
+        ]
+        return F_t.adjust_brightness_batch(images, brightness_factors)
+
 
 class ContrastTransform(BaseTransform[_InputT, _RetT]):
     """Adjust contrast of the image.
@@ -1112,6 +1286,16 @@ class ContrastTransform(BaseTransform[_InputT, _RetT]):
         contrast_factor = random.uniform(self.value[0], self.value[1])
         return F.adjust_contrast(img, contrast_factor)
 
+    def _apply_image_batch(self, images):
+        if self.value is None:
+            return images
+
+        contrast_factors = [
+            random.uniform(self.value[0], self.value[1])
+            for _ in range(images.shape[0])
+        ]
+        return F_t.adjust_contrast_batch(images, contrast_factors)
+
 
 class SaturationTransform(BaseTransform[_InputT, _RetT]):
     """Adjust saturation of the image.
@@ -1158,6 +1342,16 @@ class SaturationTransform(BaseTransform[_InputT, _RetT]):
         saturation_factor = random.uniform(self.value[0], self.value[1])
         return F.adjust_saturation(img, saturation_factor)
 
+    def _apply_image_batch(self, images):
+        if self.value is None:
+            return images
+
+        saturation_factors = [
+            random.uniform(self.value[0], self.value[1])
+            for _ in range(images.shape[0])
+        ]
+        return F_t.adjust_saturation_batch(images, saturation_factors)
+
 
 class HueTransform(BaseTransform[_InputT, _RetT]):
     """Adjust hue of the image.
@@ -1207,6 +1401,16 @@ class HueTransform(BaseTransform[_InputT, _RetT]):
         hue_factor = random.uniform(self.value[0], self.value[1])
         return F.adjust_hue(img, hue_factor)
 
+    def _apply_image_batch(self, images):
+        if self.value is None:
+            return images
+
+        hue_factors = [
+            random.uniform(self.value[0], self.value[1])
+            for _ in range(images.shape[0])
+        ]
+        return F_t.adjust_hue_batch(images, hue_factors)
+
 
 class ColorJitter(BaseTransform[_InputT, _RetT]):
     """Randomly change the brightness, contrast, saturation and hue of an image.
@@ -1305,6 +1509,14 @@ class ColorJitter(BaseTransform[_InputT, _RetT]):
         )
         return transform(img)
 
+    def _apply_image_batch(self, images):
+        # NOTE: factors are drawn for each image, while the order of the
+        # adjustments is shuffled once for the batch
+        transform = self._get_param(
+            self.brightness, self.contrast, self.saturation, self.hue
+        )
+        return transform.apply_batch(images)
+
 
 class RandomCrop(BaseTransform[_InputT, _RetT]):
     """Crops the given CV Image at a random location.
@@ -1734,6 +1946,37 @@ class RandomAffine(BaseTransform[_InputT, _RetT]):
             center=self.center,
         )
 
+    def _apply_image_batch(self, images):
+        if self.interpolation not in ['nearest', 'bilinear']:
+            return paddle.stack([self(img) for img in images.unbind(0)])
+
+        img_size = _get_image_size(images)
+        center = self._get_tensor_center(images)
+        matrices = [
+            self._get_matrix(img_size, center) for _ in range(images.shape[0])
+        ]
+        return F_t.affine_batch(images, matrices, self.interpolation, self.fill)
+
+    def _get_tensor_center(self, img):
+        # center relative to the image center, same as F.affine for tensor
+        # images
+        if self.center is None:
+            return [0.0, 0.0]
+        height, width = img.shape[-1], img.shape[-2]
+        return [
+            1.0 * (c - s * 0.5) for c, s in zip(self.center, [width, height])
+        ]
+
+    def _get_matrix(self, img_size, center):
+        # inverse affine matrix of random parameters, see F.affine
+        angle, translate, scale, shear = self._get_param(
+            img_size, self.degrees, self.translate, self.scale, self.shear
+        )
+        translate_f = [1.0 * t for t in translate]
+        return F._get_affine_matrix(
+            center, angle, translate_f, scale, list(shear)
+        )
+
 
 class RandomRotation(BaseTransform[_InputT, _RetT]):
     """Rotates the image by angle.
@@ -2337,3 +2580,200 @@ class RandomErasing(BaseTransform[_InputT, _RetT]):
                 lambda: self._static_apply_image(img),
                 lambda: img,
             )
+
+
+def _fuse_transforms(first, second):
+    # fuse two adjacent transforms, return None if they can not be fused
+    for t in (first, second):
+        if not isinstance(t, BaseTransform) or tuple(t.keys) != ('image',):
+            return None
+
+    if type(first) is Resize and type(second) is CenterCrop:
+        return _ResizeCenterCrop(first, second)
+
+    if (
+        type(first) is ToTensor
+        and type(second) is Normalize
+        and first.data_format == second.data_format
+        and len(second.mean) == len(second.std)
+    ):
+        return _ToTensorNormalize(first, second)
+
+    affines = (
+        first.transforms if isinstance(first, _RandomAffineChain) else [first]
+    )
+    if type(second) is RandomAffine and all(
+        type(t) is RandomAffine
+        and t.interpolation == second.interpolation
+        and t.fill == second.fill
+        and t.center == second.center
+        for t in affines
+    ):
+        return _RandomAffineChain([*affines, second])
+
+    return None
+
+
+class _ResizeCenterCrop(BaseTransform):
+    """
+    :code:`Resize` followed by :code:`CenterCrop`, only the cropped region of
+    the input image is resampled, see :code:`Compose.fuse`.
+    """
+
+    def __init__(self, resize, center_crop):
+        super().__init__()
+        self.resize = resize
+        self.center_crop = center_crop
+
+    def _get_region(self, img):
+        # the cropped region in pixels of the input image, None if the crop
+        # is not inside the resized image
+        w, h = _get_image_size(img)
+        size = self.resize.size
+        if isinstance(size, int):
+            # same as F.resize
+            if (w <= h and w == size) or (h <= w and h == size):
+                oh, ow = h, w
+            elif w < h:
+                oh, ow = int(size * h / w), size
+            else:
+                oh, ow = size, int(size * w / h)
+        else:
+            oh, ow = size
+
+        th, tw = self.center_crop.size
+        if th > oh or tw > ow:
+            return None
+        top = int(round((oh - th) / 2.0))
+        left = int(round((ow - tw) / 2.0))
+        scale_y = h / oh
+        scale_x = w / ow
+        return top * scale_y, left * scale_x, th * scale_y, tw * scale_x
+
+    def _apply_image(self, img):
+        # NOTE: cv2.resize and F.interpolate sample the same points as the
+        # single resample only with "bilinear" interpolation
+        resized_crop = None
+        if F._is_pil_image(img):
+            resized_crop = F_pil.resized_crop
+        elif self.resize.interpolation == 'bilinear':
+            if F._is_numpy_image(img):
+                resized_crop = F_cv2.resized_crop
+            elif F._is_tensor_image(img) and paddle.in_dynamic_mode():
+                resized_crop = F_t.resized_crop
+
+        region = None if resized_crop is None else self._get_region(img)
+        if region is None:
+            return self.center_crop(self.resize(img))
+        return resized_crop(
+            img, *region, self.center_crop.size, self.resize.interpolation
+        )
+
+    def _apply_image_batch(self, images):
+        region = None
+        if self.resize.interpolation == 'bilinear':
+            region = self._get_region(images)
+        if region is None:
+            return self.center_crop.apply_batch(self.resize.apply_batch(images))
+        return F_t.resized_crop_batch(
+            images, [region] * images.shape[0], self.center_crop.size
+        )
+
+
+class _ToTensorNormalize(BaseTransform):
+    """
+    :code:`ToTensor` followed by :code:`Normalize`, uint8 images are scaled
+    and shifted by ``img * (1 / (255 * std)) - mean / std`` in one pass, see
+    :code:`Compose.fuse`.
+    """
+
+    def __init__(self, to_tensor, normalize):
+        super().__init__()
+        self.to_tensor = to_tensor
+        self.normalize = normalize
+        std = np.asarray(normalize.std, dtype=np.float32)
+        self._scale = 1.0 / (255.0 * std)
+        self._shift = np.asarray(normalize.mean, dtype=np.float32) / std
+
+    def _apply_image(self, img):
+        arr = None
+        if F._is_pil_image(img):
+            # same as F.to_tensor, other modes are not scaled by 255
+            if img.mode not in ['1', 'I', 'I;16', 'F']:
+                arr = np.asarray(img).reshape((img.size[1], img.size[0], -1))
+        elif F._is_numpy_image(img):
+            arr = img if img.ndim == 3 else img[:, :, np.newaxis]
+
+        if (
+            arr is None
+            or arr.dtype != np.uint8
+            or arr.shape[2] != len(self._scale)
+        ):
+            return self.normalize(self.to_tensor(img))
+
+        scale, shift = self._scale, self._shift
+        if self.to_tensor.data_format == 'CHW':
+            arr = arr.transpose((2, 0, 1))
+            scale = scale.reshape((-1, 1, 1))
+            shift = shift.reshape((-1, 1, 1))
+        out = np.empty(arr.shape, dtype=np.float32)
+        np.multiply(arr, scale, out=out)
+        out -= shift
+        return paddle.to_tensor(out)
+
+    def _apply_image_batch(self, images):
+        return self.normalize.apply_batch(self.to_tensor.apply_batch(images))
+
+
+class _RandomAffineChain(BaseTransform):
+    """
+    Consecutive :code:`RandomAffine` with the same interpolation, fill and
+    center. Random parameters are drawn by each transform in order, and their
+    inverse matrices are composed to resample the image once, see
+    :code:`Compose.fuse`. numpy images are transformed one by one, since
+    matrices of cv2 backend are computed in F_cv2.affine.
+    """
+
+    def __init__(self, transforms):
+        super().__init__()
+        self.transforms = transforms
+
+    def _get_matrix(self, img_size, center):
+        # output pixels are mapped back by the last transform first
+        matrix = np.eye(3)
+        for t in self.transforms:
+            matrix = matrix @ np.vstack(
+                [np.reshape(t._get_matrix(img_size, center), (2, 3)), [0, 0, 1]]
+            )
+        return matrix[:2].reshape(-1).tolist()
+
+    def _apply_image(self, img):
+        first = self.transforms[0]
+        img_size = _get_image_size(img)
+        if F._is_pil_image(img):
+            center = first.center
+            if center is None:
+                center = [img_size[0] * 0.5, img_size[1] * 0.5]
+            matrix = self._get_matrix(img_size, center)
+            return F_pil.affine(img, matrix, first.interpolation, first.fill)
+        elif F._is_tensor_image(img):
+            matrix = self._get_matrix(img_size, first._get_tensor_center(img))
+            return F_t.affine(img, matrix, first.interpolation, first.fill)
+
+        for t in self.transforms:
+            img = t(img)
+        return img
+
+    def _apply_image_batch(self, images):
+        first = self.transforms[0]
+        if first.interpolation not in ['nearest', 'bilinear']:
+            return paddle.stack([self(img) for img in images.unbind(0)])
+
+        img_size = _get_image_size(images)
+        center = first._get_tensor_center(images)
+        matrices = [
+            self._get_matrix(img_size, center) for _ in range(images.shape[0])
+        ]
+        return F_t.affine_batch(
+            images, matrices, first.interpolation, first.fill
+        )
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import tempfile
 import unittest
 from collections import Counter
 
@@ -24,7 +26,11 @@ from dygraph_to_static_utils import (
 from test_fetch_feed import Linear, Pool2D
 
 import paddle
+from paddle.jit.cache_budget import get_cache_budget
 from paddle.jit.dy2static import convert_to_static
+from paddle.jit.dy2static.persistent_cache import ENV_TO_STATIC_CACHE_DIR
+from paddle.jit.dy2static.program_translator import FunctionCache
+from paddle.utils.environments import EnvironmentVariableGuard
 
 
 class TestCacheProgram(Dy2StTestBase):
@@ -144,6 +150,84 @@ class TestConvertWithCache(Dy2StTestBase):
         self.assertTrue(id(static_func), id(cached_func))
 
 
+class TestPersistentAstCache(Dy2StTestBase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def cached_files(self):
+        return [
+            name
+            for _, _, names in os.walk(self.temp_dir.name)
+            for name in names
+        ]
+
+    def test_cache(self):
+        x = paddle.to_tensor(np.random.random((2, 3)).astype('float32'))
+        with EnvironmentVariableGuard(
+            ENV_TO_STATIC_CACHE_DIR, self.temp_dir.name
+        ):
+            static_func = FunctionCache().convert_with_cache(simple_func)
+            self.assertEqual(len(self.cached_files()), 1)
+
+            # a new process loads the transformed AST from disk, without
+            # transforming it again
+            function_cache = FunctionCache()
+            function_cache._dygraph_to_static = None
+            cached_func = function_cache.convert_with_cache(simple_func)
+            self.assertEqual(len(self.cached_files()), 1)
+
+        np.testing.assert_allclose(
+            static_func(x).numpy(), cached_func(x).numpy()
+        )
+
+
+class TestCacheBudget(Dy2StTestBase):
+    def setUp(self):
+        self.budget = get_cache_budget()
+        self.limits = (self.budget.max_entries, self.budget.max_bytes)
+
+    def tearDown(self):
+        paddle.jit.set_cache_budget(*self.limits)
+
+    @test_ast_only
+    def test_lru_eviction(self):
+        paddle.jit.set_cache_budget(max_entries=2, max_bytes=0)
+        static_func = paddle.jit.to_static(simple_func)
+        self.budget.reset_stats()
+        for shape in [[2], [3], [2], [4], [3]]:
+            static_func(paddle.rand(shape))
+        # [3] is evicted by [4] since [2] is used more recently
+        stats = paddle.jit.cache_stats()['program_cache']
+        self.assertEqual(stats['misses'], 4)
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['evictions'], 2)
+        self.assertEqual(stats['entries'], 2)
+        self.assertEqual(len(static_func._program_cache), 2)
+
+    @test_ast_only
+    def test_keep_recent_program(self):
+        paddle.jit.set_cache_budget(max_entries=1, max_bytes=0)
+        static_func1 = paddle.jit.to_static(simple_func)
+        static_func2 = paddle.jit.to_static(simple_func)
+        static_func1(paddle.rand([2]))
+        static_func2(paddle.rand([3]))
+        # the most recently used program of each function is not evicted
+        self.assertEqual(len(static_func1._program_cache), 1)
+        self.assertEqual(len(static_func2._program_cache), 1)
+        self.assertIsNotNone(static_func1.concrete_program)
+
+        static_func1(paddle.rand([4]))
+        self.assertEqual(len(static_func1._program_cache), 1)
+        self.assertEqual(len(static_func2._program_cache), 1)
+
+    def test_invalid_budget(self):
+        with self.assertRaises(ValueError):
+            paddle.jit.set_cache_budget(max_entries=-1)
+
+
 def sum_even_until_limit(max_len, limit):
     ret_sum = paddle.to_tensor(np.zeros(1).astype('int32'))
     for i in range(max_len):
@@ -0,0 +1,114 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+from dygraph_to_static_utils import Dy2StTestBase, test_ast_only
+
+import paddle
+
+
+def scale_and_sum(x, y):
+    # padded positions are zeros, so they do not change the sum
+    return x * 2 + 1, paddle.sum(x * y, axis=1)
+
+
+def scale_and_hidden(x, hidden):
+    return x * 2, hidden + paddle.sum(x)
+
+
+class TestShapeBucketPolicy(Dy2StTestBase):
+    def test_bucket_length(self):
+        policy = paddle.jit.ShapeBucketPolicy()
+        self.assertEqual(
+            [policy.bucket_length(n) for n in [1, 3, 4, 5, 9]],
+            [1, 4, 4, 8, 16],
+        )
+        policy = paddle.jit.ShapeBucketPolicy(buckets=[8, 32])
+        self.assertEqual(
+            [policy.bucket_length(n) for n in [1, 8, 9, 33]],
+            [8, 8, 32, 33],
+        )
+
+    def test_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            paddle.jit.ShapeBucketPolicy(buckets=[8, 4])
+        with self.assertRaises(ValueError):
+            paddle.jit.ShapeBucketPolicy(buckets=[])
+        with self.assertRaises(TypeError):
+            paddle.jit.ShapeBucketPolicy(output_axes=[1.0])
+        with self.assertRaises(TypeError):
+            paddle.jit.to_static(scale_and_sum, bucket_policy=[8])
+
+    def test_padding(self):
+        static_fn = paddle.jit.to_static(
+            scale_and_sum,
+            bucket_policy=paddle.jit.ShapeBucketPolicy(
+                axis=1, output_axes=[1, None]
+            ),
+        )
+        for length in [3, 5, 6, 7, 8]:
+            x = paddle.rand([2, length])
+            y = paddle.rand([2, length])
+            out, total = static_fn(x, y)
+            expected_out, expected_total = scale_and_sum(x, y)
+            self.assertEqual(out.shape, [2, length])
+            np.testing.assert_allclose(
+                out.numpy(), expected_out.numpy(), rtol=1e-05
+            )
+            np.testing.assert_allclose(
+                total.numpy(), expected_total.numpy(), rtol=1e-05
+            )
+
+    def test_output_axes(self):
+        x = paddle.rand([2, 5])
+        hidden = paddle.rand([2, 8])
+        # outputs are not sliced by default, even if their lengths are the
+        # bucket length
+        static_fn = paddle.jit.to_static(
+            scale_and_hidden,
+            bucket_policy=paddle.jit.ShapeBucketPolicy(
+                axis=1, input_names=['x']
+            ),
+        )
+        out, out_hidden = static_fn(x, hidden)
+        self.assertEqual(out.shape, [2, 8])
+        self.assertEqual(out_hidden.shape, [2, 8])
+
+        static_fn = paddle.jit.to_static(
+            scale_and_hidden,
+            bucket_policy=paddle.jit.ShapeBucketPolicy(
+                axis=1, input_names=['x'], output_axes=[1, None]
+            ),
+        )
+        out, out_hidden = static_fn(x, hidden)
+        self.assertEqual(out.shape, [2, 5])
+        self.assertEqual(out_hidden.shape, [2, 8])
+        np.testing.assert_allclose(out.numpy(), x.numpy() * 2, rtol=1e-05)
+
+    @test_ast_only
+    def test_bounded_programs(self):
+        static_fn = paddle.jit.to_static(
+            scale_and_sum,
+            bucket_policy=paddle.jit.ShapeBucketPolicy(axis=1),
+        )
+        for length in [5, 6, 7, 8, 3]:
+            static_fn(paddle.rand([2, length]), paddle.rand([2, length]))
+        # lengths are padded to 4 and 8
+        self.assertEqual(len(static_fn._program_cache), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
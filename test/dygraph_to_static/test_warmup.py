@@ -0,0 +1,95 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+from dygraph_to_static_utils import Dy2StTestBase, test_ast_only
+
+import paddle
+
+
+def scale(x, factor=2, shift=None):
+    out = x * factor
+    if shift is not None:
+        out = out + shift[0]
+    return out
+
+
+class TestWarmup(Dy2StTestBase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'signatures.json')
+        paddle.jit.record_input_signatures(True)
+
+    def tearDown(self):
+        paddle.jit.record_input_signatures(False)
+        self.temp_dir.cleanup()
+
+    def record(self):
+        static_fn = paddle.jit.to_static(scale)
+        static_fn(paddle.rand([2, 3]))
+        static_fn(paddle.rand([4, 3]), factor=3)
+        static_fn(paddle.rand([4, 3]), shift=(paddle.rand([3]),))
+        # the same signature is recorded once
+        static_fn(paddle.rand([2, 3]))
+        # inputs which can not be saved are not recorded
+        static_fn(paddle.rand([2, 3]), shift=range(1))
+        paddle.jit.save_input_signatures({'scale': static_fn}, self.path)
+
+    def test_save(self):
+        self.record()
+        with open(self.path) as f:
+            manifest = json.load(f)
+        self.assertEqual(manifest['version'], 1)
+        self.assertEqual(len(manifest['functions']['scale']), 3)
+
+    @test_ast_only
+    def test_warmup(self):
+        self.record()
+        paddle.jit.record_input_signatures(False)
+        static_fn = paddle.jit.to_static(scale)
+        future = paddle.jit.warmup({'scale': static_fn}, self.path)
+        self.assertEqual(future.result(), 3)
+        self.assertEqual(len(static_fn._program_cache), 3)
+
+        # calls of the recorded signatures hit the warmed up programs
+        x = paddle.rand([4, 3])
+        out = static_fn(x, factor=3)
+        np.testing.assert_allclose(out.numpy(), x.numpy() * 3, rtol=1e-05)
+        static_fn(paddle.rand([2, 3]))
+        self.assertEqual(len(static_fn._program_cache), 3)
+
+    def test_warmup_in_current_thread(self):
+        self.record()
+        static_fn = paddle.jit.to_static(scale)
+        num_warmed = paddle.jit.warmup(
+            {'scale': static_fn}, self.path, background=False
+        )
+        self.assertEqual(num_warmed, 3)
+
+    def test_invalid_manifest(self):
+        with open(self.path, 'w') as f:
+            json.dump({'version': 0, 'functions': {}}, f)
+        with self.assertRaises(ValueError):
+            paddle.jit.warmup({}, self.path)
+        with self.assertRaises(TypeError):
+            paddle.jit.save_input_signatures({'scale': scale}, self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -158,6 +158,47 @@ class TestAudioBackends(unittest.TestCase):
         if os.path.exists(wave_wav_path):
             os.remove(wave_wav_path)
 
+    def test_stream(self):
+        base_dir = os.getcwd()
+        wave_wav_path = os.path.join(base_dir, "wave_stream_test.wav")
+        waveform = np.random.uniform(-0.5, 0.5, (2, 8000)).astype('float32')
+        paddle.audio.save(wave_wav_path, paddle.to_tensor(waveform), self.sr)
+        wav_data, _ = paddle.audio.load(wave_wav_path)
+
+        chunks = list(
+            paddle.audio.stream(wave_wav_path, 3000, frame_offset=500)
+        )
+        self.assertEqual([offset for offset, _ in chunks], [500, 3500, 6500])
+        self.assertEqual(chunks[-1][1].shape, [2, 1500])
+        np.testing.assert_array_equal(
+            paddle.concat([chunk for _, chunk in chunks], axis=-1).numpy(),
+            wav_data.numpy()[:, 500:],
+        )
+        part, _ = paddle.audio.load(
+            wave_wav_path, frame_offset=500, num_frames=3000
+        )
+        np.testing.assert_array_equal(part.numpy(), chunks[0][1].numpy())
+
+        # streaming features are the same as features of the whole waveform
+        for center in [True, False]:
+            feature_extractor = paddle.audio.features.MelSpectrogram(
+                sr=self.sr, n_fft=512, hop_length=160, center=center
+            )
+            expect = feature_extractor(wav_data)
+            feats = []
+            for offset, chunk in paddle.audio.stream(wave_wav_path, 1000):
+                last = offset + chunk.shape[-1] == 8000
+                feats.append(feature_extractor.forward_stream(chunk, last))
+            np.testing.assert_allclose(
+                paddle.concat(feats, axis=-1).numpy(),
+                expect.numpy(),
+                rtol=1e-4,
+                atol=1e-4,
+            )
+
+        if os.path.exists(wave_wav_path):
+            os.remove(wave_wav_path)
+
 
 if __name__ == '__main__':
     unittest.main()
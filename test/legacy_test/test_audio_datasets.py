@@ -12,7 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import itertools
+import os
+import tempfile
 import unittest
+import wave
 
 import numpy as np
 from parameterized import parameterized
@@ -116,5 +119,75 @@ class TestAudioDatasets(unittest.TestCase):
         self.assertTrue(0 <= elem[1] <= 2)
 
 
+class TestAudioDatasetFeatCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.sr = 16000
+        self.files = []
+        for i, length in enumerate([4000, 4000, 4000, 3000]):
+            file = os.path.join(self.temp_dir.name, f'{i}.wav')
+            data = (np.random.uniform(-0.5, 0.5, length) * 32767).astype(
+                'int16'
+            )
+            with wave.open(file, 'wb') as f:
+                f.setnchannels(1)
+                f.setsampwidth(2)
+                f.setframerate(self.sr)
+                f.writeframes(data.tobytes())
+            self.files.append(file)
+        self.labels = [0, 1, 0, 1]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_feat_cache(self):
+        paddle.disable_static()
+        cache_dir = os.path.join(self.temp_dir.name, 'cache')
+        dataset = paddle.audio.datasets.dataset.AudioClassificationDataset(
+            self.files,
+            self.labels,
+            feat_type='mfcc',
+            feat_cache_dir=cache_dir,
+            n_mfcc=20,
+        )
+        feats = dataset.extract_features(list(range(4)), batch_size=2)
+        self.assertEqual(len(dataset._feature_extractors), 1)
+
+        mfcc = paddle.audio.features.MFCC(sr=self.sr, n_mfcc=20)
+        for file, feat in zip(self.files, feats):
+            waveform, _ = paddle.audio.load(file)
+            expect = mfcc(waveform).squeeze(0)
+            np.testing.assert_allclose(
+                feat.numpy(), expect.numpy(), rtol=1e-4, atol=1e-4
+            )
+        cache_files = os.listdir(os.path.join(cache_dir, 'v1'))
+        self.assertEqual(len(cache_files), 4)
+
+        # features are loaded from cache by a new dataset of the same config
+        dataset = paddle.audio.datasets.dataset.AudioClassificationDataset(
+            self.files,
+            self.labels,
+            feat_type='mfcc',
+            feat_cache_dir=cache_dir,
+            n_mfcc=20,
+        )
+        for idx in range(4):
+            feat, label = dataset[idx]
+            np.testing.assert_allclose(feat.numpy(), feats[idx].numpy())
+            self.assertEqual(label, self.labels[idx])
+        self.assertEqual(len(dataset._feature_extractors), 0)
+
+        # a different config does not hit the cache
+        dataset = paddle.audio.datasets.dataset.AudioClassificationDataset(
+            self.files,
+            self.labels,
+            feat_type='mfcc',
+            feat_cache_dir=cache_dir,
+            n_mfcc=10,
+        )
+        self.assertEqual(dataset[0][0].shape[0], 10)
+        self.assertEqual(len(os.listdir(os.path.join(cache_dir, 'v1'))), 5)
+
+
 if __name__ == '__main__':
     unittest.main()
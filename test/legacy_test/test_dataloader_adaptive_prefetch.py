@@ -0,0 +1,107 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import time
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.io import DataLoader, Dataset
+from paddle.io.dataloader.adaptive import (
+    _AdaptivePrefetchController,
+    _parse_adaptive_prefetch,
+)
+
+
+class SlowDataset(Dataset):
+    def __init__(self, sample_num, delay):
+        self.sample_num = sample_num
+        self.delay = delay
+
+    def __getitem__(self, idx):
+        time.sleep(self.delay)
+        return np.array([idx]).astype('int64')
+
+    def __len__(self):
+        return self.sample_num
+
+
+class TestAdaptivePrefetchController(unittest.TestCase):
+    def run_steps(self, controller, wait_time, producer_wait, steps):
+        for _ in range(steps):
+            controller.add_producer_wait(producer_wait)
+            controller.update(wait_time)
+
+    def test_shrink_when_idle(self):
+        controller = _AdaptivePrefetchController(2, 8, 1, 4, interval=2)
+        self.assertEqual(controller.inflight, 8)
+        self.assertEqual(controller.num_workers, 4)
+        # consumer never waits, in-flight batches shrink first
+        for _ in range(20):
+            self.run_steps(controller, 0.0, 0.0, 3)
+        self.assertEqual(controller.inflight, 2)
+        self.assertEqual(controller.num_workers, 1)
+
+    def test_grow_when_starved(self):
+        controller = _AdaptivePrefetchController(2, 8, 1, 4, interval=2)
+        controller.inflight, controller.num_workers = 2, 1
+        for _ in range(20):
+            controller.add_producer_wait(1.0)
+            controller.update(1.0)
+            time.sleep(0.001)
+        self.assertEqual(controller.num_workers, 4)
+        self.assertEqual(controller.inflight, 8)
+
+    def test_parse(self):
+        self.assertIsNone(_parse_adaptive_prefetch(False))
+        self.assertEqual(_parse_adaptive_prefetch(True), {})
+        self.assertEqual(
+            _parse_adaptive_prefetch({'min_num_workers': 2}),
+            {'min_num_workers': 2},
+        )
+        with self.assertRaises(ValueError):
+            _parse_adaptive_prefetch({'max_num_workers': 2})
+        with self.assertRaises(TypeError):
+            _parse_adaptive_prefetch(1)
+
+
+class TestDataLoaderAdaptivePrefetch(unittest.TestCase):
+    def test_main(self):
+        # DataLoader with multi-process mode is not supported on MacOs and Windows currently
+        if sys.platform == 'darwin' or sys.platform == 'win32':
+            return
+        paddle.disable_static()
+        loader = DataLoader(
+            SlowDataset(64, 0.001),
+            batch_size=2,
+            num_workers=4,
+            prefetch_factor=4,
+            persistent_workers=True,
+            adaptive_prefetch={'interval': 4, 'min_num_workers': 2},
+        )
+        for _ in range(2):
+            indices = []
+            for data in loader:
+                indices.extend(data.numpy().flatten().tolist())
+            self.assertEqual(indices, list(range(64)))
+
+        controller = loader._iterator._prefetch_controller
+        self.assertGreaterEqual(controller.num_workers, 2)
+        self.assertLessEqual(controller.num_workers, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -97,6 +97,28 @@ class TestAutoTune(unittest.TestCase):
             self.dataset, batch_sampler=batch_sampler, num_workers=2
         )
 
+    def test_length_bucket_batch_sampler_autotune(self):
+        paddle.incubate.autotune.set_config(
+            config={
+                "dataloader": {
+                    "enable": True,
+                    "tuning_steps": 1,
+                }
+            }
+        )
+        batch_sampler = paddle.text.LengthBucketBatchSampler(
+            np.arange(len(self.dataset)), batch_size=2
+        )
+        # autotune is skipped for batch samplers other than BatchSampler
+        loader = DataLoader(
+            self.dataset, batch_sampler=batch_sampler, num_workers=2
+        )
+        if sys.platform == 'darwin' or sys.platform == 'win32':
+            self.assertEqual(loader.num_workers, 0)
+        else:
+            self.assertEqual(loader.num_workers, 2)
+        self.assertEqual(len(list(loader)), len(batch_sampler))
+
 
 class TestAutoTuneAPI(unittest.TestCase):
     def test_set_config_warnings(self):
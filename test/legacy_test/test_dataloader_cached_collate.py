@@ -0,0 +1,124 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.io import DataLoader, Dataset
+from paddle.io.dataloader.collate import CachedCollateFn, default_collate_fn
+
+
+class TabularDataset(Dataset):
+    def __init__(self, sample_num):
+        self.sample_num = sample_num
+
+    def __getitem__(self, idx):
+        return {
+            'dense': np.full([4], idx, dtype='float32'),
+            'sparse': [idx, idx * 2, float(idx) / 2],
+            'name': f'sample_{idx}',
+            'label': np.array([idx % 2], dtype='int64'),
+        }
+
+    def __len__(self):
+        return self.sample_num
+
+
+class TestCachedCollateFn(unittest.TestCase):
+    def check_same(self, out, expect):
+        if isinstance(expect, np.ndarray):
+            np.testing.assert_array_equal(out, expect)
+            self.assertEqual(out.dtype, expect.dtype)
+        elif isinstance(expect, dict):
+            self.assertEqual(list(out.keys()), list(expect.keys()))
+            for k in expect:
+                self.check_same(out[k], expect[k])
+        elif isinstance(expect, str):
+            self.assertEqual(out, expect)
+        else:
+            self.assertEqual(len(out), len(expect))
+            for o, e in zip(out, expect):
+                self.check_same(o, e)
+
+    def test_same_as_default(self):
+        dataset = TabularDataset(10)
+        for reuse_buffers in [True, False]:
+            collate_fn = CachedCollateFn(reuse_buffers)
+            for indices in [range(4), range(4, 8), range(8, 10)]:
+                batch = [dataset[i] for i in indices]
+                self.check_same(collate_fn(batch), default_collate_fn(batch))
+
+    def test_reuse_buffers(self):
+        batch = [np.full([2], i, dtype='float32') for i in range(3)]
+        collate_fn = CachedCollateFn(reuse_buffers=True)
+        out1 = collate_fn(batch)
+        out2 = collate_fn(batch[::-1])
+        self.assertTrue(np.shares_memory(out1, out2))
+
+        collate_fn = CachedCollateFn(reuse_buffers=False)
+        out1 = collate_fn(batch)
+        out2 = collate_fn(batch[::-1])
+        self.assertFalse(np.shares_memory(out1, out2))
+
+    def test_variable_shape(self):
+        collate_fn = CachedCollateFn()
+        out = collate_fn([np.zeros([2, 3])] * 2)
+        self.assertEqual(out.shape, (2, 2, 3))
+        out = collate_fn([np.zeros([5])] * 3)
+        self.assertEqual(out.shape, (3, 5))
+
+    def test_number_dtype(self):
+        for reuse_buffers in [True, False]:
+            collate_fn = CachedCollateFn(reuse_buffers)
+            # floats after ints of the first batch are not truncated
+            for batch in [[1, 2], [1, 2.5], [0.5, 1.5], [3, 4]]:
+                self.check_same(collate_fn(batch), default_collate_fn(batch))
+
+    def test_unsupported_type(self):
+        with self.assertRaises(TypeError):
+            CachedCollateFn()([None, None])
+
+
+class TestDataLoaderWithCachedCollateFn(unittest.TestCase):
+    def run_main(self, num_workers, use_shared_memory):
+        paddle.disable_static()
+        loader = DataLoader(
+            TabularDataset(20),
+            batch_size=4,
+            num_workers=num_workers,
+            use_shared_memory=use_shared_memory,
+            collate_fn=CachedCollateFn(),
+        )
+        dense = []
+        for data in loader:
+            dense.append(data['dense'].numpy())
+            self.assertEqual(len(data['name']), 4)
+        return np.concatenate(dense)
+
+    def test_main(self):
+        expect = np.repeat(np.arange(20, dtype='float32'), 4).reshape([20, 4])
+        np.testing.assert_array_equal(self.run_main(0, False), expect)
+        # DataLoader with multi-process mode is not supported on MacOs and Windows currently
+        if sys.platform != 'darwin' and sys.platform != 'win32':
+            for use_shared_memory in [False, True]:
+                np.testing.assert_array_equal(
+                    self.run_main(2, use_shared_memory), expect
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
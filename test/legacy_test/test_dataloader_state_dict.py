@@ -0,0 +1,172 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.io import (
+    BatchSampler,
+    DataLoader,
+    Dataset,
+    DistributedBatchSampler,
+    IterableDataset,
+    get_worker_info,
+)
+
+SAMPLE_NUM = 40
+BATCH_SIZE = 4
+BREAK_STEP = 3
+
+
+class RandomDataset(Dataset):
+    def __init__(self, sample_num):
+        self.sample_num = sample_num
+        self.read_indices = []
+
+    def __getitem__(self, idx):
+        self.read_indices.append(idx)
+        return np.array([idx]).astype('int64')
+
+    def __len__(self):
+        return self.sample_num
+
+
+class RangeIterableDataset(IterableDataset):
+    def __init__(self, sample_num):
+        self.sample_num = sample_num
+
+    def __iter__(self):
+        worker_info = get_worker_info()
+        if worker_info is None:
+            start, step = 0, 1
+        else:
+            start, step = worker_info.id, worker_info.num_workers
+        for idx in range(start, self.sample_num, step):
+            yield np.array([idx]).astype('int64')
+
+
+def get_loader(dataset, num_workers, shuffle=False, persistent_workers=False):
+    return DataLoader(
+        dataset,
+        batch_size=BATCH_SIZE,
+        shuffle=shuffle,
+        num_workers=num_workers,
+        persistent_workers=persistent_workers,
+    )
+
+
+def labels(data):
+    return data.numpy().flatten().tolist()
+
+
+class TestSamplerStateDict(unittest.TestCase):
+    def test_batch_sampler(self):
+        dataset = RandomDataset(SAMPLE_NUM)
+        sampler = BatchSampler(dataset, batch_size=BATCH_SIZE, shuffle=True)
+        expect = list(sampler)
+        state = sampler.state_dict()
+        # draw another epoch to change numpy random state
+        list(sampler)
+        sampler.load_state_dict(state)
+        self.assertEqual(list(sampler), expect)
+
+    def test_distributed_batch_sampler(self):
+        dataset = RandomDataset(SAMPLE_NUM)
+        sampler = DistributedBatchSampler(
+            dataset, batch_size=BATCH_SIZE, num_replicas=2, rank=0, shuffle=True
+        )
+        list(sampler)
+        expect = list(sampler)
+        state = sampler.state_dict()
+        self.assertEqual(state, {'epoch': 1})
+
+        sampler = DistributedBatchSampler(
+            dataset, batch_size=BATCH_SIZE, num_replicas=2, rank=0, shuffle=True
+        )
+        sampler.load_state_dict(state)
+        self.assertEqual(list(sampler), expect)
+
+
+class TestDataLoaderStateDict(unittest.TestCase):
+    def run_resume(self, num_workers, shuffle, persistent_workers=False):
+        paddle.disable_static()
+        np.random.seed(2024)
+        dataset = RandomDataset(SAMPLE_NUM)
+        loader = get_loader(dataset, num_workers, shuffle, persistent_workers)
+        expect = []
+        state = None
+        for i, data in enumerate(loader):
+            expect.extend(labels(data))
+            if i == BREAK_STEP - 1:
+                state = loader.state_dict()
+        self.assertEqual(state['consumed_batches'], BREAK_STEP)
+
+        # resume in a new DataLoader after numpy random state changed
+        np.random.seed(0)
+        dataset = RandomDataset(SAMPLE_NUM)
+        loader = get_loader(dataset, num_workers, shuffle, persistent_workers)
+        loader.load_state_dict(state)
+        resumed = []
+        for data in loader:
+            resumed.extend(labels(data))
+        self.assertEqual(resumed, expect[BREAK_STEP * BATCH_SIZE :])
+        if num_workers == 0:
+            # consumed samples are not read from dataset
+            self.assertEqual(sorted(dataset.read_indices), sorted(resumed))
+
+        # state only applies to the next iterator
+        self.assertEqual(len(list(loader)), SAMPLE_NUM // BATCH_SIZE)
+
+    def run_iterable_resume(self, num_workers):
+        paddle.disable_static()
+        loader = get_loader(RangeIterableDataset(SAMPLE_NUM), num_workers)
+        expect = []
+        for i, data in enumerate(loader):
+            expect.extend(labels(data))
+            if i == BREAK_STEP - 1:
+                state = loader.state_dict()
+                consumed = list(expect)
+        self.assertEqual(len(state['iterable_offsets']), max(num_workers, 1))
+        self.assertEqual(sum(state['iterable_offsets']), BREAK_STEP)
+
+        loader = get_loader(RangeIterableDataset(SAMPLE_NUM), num_workers)
+        loader.load_state_dict(state)
+        resumed = []
+        for data in loader:
+            resumed.extend(labels(data))
+        # each sample is produced once over the two runs
+        self.assertEqual(sorted(consumed + resumed), list(range(SAMPLE_NUM)))
+
+    def test_single_process(self):
+        for shuffle in [False, True]:
+            self.run_resume(0, shuffle)
+        self.run_iterable_resume(0)
+
+    def test_multi_process(self):
+        # DataLoader with multi-process mode is not supported on MacOs and Windows currently
+        if sys.platform != 'darwin' and sys.platform != 'win32':
+            for persistent_workers in [False, True]:
+                self.run_resume(2, True, persistent_workers)
+            self.run_iterable_resume(2)
+
+    def test_no_iterator(self):
+        loader = get_loader(RandomDataset(SAMPLE_NUM), 0)
+        self.assertEqual(loader.state_dict(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import time
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.io import DataLoader, Dataset
+from paddle.io.dataloader.stats import MAIN_PROCESS_WORKER_ID
+
+SAMPLE_NUM = 32
+BATCH_SIZE = 4
+
+
+class SlowDataset(Dataset):
+    def __getitem__(self, idx):
+        time.sleep(0.001)
+        return np.array([idx]).astype('float32')
+
+    def __len__(self):
+        return SAMPLE_NUM
+
+
+def slow_collate_fn(batch):
+    time.sleep(0.002)
+    return np.stack(batch)
+
+
+class TestDataLoaderStats(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+
+    def run_main(self, num_workers):
+        loader = DataLoader(
+            SlowDataset(),
+            batch_size=BATCH_SIZE,
+            num_workers=num_workers,
+            collate_fn=slow_collate_fn,
+            enable_stats=True,
+        )
+        for _ in loader:
+            pass
+        return loader.stats.summary()
+
+    def check_summary(self, summary, worker_ids):
+        batch_num = SAMPLE_NUM // BATCH_SIZE
+        self.assertEqual(summary['consumer']['batches'], batch_num)
+        self.assertEqual(summary['reader']['batches'], batch_num)
+        self.assertEqual(set(summary['workers'].keys()), set(worker_ids))
+        self.assertEqual(
+            sum(w['batches'] for w in summary['workers'].values()), batch_num
+        )
+        for record in summary['workers'].values():
+            self.assertGreater(record['fetch_time'], 0)
+            self.assertGreater(record['collate_time'], 0)
+        for name in ['blocking_queue', 'outstanding', 'reorder']:
+            self.assertIn(name, summary['queues'])
+
+    def test_single_process(self):
+        summary = self.run_main(0)
+        self.check_summary(summary, [MAIN_PROCESS_WORKER_ID])
+
+    def test_multi_process(self):
+        # DataLoader with multi-process mode is not supported on MacOs and Windows currently
+        if sys.platform == 'darwin' or sys.platform == 'win32':
+            return
+        summary = self.run_main(2)
+        self.check_summary(summary, [0, 1])
+
+    def test_disabled(self):
+        loader = DataLoader(SlowDataset(), batch_size=BATCH_SIZE)
+        self.assertIsNone(loader.stats)
+
+    def test_reset(self):
+        loader = DataLoader(
+            SlowDataset(), batch_size=BATCH_SIZE, enable_stats=True
+        )
+        for _ in loader:
+            pass
+        self.assertIn('consumer', str(loader.stats))
+        loader.stats.reset()
+        self.assertEqual(loader.stats.summary()['consumer']['batches'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,10 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import tempfile
 import unittest
 
 import numpy as np
 
+from paddle.text import LengthBucketBatchSampler
 from paddle.text.datasets import Imdb
 
 
@@ -47,5 +49,48 @@ class TestImdbTest(unittest.TestCase):
         self.assertTrue(int(label) in [0, 1])
 
 
+class TestImdbCache(unittest.TestCase):
+    def test_main(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        imdb = Imdb(mode='test')
+        for _ in range(2):
+            # tokenized at first, and loaded from the cache at second
+            cached = Imdb(mode='test', cache_dir=temp_dir.name)
+            self.assertEqual(len(cached), len(imdb))
+            self.assertEqual(cached.word_idx, imdb.word_idx)
+            for idx in np.random.randint(0, len(imdb), [10]):
+                data, label = cached[idx]
+                expected_data, expected_label = imdb[idx]
+                np.testing.assert_array_equal(data, expected_data)
+                np.testing.assert_array_equal(label, expected_label)
+        np.testing.assert_array_equal(cached.lengths, imdb.lengths)
+        temp_dir.cleanup()
+
+
+class TestLengthBucketBatchSampler(unittest.TestCase):
+    def test_main(self):
+        lengths = np.random.randint(1, 100, [1000])
+        sampler = LengthBucketBatchSampler(
+            lengths, batch_size=16, pool_size=4, shuffle=True
+        )
+        batches = list(sampler)
+        self.assertEqual(len(batches), len(sampler))
+        self.assertEqual(
+            sorted(i for batch in batches for i in batch), list(range(1000))
+        )
+        # samples of a batch are neighbours after sorting a pool
+        spread = np.mean([np.ptp(lengths[batch]) for batch in batches])
+        self.assertLess(spread, 50)
+
+        state = sampler.state_dict()
+        sampler.load_state_dict(state)
+        self.assertEqual(list(sampler), batches)
+
+        sampler = LengthBucketBatchSampler(
+            lengths, batch_size=16, drop_last=True
+        )
+        self.assertEqual(len(list(sampler)), 1000 // 16)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -28,6 +28,9 @@ from paddle.vision.datasets import (
     FashionMNIST,
     Flowers,
     ImageFolder,
+    IterableShardedDatasetFolder,
+    ShardedDatasetFolder,
+    pack_dataset_folder,
 )
 
 
@@ -95,6 +98,58 @@ class TestFolderDatasets(unittest.TestCase):
             _check_exists_and_download('temp_paddle', None, None, None, False)
 
 
+class TestShardedFolderDatasets(unittest.TestCase):
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.packed_dir = tempfile.mkdtemp()
+        for i in range(2):
+            sub_dir = os.path.join(self.data_dir, 'class_' + str(i))
+            os.makedirs(sub_dir)
+            for j in range(3):
+                fake_img = (np.random.random((32, 32, 3)) * 255).astype('uint8')
+                cv2.imwrite(os.path.join(sub_dir, str(j) + '.png'), fake_img)
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+        shutil.rmtree(self.packed_dir)
+
+    def test_dataset(self):
+        # small shards to store samples in multiple shards
+        num_samples = pack_dataset_folder(
+            self.data_dir, self.packed_dir, shard_size=4096
+        )
+        self.assertEqual(num_samples, 6)
+        self.assertGreater(len(os.listdir(self.packed_dir)), 3)
+
+        expected = DatasetFolder(self.data_dir)
+        dataset = ShardedDatasetFolder(self.packed_dir)
+        self.assertEqual(len(dataset), len(expected))
+        self.assertEqual(dataset.classes, expected.classes)
+        self.assertEqual(dataset.targets, expected.targets)
+        for i in range(len(dataset)):
+            img, label = dataset[i]
+            expected_img, expected_label = expected[i]
+            self.assertEqual(label, expected_label)
+            np.testing.assert_array_equal(np.array(img), np.array(expected_img))
+
+        iterable = IterableShardedDatasetFolder(
+            self.packed_dir, loader=bytes, transform=len
+        )
+        self.assertEqual(
+            list(iterable),
+            [
+                (len(dataset.read(i)[0]), label)
+                for i, label in enumerate(dataset.targets)
+            ],
+        )
+        iterable.shuffle = True
+        self.assertEqual(len(list(iterable)), num_samples)
+
+    def test_errors(self):
+        with self.assertRaises(RuntimeError):
+            ShardedDatasetFolder(self.packed_dir)
+
+
 class TestMNISTTest(unittest.TestCase):
     def test_main(self):
         transform = T.Transpose()
@@ -0,0 +1,98 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.distributed import load_state_dict, save_state_dict
+from paddle.distributed.checkpoint.load_state_dict import (
+    compute_overlap,
+    compute_overlaps,
+    not_overlap,
+)
+from paddle.distributed.checkpoint.metadata import LocalTensorMetadata
+from paddle.distributed.checkpoint.save_state_dict import (
+    split_state_dict_by_size,
+)
+
+
+class TestCheckpointIOThreads(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def get_state_dict(self):
+        return {
+            f"w{i}": paddle.randn([i + 1, 8]).astype('float32')
+            for i in range(6)
+        }
+
+    def test_split_by_size(self):
+        state_dict = self.get_state_dict()
+        key_to_part = split_state_dict_by_size(state_dict, 3)
+        part_sizes = [0] * 3
+        for key, part in key_to_part.items():
+            part_sizes[part] += state_dict[key].shape[0]
+        self.assertEqual(part_sizes, [7, 7, 7])
+
+    def test_save_load(self):
+        path = self.temp_dir.name
+        state_dict = self.get_state_dict()
+        save_state_dict(state_dict, path, num_io_threads=3)
+        data_files = sorted(f for f in os.listdir(path) if f.endswith("distcp"))
+        self.assertEqual(
+            data_files, ["0_0_0.distcp", "0_0_1.distcp", "0_0_2.distcp"]
+        )
+
+        for offload in [False, True]:
+            loaded = {k: paddle.zeros_like(v) for k, v in state_dict.items()}
+            load_state_dict(loaded, path, offload=offload, num_io_threads=3)
+            for key, value in state_dict.items():
+                np.testing.assert_array_equal(
+                    loaded[key].numpy(), value.numpy()
+                )
+
+        # parts of the last saving are not overwritten
+        save_state_dict(state_dict, path, num_io_threads=2)
+        self.assertTrue(os.path.exists(os.path.join(path, "0_1_0.distcp")))
+
+    def test_compute_overlaps(self):
+        cur = LocalTensorMetadata((2, 0), (4, 8), 'float32')
+        storages = [
+            LocalTensorMetadata((0, 0), (3, 8), 'float32'),
+            LocalTensorMetadata((3, 0), (3, 4), 'float32'),
+            LocalTensorMetadata((6, 0), (3, 8), 'float32'),
+            LocalTensorMetadata((3, 4), (3, 4), 'float32'),
+        ]
+        expect = [
+            (idx, *compute_overlap(cur, storage))
+            for idx, storage in enumerate(storages)
+            if not not_overlap(cur, storage)
+        ]
+        self.assertEqual(len(expect), 3)
+        self.assertEqual(compute_overlaps(cur, storages), expect)
+
+        scalar = LocalTensorMetadata((), (), 'float32')
+        self.assertEqual(compute_overlaps(scalar, [scalar]), [(0, [], [], [])])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -296,5 +296,106 @@ class TestAuc(unittest.TestCase):
         self.assertEqual(m.accumulate(), 0.0)
 
 
+class TestMetricTensorStates(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        np.random.seed(2024)
+        self.n = 1000
+        prob = np.random.random([self.n, 1])
+        self.preds = np.concatenate([1 - prob, prob], axis=1)
+        self.labels = np.random.randint(2, size=[self.n, 1]).astype('int64')
+
+    def run_metric(self, metric, use_tensor, preds, labels):
+        for i in range(0, self.n, 100):
+            pred, label = preds[i : i + 100], labels[i : i + 100]
+            if use_tensor:
+                pred, label = paddle.to_tensor(pred), paddle.to_tensor(label)
+            metric.update(pred, label)
+        return metric
+
+    def test_precision_recall(self):
+        for metric_cls in [paddle.metric.Precision, paddle.metric.Recall]:
+            preds = self.preds[:, 1]
+            expect = self.run_metric(metric_cls(), False, preds, self.labels)
+            m = self.run_metric(metric_cls(), True, preds, self.labels)
+            # states are kept as tensors before accumulate
+            self.assertIsInstance(m._tp, paddle.Tensor)
+            self.assertEqual(m.tp, expect.tp)
+            self.assertAlmostEqual(m.accumulate(), expect.accumulate())
+
+            m.reset()
+            self.assertEqual(m.tp, 0)
+            self.assertEqual(m.accumulate(), 0.0)
+
+    def test_auc(self):
+        expect = self.run_metric(
+            paddle.metric.Auc(), False, self.preds, self.labels
+        )
+        m = self.run_metric(paddle.metric.Auc(), True, self.preds, self.labels)
+        self.assertIsInstance(m._stat_pos, paddle.Tensor)
+        np.testing.assert_array_equal(
+            m._stat_pos.numpy(), np.asarray(expect._stat_pos)
+        )
+        self.assertAlmostEqual(m.accumulate(), expect.accumulate())
+
+    def test_accuracy(self):
+        correct = paddle.to_tensor(
+            np.random.randint(2, size=[100, 1]).astype('float32')
+        )
+        expect = paddle.metric.Accuracy()
+        acc = expect.update(correct)
+        # update returns python floats for Tensor inputs
+        self.assertIsInstance(acc, float)
+
+        m = paddle.metric.Accuracy()
+        acc_tensor = m._update_on_device(correct)
+        self.assertIsInstance(acc_tensor, paddle.Tensor)
+        self.assertIsInstance(m.total[0], paddle.Tensor)
+        self.assertAlmostEqual(float(acc_tensor), acc, places=6)
+        self.assertAlmostEqual(m.accumulate(), expect.accumulate(), places=6)
+
+
+class TestMetricSync(unittest.TestCase):
+    def test_add_state(self):
+        for metric in [
+            paddle.metric.Accuracy(),
+            paddle.metric.Precision(),
+            paddle.metric.Recall(),
+            paddle.metric.Auc(),
+        ]:
+            self.assertTrue(metric._reducible_states)
+            for name, reduce_type in metric._reducible_states.items():
+                self.assertTrue(hasattr(metric, name))
+                self.assertEqual(reduce_type, 'sum')
+
+        m = paddle.metric.Precision()
+        with self.assertRaises(ValueError):
+            m.add_state('_tp', 'mean')
+
+    def test_sync_single_process(self):
+        m = paddle.metric.Precision()
+        m.update(np.array([0.1, 0.6, 0.7]), np.array([1, 0, 1]))
+        # states are not changed in single process
+        m.sync()
+        self.assertAlmostEqual(m.accumulate(), 0.5)
+
+    def test_sync_without_state(self):
+        class MyMetric(paddle.metric.Metric):
+            def reset(self):
+                pass
+
+            def update(self, *args):
+                pass
+
+            def accumulate(self):
+                return 0.0
+
+            def name(self):
+                return 'my_metric'
+
+        with self.assertRaises(RuntimeError):
+            MyMetric().sync()
+
+
 if __name__ == '__main__':
     unittest.main()
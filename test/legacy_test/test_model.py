@@ -498,6 +498,30 @@ class MyDataset(Dataset):
         return 40
 
 
+class CustomMetric(paddle.metric.Metric):
+    # a metric updated with numpy inputs
+    def __init__(self):
+        self.reset()
+
+    def compute(self, pred, label):
+        return paddle.argmax(pred, axis=-1, keepdim=True), label
+
+    def update(self, pred, label):
+        assert isinstance(pred, np.ndarray)
+        self.correct += int((pred == label).sum())
+        self.total += pred.shape[0]
+
+    def reset(self):
+        self.correct = 0
+        self.total = 0
+
+    def accumulate(self):
+        return self.correct / max(self.total, 1)
+
+    def name(self):
+        return 'custom_acc'
+
+
 class TestModelFunction(unittest.TestCase):
     def set_seed(self, seed=1024):
         paddle.seed(seed)
@@ -580,6 +604,97 @@ class TestModelFunction(unittest.TestCase):
             np.testing.assert_allclose(out, ref, rtol=1e-6)
             base.disable_dygraph() if dynamic else None
 
+    def test_fit_deferred_logs(self):
+        class LogsRecorder(paddle.callbacks.Callback):
+            def __init__(self):
+                self.logs = []
+
+            def on_train_batch_end(self, step, logs=None):
+                if step % 2 == 0:
+                    self.logs.append(
+                        {k: logs[k] for k in ['loss', 'acc', 'custom_acc']}
+                    )
+
+            def on_epoch_end(self, epoch, logs=None):
+                self.logs.append(dict(logs.items()))
+
+        def run(deferred_logs):
+            base.enable_dygraph(paddle.set_device('cpu'))
+            self.set_seed()
+            np.random.seed(1024)
+            net = MyModel()
+            optim = paddle.optimizer.SGD(
+                learning_rate=0.001, parameters=net.parameters()
+            )
+            model = Model(net)
+            model.prepare(
+                optim,
+                loss=CrossEntropyLoss(),
+                metrics=[Accuracy(), CustomMetric()],
+            )
+            recorder = LogsRecorder()
+            model.fit(
+                MyDataset(),
+                batch_size=4,
+                epochs=2,
+                shuffle=False,
+                verbose=0,
+                callbacks=recorder,
+                deferred_logs=deferred_logs,
+            )
+            base.disable_dygraph()
+            return recorder.logs
+
+        expect = run(False)
+        logs = run(True)
+        self.assertEqual(len(logs), len(expect))
+        for log, expect_log in zip(logs, expect):
+            self.assertEqual(log.keys(), expect_log.keys())
+            for key in ['loss', 'acc', 'custom_acc']:
+                np.testing.assert_allclose(log[key], expect_log[key], rtol=1e-6)
+
+    def test_fit_prefetch_to_device(self):
+        class LossRecorder(paddle.callbacks.Callback):
+            def __init__(self):
+                self.losses = []
+
+            def on_train_batch_end(self, step, logs=None):
+                self.losses.append(logs['loss'])
+
+        def run(prefetch_to_device):
+            device = 'gpu' if paddle.is_compiled_with_cuda() else 'cpu'
+            base.enable_dygraph(paddle.set_device(device))
+            self.set_seed()
+            net = MyModel()
+            optim = paddle.optimizer.SGD(
+                learning_rate=0.001, parameters=net.parameters()
+            )
+            model = Model(net)
+            model.prepare(optim, loss=CrossEntropyLoss())
+            # batches on host are copied to device by the prefetcher
+            loader = paddle.io.DataLoader(
+                MyDataset(),
+                batch_size=4,
+                places=paddle.CPUPlace(),
+                return_list=True,
+            )
+            recorder = LossRecorder()
+            model.fit(
+                loader,
+                epochs=2,
+                verbose=0,
+                callbacks=recorder,
+                accumulate_grad_batches=2,
+                prefetch_to_device=prefetch_to_device,
+            )
+            base.disable_dygraph()
+            return recorder.losses
+
+        expect = run(False)
+        losses = run(True)
+        self.assertEqual(len(losses), len(expect))
+        np.testing.assert_allclose(losses, expect, rtol=1e-6)
+
     def test_save_load(self):
         path = os.path.join(tempfile.mkdtemp(), '.cache_test_save_load')
         if not os.path.exists(path):
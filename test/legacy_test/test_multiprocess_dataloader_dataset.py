@@ -121,6 +121,55 @@ class TestComposeDataset(unittest.TestCase):
             np.testing.assert_allclose(label2, label2_t)
 
 
+class RandomGetItemsDataset(RandomDataset):
+    def __init__(self, sample_num):
+        super().__init__(sample_num)
+        self.getitems_calls = 0
+
+    def __getitems__(self, indices):
+        self.getitems_calls += 1
+        return [self[idx] for idx in indices]
+
+
+class TestGetItemsDataset(unittest.TestCase):
+    def test_tensor_dataset(self):
+        with base.dygraph.guard(paddle.CPUPlace()):
+            input_np = np.random.random([16, 3, 4]).astype('float32')
+            label_np = np.random.randint(0, 9, [16]).astype('int64')
+            dataset = TensorDataset(
+                [paddle.to_tensor(input_np), paddle.to_tensor(label_np)]
+            )
+            indices = [3, 0, 7, 7]
+            samples = dataset.__getitems__(indices)
+            self.assertEqual(len(samples), len(indices))
+            for idx, (input, label) in zip(indices, samples):
+                np.testing.assert_allclose(input.numpy(), input_np[idx])
+                np.testing.assert_equal(label.numpy(), label_np[idx])
+
+    def test_compose_dataset(self):
+        dataset1 = RandomGetItemsDataset(10)
+        dataset2 = RandomDataset(10)
+        dataset = ComposeDataset([dataset1, dataset2])
+        indices = [9, 2, 5]
+        samples = dataset.__getitems__(indices)
+        self.assertEqual(dataset1.getitems_calls, 1)
+        for idx, sample in zip(indices, samples):
+            for field, expect in zip(sample, dataset[idx]):
+                np.testing.assert_allclose(field, expect)
+
+    def test_dataloader(self):
+        with base.dygraph.guard(paddle.CPUPlace()):
+            dataset = RandomGetItemsDataset(16)
+            dataloader = DataLoader(dataset, batch_size=4, drop_last=True)
+            for i, (image, label) in enumerate(dataloader()):
+                self.assertEqual(image.shape, [4, IMAGE_SIZE])
+                for j in range(4):
+                    np.testing.assert_allclose(
+                        image.numpy()[j], dataset[i * 4 + j][0]
+                    )
+            self.assertEqual(dataset.getitems_calls, 4)
+
+
 class TestRandomSplitApi(unittest.TestCase):
     def test_main(self):
         paddle.seed(1)
@@ -0,0 +1,89 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.io import DataLoader, Dataset, IterableDataset
+
+SAMPLE_NUM = 40
+BATCH_SIZE = 4
+
+
+class PidDataset(Dataset):
+    def __getitem__(self, idx):
+        return np.array([idx]).astype('int64'), np.array([os.getpid()])
+
+    def __len__(self):
+        return SAMPLE_NUM
+
+
+class PidIterableDataset(IterableDataset):
+    def __iter__(self):
+        for idx in range(SAMPLE_NUM + 2):
+            yield np.array([idx]).astype('int64'), np.array([os.getpid()])
+
+
+class TestPersistentWorkers(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+
+    def run_epoch(self, loader, max_batch=None):
+        indices, pids = [], set()
+        for i, (idx, pid) in enumerate(loader):
+            indices.extend(idx.numpy().flatten().tolist())
+            pids.update(pid.numpy().flatten().tolist())
+            if max_batch is not None and i + 1 >= max_batch:
+                break
+        return indices, pids
+
+    def test_map_dataset(self):
+        loader = DataLoader(
+            PidDataset(),
+            batch_size=BATCH_SIZE,
+            num_workers=2,
+            persistent_workers=True,
+        )
+        indices, pids = self.run_epoch(loader)
+        self.assertEqual(indices, list(range(SAMPLE_NUM)))
+        iterator = loader._iterator
+
+        # break in the middle of an epoch, next epoch should not hang
+        self.run_epoch(loader, max_batch=2)
+        for _ in range(2):
+            indices, epoch_pids = self.run_epoch(loader)
+            self.assertEqual(indices, list(range(SAMPLE_NUM)))
+            # workers are not re-spawned
+            self.assertTrue(epoch_pids.issubset(pids))
+            self.assertIs(loader._iterator, iterator)
+
+    def test_iterable_dataset_drop_last(self):
+        loader = DataLoader(
+            PidIterableDataset(),
+            batch_size=BATCH_SIZE,
+            num_workers=1,
+            drop_last=True,
+            persistent_workers=True,
+        )
+        for _ in range(3):
+            indices, _ = self.run_epoch(loader)
+            # drop_last is kept after workers resumed
+            self.assertEqual(indices, list(range(SAMPLE_NUM)))
+
+
+if __name__ == '__main__':
+    unittest.main()
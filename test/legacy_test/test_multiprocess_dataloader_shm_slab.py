@@ -0,0 +1,112 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import queue
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.io import DataLoader, Dataset
+from paddle.io.dataloader.shm_slab import _SharedMemorySlabPool
+
+IMAGE_SHAPE = [3, 8, 8]
+SAMPLE_NUM = 64
+BATCH_SIZE = 8
+
+
+class RandomDataset(Dataset):
+    def __init__(self, sample_num):
+        self.sample_num = sample_num
+
+    def __getitem__(self, idx):
+        np.random.seed(idx)
+        image = np.random.random(IMAGE_SHAPE).astype('float32')
+        label = np.array([idx]).astype('int64')
+        return image, label
+
+    def __len__(self):
+        return self.sample_num
+
+
+class TestSharedMemorySlabPool(unittest.TestCase):
+    def test_write_read_recycle(self):
+        pool = _SharedMemorySlabPool(2, 1024, queue.Queue())
+        arrays = [
+            np.arange(12, dtype='float32').reshape([3, 4]),
+            np.array([1, 2, 3], dtype='int64'),
+        ]
+        slab_batch = pool.write(arrays)
+        self.assertIsNotNone(slab_batch)
+
+        outs = pool.read(slab_batch)
+        for arr, out in zip(arrays, outs):
+            np.testing.assert_array_equal(arr, out)
+            self.assertEqual(arr.dtype, out.dtype)
+
+        # one slab in use, the other one is still free
+        self.assertIsNotNone(pool.write(arrays))
+        self.assertIsNone(pool.write(arrays))
+
+        # slab is recycled after arrays released
+        del out, outs
+        self.assertIsNotNone(pool.write(arrays))
+        pool.close()
+
+    def test_fallback(self):
+        pool = _SharedMemorySlabPool(1, 64, queue.Queue())
+        # too large to fit in one slab
+        self.assertIsNone(pool.write([np.zeros([128], dtype='float32')]))
+        # non-ndarray field
+        self.assertIsNone(pool.write(["str"]))
+        paths = list(pool._paths)
+        pool.close()
+        for path in paths:
+            self.assertFalse(os.path.exists(path))
+
+
+class TestDataLoaderWithShmSlab(unittest.TestCase):
+    def run_main(self, num_workers, shm_slab_size, persistent_workers=False):
+        paddle.disable_static()
+        dataset = RandomDataset(SAMPLE_NUM)
+        loader = DataLoader(
+            dataset,
+            batch_size=BATCH_SIZE,
+            num_workers=num_workers,
+            shm_slab_size=shm_slab_size,
+            persistent_workers=persistent_workers,
+        )
+        images, labels = [], []
+        for _ in range(2):
+            for image, label in loader:
+                self.assertEqual(image.shape, [BATCH_SIZE, *IMAGE_SHAPE])
+                images.append(image.numpy())
+                labels.append(label.numpy())
+        return np.concatenate(images), np.concatenate(labels)
+
+    def test_main(self):
+        base_images, base_labels = self.run_main(0, 0)
+        for persistent_workers in [False, True]:
+            # 1 MB slabs hold every batch, 256 bytes slabs fall back
+            for shm_slab_size in [1 << 20, 256]:
+                images, labels = self.run_main(
+                    2, shm_slab_size, persistent_workers
+                )
+                np.testing.assert_allclose(images, base_images)
+                np.testing.assert_array_equal(labels, base_labels)
+
+
+if __name__ == '__main__':
+    unittest.main()
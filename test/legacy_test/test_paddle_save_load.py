@@ -148,9 +148,9 @@ class TestSaveLoadPickle(unittest.TestCase):
             paddle.save(save_dict, path, 1)
 
         with self.assertRaises(ValueError):
-            paddle.save(save_dict, path, 5)
+            paddle.save(save_dict, path, 6)
 
-        protocols = [2, 3, 4]
+        protocols = [2, 3, 4, 5]
         for protocol in protocols:
             paddle.save(save_dict, path, pickle_protocol=protocol)
             dict_load = paddle.load(path)
@@ -160,6 +160,52 @@ class TestSaveLoadPickle(unittest.TestCase):
                     dict_load[key].numpy(), value.numpy()
                 )
 
+    def test_save_without_copy(self):
+        paddle.disable_static()
+        from paddle.framework.io import (
+            _dense_tensor_to_ndarray,
+            _varbase_to_ndarray,
+        )
+
+        # CPU tensors are viewed as numpy arrays without copying
+        x = paddle.randn([4, 5]).cpu()
+        dense = x.value().get_tensor()
+        for arr in [_varbase_to_ndarray(x), _dense_tensor_to_ndarray(dense)]:
+            self.assertEqual(arr.__array_interface__['data'][0], dense._ptr())
+            np.testing.assert_array_equal(arr, x.numpy())
+
+        path = os.path.join(self.temp_dir.name, "obj.pdtensor")
+        obj = {'x': x, 'list': [x, dense], 'epoch': 1}
+        for protocol in [4, 5]:
+            paddle.save(obj, path, protocol)
+            obj_load = paddle.load(path)
+            np.testing.assert_array_equal(obj_load['x'].numpy(), x.numpy())
+            for t in obj_load['list']:
+                np.testing.assert_array_equal(np.array(t), x.numpy())
+            self.assertEqual(obj_load['epoch'], 1)
+
+    def test_static_pickle_protocol(self):
+        paddle.enable_static()
+        with new_program_scope():
+            x = paddle.static.data(
+                name="static_x", shape=[None, IMAGE_SIZE], dtype='float32'
+            )
+            paddle.static.nn.fc(x, 10)
+            exe = paddle.static.Executor(paddle.CPUPlace())
+            exe.run(paddle.static.default_startup_program())
+            prog = paddle.static.default_main_program()
+            state_dict = prog.state_dict('param')
+
+            path = os.path.join(self.temp_dir.name, "static.pdparams")
+            for protocol in [2, 3, 4, 5]:
+                paddle.save(state_dict, path, protocol)
+                dict_load = paddle.load(path)
+                for key, value in state_dict.items():
+                    np.testing.assert_array_equal(
+                        np.array(dict_load[key]), np.array(value)
+                    )
+        paddle.disable_static()
+
 
 class TestSaveLoadAny(unittest.TestCase):
     def setUp(self):
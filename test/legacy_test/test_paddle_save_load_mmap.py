@@ -0,0 +1,100 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+from io import BytesIO
+
+import numpy as np
+
+import paddle
+from paddle.framework.mmap_io import MmapStateDict
+
+
+class TestSaveLoadMmapFormat(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'model.pdparams')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_state_dict(self):
+        layer = paddle.nn.Linear(5, 10)
+        state_dict = layer.state_dict()
+        paddle.save(state_dict, self.path, use_mmap_format=True)
+
+        for mmap in [False, True]:
+            loaded = paddle.load(self.path, mmap=mmap)
+            self.assertEqual(isinstance(loaded, MmapStateDict), mmap)
+            self.assertEqual(list(loaded.keys()), list(state_dict.keys()))
+            for key, value in state_dict.items():
+                np.testing.assert_array_equal(
+                    loaded[key].numpy(), value.numpy()
+                )
+                self.assertEqual(loaded[key].name, value.name)
+
+        new_layer = paddle.nn.Linear(5, 10)
+        new_layer.set_state_dict(paddle.load(self.path, mmap=True))
+        np.testing.assert_array_equal(
+            new_layer.weight.numpy(), layer.weight.numpy()
+        )
+
+    def test_nested_object(self):
+        x = paddle.randn([3, 4])
+        obj = {
+            'model': {'w': x, 'b': np.arange(6, dtype='int64')},
+            'list': [x, 1, 'str'],
+            'epoch': 10,
+        }
+        paddle.save(obj, self.path, use_mmap_format=True)
+
+        loaded = paddle.load(self.path, mmap=True, return_numpy=True)
+        self.assertEqual(loaded['epoch'], 10)
+        self.assertEqual(loaded['list'][1:], [1, 'str'])
+        np.testing.assert_array_equal(loaded['model']['w'], x.numpy())
+        np.testing.assert_array_equal(loaded['list'][0], x.numpy())
+        np.testing.assert_array_equal(loaded['model']['b'], np.arange(6))
+        # numpy arrays are read-only views on the mapped file
+        self.assertFalse(loaded['model']['w'].flags.writeable)
+        self.assertIsInstance(loaded.to_dict()['model'], dict)
+
+    def test_memory_buffer(self):
+        x = paddle.randn([2, 3])
+        buffer = BytesIO()
+        paddle.save({'x': x}, buffer, use_mmap_format=True)
+        buffer.seek(0)
+        loaded = paddle.load(buffer)
+        np.testing.assert_array_equal(loaded['x'].numpy(), x.numpy())
+
+        buffer.seek(0)
+        with self.assertRaises(ValueError):
+            paddle.load(buffer, mmap=True)
+
+    def test_mmap_pickle_format(self):
+        paddle.save({'x': paddle.randn([2, 3])}, self.path)
+        with self.assertRaises(ValueError):
+            paddle.load(self.path, mmap=True)
+
+    def test_unsupported(self):
+        with self.assertRaises(ValueError):
+            paddle.save(paddle.nn.Linear(2, 3), self.path, use_mmap_format=True)
+        with self.assertRaises(TypeError):
+            paddle.save({}, self.path, use_mmap_format=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1256,5 +1256,146 @@ class TestFunctional(unittest.TestCase):
         self.assertTrue(test_adjust_hue(batch_tensor))
 
 
+class TestApplyBatch(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        paddle.seed(2024)
+        self.images = paddle.rand([4, 3, 32, 40])
+
+    def assert_per_image(self, transform):
+        batch_result = transform.apply_batch(self.images)
+        target_result = paddle.stack(
+            [transform(img) for img in self.images.unbind(0)]
+        )
+        np.testing.assert_allclose(
+            batch_result.numpy(), target_result.numpy(), rtol=1e-5, atol=1e-5
+        )
+
+    def test_deterministic(self):
+        self.assert_per_image(transforms.Resize((16, 20)))
+        self.assert_per_image(transforms.CenterCrop(24))
+        self.assert_per_image(transforms.RandomHorizontalFlip(1.0))
+        self.assert_per_image(transforms.RandomVerticalFlip(1.0))
+        self.assert_per_image(
+            transforms.Normalize(mean=[0.5, 0.5, 0.5], std=[0.2, 0.3, 0.4])
+        )
+        self.assert_per_image(transforms.BrightnessTransform((1.3, 1.3)))
+        self.assert_per_image(transforms.ContrastTransform((0.7, 0.7)))
+        self.assert_per_image(transforms.SaturationTransform((1.2, 1.2)))
+        self.assert_per_image(transforms.HueTransform((0.1, 0.1)))
+        self.assert_per_image(
+            transforms.RandomAffine((30, 30), translate=(0, 0), scale=(1, 1))
+        )
+
+    def test_random(self):
+        transform = transforms.Compose(
+            [
+                transforms.RandomResizedCrop(16),
+                transforms.RandomHorizontalFlip(),
+                transforms.ColorJitter(0.4, 0.4, 0.4, 0.1),
+                transforms.RandomAffine(15, translate=(0.1, 0.1)),
+                transforms.Transpose((0, 1, 2)),
+                transforms.Normalize(mean=[0.5, 0.5, 0.5], std=[0.5, 0.5, 0.5]),
+            ]
+        )
+        result = transform.apply_batch(self.images)
+        self.assertEqual(result.shape, [4, 3, 16, 16])
+
+        images = (self.images * 255).astype('uint8')
+        result = transforms.RandomResizedCrop(16).apply_batch(images)
+        self.assertEqual(result.shape, [4, 3, 16, 16])
+        self.assertEqual(result.dtype, paddle.uint8)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            transforms.Resize(16).apply_batch(self.images[0])
+
+
+class TestComposeFuse(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        np.random.seed(2024)
+        self.img = (np.random.rand(60, 80, 3) * 255).astype('uint8')
+
+    def assert_fused(self, transform, img, atol):
+        fused = transform.fuse()
+        self.assertEqual(len(fused.transforms), 1)
+        expected = transform(img)
+        result = fused(img)
+        if isinstance(expected, paddle.Tensor):
+            expected, result = expected.numpy(), result.numpy()
+        np.testing.assert_allclose(
+            np.asarray(result, 'float32'),
+            np.asarray(expected, 'float32'),
+            atol=atol,
+        )
+
+    def test_resize_center_crop(self):
+        transform = transforms.Compose(
+            [transforms.Resize(48), transforms.CenterCrop((40, 44))]
+        )
+        self.assert_fused(transform, self.img, atol=1)
+        self.assert_fused(transform, Image.fromarray(self.img), atol=1)
+        tensor_img = paddle.to_tensor(self.img.transpose((2, 0, 1))) / 255.0
+        self.assert_fused(transform, tensor_img, atol=1e-5)
+        self.assert_fused(
+            transforms.Compose(
+                [transforms.Resize(48, 'nearest'), transforms.CenterCrop(40)]
+            ),
+            self.img,
+            atol=0,
+        )
+
+    def test_to_tensor_normalize(self):
+        for data_format in ['CHW', 'HWC']:
+            transform = transforms.Compose(
+                [
+                    transforms.ToTensor(data_format),
+                    transforms.Normalize(
+                        mean=[0.485, 0.456, 0.406],
+                        std=[0.229, 0.224, 0.225],
+                        data_format=data_format,
+                    ),
+                ]
+            )
+            self.assert_fused(transform, self.img, atol=1e-5)
+            self.assert_fused(transform, Image.fromarray(self.img), atol=1e-5)
+            self.assert_fused(
+                transform, self.img.astype('float32') / 255.0, atol=1e-5
+            )
+
+    def test_random_affine(self):
+        tensor_img = paddle.to_tensor(self.img.transpose((2, 0, 1))) / 255.0
+        transform = transforms.Compose(
+            [
+                transforms.RandomAffine((30, 30), interpolation='bilinear'),
+                transforms.RandomAffine((60, 60), interpolation='bilinear'),
+            ]
+        )
+        fused = transform.fuse()
+        self.assertEqual(len(fused.transforms), 1)
+        # rotations around the same center compose to one rotation
+        expected = transforms.RandomAffine((90, 90), interpolation='bilinear')
+        np.testing.assert_allclose(
+            fused(tensor_img).numpy(),
+            expected(tensor_img).numpy(),
+            atol=1e-4,
+        )
+        self.assertEqual(fused(self.img).shape, self.img.shape)
+
+    def test_not_fused(self):
+        transform = transforms.Compose(
+            [
+                transforms.Resize(48),
+                transforms.RandomAffine(10),
+                transforms.RandomAffine(10, interpolation='bilinear'),
+                transforms.CenterCrop(40),
+                transforms.ToTensor(),
+                transforms.Normalize(data_format='HWC'),
+            ]
+        )
+        self.assertEqual(len(transform.fuse().transforms), 6)
+
+
 if __name__ == '__main__':
     unittest.main()
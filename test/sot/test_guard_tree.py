@@ -0,0 +1,67 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import unittest
+
+from test_case_base import (
+    TestCaseBase,
+    test_instruction_translator_cache_context,
+)
+
+import paddle
+from paddle.jit.sot.opcode_translator.executor.guard_tree import GuardTree
+from paddle.jit.sot.utils import allow_dynamic_shape_guard, guard_tree_guard
+
+
+def add_one(x, y):
+    return x + y + 1
+
+
+class TestGuardTree(unittest.TestCase):
+    def test_opaque_guards(self):
+        guards = [
+            lambda frame: frame["x"] == 1,
+            lambda frame: frame["x"] == 2,
+            lambda frame: frame["x"].missing,
+        ]
+        tree = GuardTree(guards)
+        self.assertEqual(tree.lookup({"x": 1}), 0)
+        self.assertEqual(tree.lookup({"x": 2}), 1)
+        # errors in guards are treated as mismatch
+        self.assertEqual(tree.lookup({"x": 3}), -1)
+
+
+class TestGuardTreeLookup(TestCaseBase):
+    def test_shape_buckets(self):
+        shapes = [[1, 2], [2, 2], [3, 2], [4, 2]]
+        with guard_tree_guard(True), allow_dynamic_shape_guard(
+            False
+        ), test_instruction_translator_cache_context() as ctx:
+            for shape in shapes:
+                self.assert_results(add_one, paddle.rand(shape), 1)
+            translate_count = ctx.translate_count
+            self.assertEqual(translate_count, len(shapes))
+            # all cached entries are found by the guard tree
+            for shape in reversed(shapes):
+                self.assert_results(add_one, paddle.rand(shape), 1)
+            self.assertEqual(ctx.translate_count, translate_count)
+            # a different python value misses all guards
+            self.assert_results(add_one, paddle.rand(shapes[0]), 2)
+            self.assertEqual(ctx.translate_count, translate_count + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()